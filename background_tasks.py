@@ -34,7 +34,7 @@ class BackgroundTaskManager:
         for task_name, task in self.tasks.items():
             if task.is_running():
                 task.cancel()
-                logger.info(f"Stopped task: {task_name}")
+                logger.info("Stopped task: %s", task_name)
         
         logger.info("All background tasks stopped")
     
@@ -44,13 +44,16 @@ class BackgroundTaskManager:
         try:
             # Keep only errors from the last 24 hours
             cutoff_time = datetime.now() - timedelta(hours=24)
-            self.bot.error_log = [
+            # Filter in place so the bounded deque (and its maxlen) is preserved
+            recent_errors = [
                 error for error in self.bot.error_log
                 if datetime.strptime(error['time'], '%Y-%m-%d %H:%M:%S') > cutoff_time
             ]
-            logger.info(f"Cleaned up error log. {len(self.bot.error_log)} errors remaining.")
+            self.bot.error_log.clear()
+            self.bot.error_log.extend(recent_errors)
+            logger.info("Cleaned up error log. %s errors remaining.", len(self.bot.error_log))
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
     
     @cleanup_old_errors.before_loop
     async def before_cleanup_old_errors(self):
@@ -69,7 +72,7 @@ class BackgroundTaskManager:
             # Check latency
             latency = self.bot.latency * 1000
             if latency > 1000:  # More than 1 second
-                logger.warning(f"High latency detected: {latency:.0f}ms")
+                logger.warning("High latency detected: %.0fms", latency)
             
             # Check memory usage
             try:
@@ -77,7 +80,7 @@ class BackgroundTaskManager:
                 process = psutil.Process()
                 memory_mb = process.memory_info().rss / 1024 / 1024
                 if memory_mb > 500:  # More than 500MB
-                    logger.warning(f"High memory usage: {memory_mb:.1f}MB")
+                    logger.warning("High memory usage: %.1fMB", memory_mb)
             except ImportError:
                 pass
             
@@ -91,12 +94,12 @@ class BackgroundTaskManager:
                     )
                     logger.debug("Search engine health check passed")
                 except Exception as e:
-                    logger.error(f"Search engine health check failed: {e}")
+                    logger.error("Search engine health check failed: %s", e)
             
             logger.debug("Health check completed successfully")
             
         except Exception as e:
-            logger.error(f"Error during health check: {e}")
+            logger.error("Error during health check: %s", e)
     
     @health_check.before_loop
     async def before_health_check(self):
@@ -122,7 +125,7 @@ class BackgroundTaskManager:
             logger.info("Search engine maintenance completed")
             
         except Exception as e:
-            logger.error(f"Error during search engine maintenance: {e}")
+            logger.error("Error during search engine maintenance: %s", e)
     
     @search_engine_maintenance.before_loop
     async def before_search_engine_maintenance(self):
@@ -132,7 +135,7 @@ class BackgroundTaskManager:
     async def run_heavy_computation(self, task_name, func, *args, **kwargs):
         """Run a heavy computation task in the background"""
         try:
-            logger.info(f"Starting heavy computation task: {task_name}")
+            logger.info("Starting heavy computation task: %s", task_name)
             
             # Create a task for the heavy computation
             task = asyncio.create_task(func(*args, **kwargs))
@@ -141,11 +144,11 @@ class BackgroundTaskManager:
             # Wait for the task to complete
             result = await task
             
-            logger.info(f"Completed heavy computation task: {task_name}")
+            logger.info("Completed heavy computation task: %s", task_name)
             return result
             
         except Exception as e:
-            logger.error(f"Error in heavy computation task {task_name}: {e}")
+            logger.error("Error in heavy computation task %s: %s", task_name, e)
             raise
         finally:
             # Clean up the task reference
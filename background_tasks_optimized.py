@@ -99,7 +99,7 @@ class BackgroundTaskManager:
             logger.info("All background tasks started successfully")
             
         except Exception as e:
-            logger.error(f"Error starting background tasks: {e}")
+            logger.error("Error starting background tasks: %s", e)
     
     def stop_all_tasks(self):
         """Stop all background tasks gracefully"""
@@ -119,12 +119,12 @@ class BackgroundTaskManager:
             for task in tasks_to_stop:
                 if task.is_running():
                     task.cancel()
-                    logger.info(f"Stopped task: {task.__name__}")
+                    logger.info("Stopped task: %s", task.__name__)
             
             logger.info("All background tasks stopped")
             
         except Exception as e:
-            logger.error(f"Error stopping background tasks: {e}")
+            logger.error("Error stopping background tasks: %s", e)
     
     def get_task_stats(self) -> Dict[str, Any]:
         """Get comprehensive task statistics"""
@@ -155,10 +155,13 @@ class BackgroundTaskManager:
             cutoff_time = datetime.now() - timedelta(hours=24)
             original_count = len(self.bot.error_log)
             
-            self.bot.error_log = [
+            # Filter in place so the bounded deque (and its maxlen) is preserved
+            recent_errors = [
                 error for error in self.bot.error_log
                 if datetime.strptime(error['time'], '%Y-%m-%d %H:%M:%S') > cutoff_time
             ]
+            self.bot.error_log.clear()
+            self.bot.error_log.extend(recent_errors)
             
             cleaned_count = original_count - len(self.bot.error_log)
             
@@ -185,13 +188,13 @@ class BackgroundTaskManager:
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time)
             
-            logger.info(f"Error cleanup completed: {cleaned_count} errors removed, "
-                       f"{len(expired_users)} user limiters, {len(expired_guilds)} guild limiters")
+            logger.info("Error cleanup completed: %s errors removed, %s user limiters, %s guild limiters",
+                        cleaned_count, len(expired_users), len(expired_guilds))
             
         except Exception as e:
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time, str(e))
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
         finally:
             task_manager.is_running = False
     
@@ -229,9 +232,9 @@ class BackgroundTaskManager:
                 
                 # Check for resource issues
                 if health_status['memory_usage_mb'] > 500:
-                    logger.warning(f"High memory usage: {health_status['memory_usage_mb']}MB")
+                    logger.warning("High memory usage: %sMB", health_status['memory_usage_mb'])
                 if health_status['cpu_usage_percent'] > 80:
-                    logger.warning(f"High CPU usage: {health_status['cpu_usage_percent']}%")
+                    logger.warning("High CPU usage: %s%%", health_status['cpu_usage_percent'])
                     
             except ImportError:
                 logger.warning("psutil not available for system monitoring")
@@ -245,14 +248,14 @@ class BackgroundTaskManager:
                     )
                     health_status['search_engine_healthy'] = True
                 except Exception as e:
-                    logger.error(f"Search engine health check failed: {e}")
+                    logger.error("Search engine health check failed: %s", e)
             
             # Check RAG processor health
             if self.bot.rag_processor:
                 health_status['rag_processor_healthy'] = True
             
             # Log health status
-            logger.info(f"Health check completed: {health_status}")
+            logger.info("Health check completed: %s", health_status)
             
             # Store performance metric
             self.performance_metrics.append({
@@ -267,7 +270,7 @@ class BackgroundTaskManager:
         except Exception as e:
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time, str(e))
-            logger.error(f"Error during health check: {e}")
+            logger.error("Error during health check: %s", e)
         finally:
             task_manager.is_running = False
     
@@ -310,18 +313,18 @@ class BackgroundTaskManager:
                 )
                 maintenance_tasks.append("Search functionality test passed")
             except Exception as e:
-                logger.error(f"Search functionality test failed: {e}")
+                logger.error("Search functionality test failed: %s", e)
                 maintenance_tasks.append(f"Search functionality test failed: {e}")
             
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time)
             
-            logger.info(f"Search engine maintenance completed: {len(maintenance_tasks)} tasks")
+            logger.info("Search engine maintenance completed: %s tasks", len(maintenance_tasks))
             
         except Exception as e:
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time, str(e))
-            logger.error(f"Error during search engine maintenance: {e}")
+            logger.error("Error during search engine maintenance: %s", e)
         finally:
             task_manager.is_running = False
     
@@ -371,7 +374,7 @@ class BackgroundTaskManager:
                 if 'system_resources' in current_metrics and 'system_resources' in prev_metrics:
                     mem_diff = current_metrics['system_resources']['memory_mb'] - prev_metrics['system_resources']['memory_mb']
                     if abs(mem_diff) > 50:  # More than 50MB change
-                        logger.info(f"Significant memory change: {mem_diff:+.1f}MB")
+                        logger.info("Significant memory change: %+.1fMB", mem_diff)
             
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time)
@@ -379,7 +382,7 @@ class BackgroundTaskManager:
         except Exception as e:
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time, str(e))
-            logger.error(f"Error during performance monitoring: {e}")
+            logger.error("Error during performance monitoring: %s", e)
         finally:
             task_manager.is_running = False
     
@@ -404,19 +407,15 @@ class BackgroundTaskManager:
             
             # Optimize cache if needed
             if cache_usage_percent > 80:
-                logger.info(f"Cache usage high ({cache_usage_percent:.1f}%), performing optimization")
+                logger.info("Cache usage high (%.1f%%), performing optimization", cache_usage_percent)
                 
                 # Remove some older entries to free up space
-                entries_to_remove = int(cache_size * 0.1)  # Remove 10% of entries
-                for _ in range(entries_to_remove):
-                    if self.bot.cache.access_order:
-                        oldest_key = self.bot.cache.access_order.popleft()
-                        self.bot.cache._remove_key(oldest_key)
+                entries_to_remove = self.bot.cache.evict_oldest(int(cache_size * 0.1))  # Remove 10% of entries
                 
-                logger.info(f"Cache optimization completed: removed {entries_to_remove} entries")
+                logger.info("Cache optimization completed: removed %s entries", entries_to_remove)
             
             # Log cache statistics
-            logger.debug(f"Cache optimization completed: {cache_size} entries, {cache_usage_percent:.1f}% usage")
+            logger.debug("Cache optimization completed: %s entries, %.1f%% usage", cache_size, cache_usage_percent)
             
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time)
@@ -424,7 +423,7 @@ class BackgroundTaskManager:
         except Exception as e:
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time, str(e))
-            logger.error(f"Error during cache optimization: {e}")
+            logger.error("Error during cache optimization: %s", e)
         finally:
             task_manager.is_running = False
     
@@ -454,7 +453,7 @@ class BackgroundTaskManager:
                 logger.info("Cleaned up old performance metrics")
             
             # Log memory cleanup results
-            logger.debug(f"Memory cleanup completed: {collected} objects collected")
+            logger.debug("Memory cleanup completed: %s objects collected", collected)
             
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time)
@@ -462,7 +461,7 @@ class BackgroundTaskManager:
         except Exception as e:
             execution_time = time.time() - start_time
             task_manager.record_execution(execution_time, str(e))
-            logger.error(f"Error during memory cleanup: {e}")
+            logger.error("Error during memory cleanup: %s", e)
         finally:
             task_manager.is_running = False
     
@@ -473,7 +472,7 @@ class BackgroundTaskManager:
     
     async def run_heavy_computation(self, task_name: str, func, *args, **kwargs):
         """Run a heavy computation task in the background with monitoring"""
-        logger.info(f"Starting heavy computation task: {task_name}")
+        logger.info("Starting heavy computation task: %s", task_name)
         
         start_time = time.time()
         try:
@@ -484,16 +483,16 @@ class BackgroundTaskManager:
             result = await asyncio.wait_for(task, timeout=300.0)  # 5 minute timeout
             
             execution_time = time.time() - start_time
-            logger.info(f"Completed heavy computation task: {task_name} in {execution_time:.2f}s")
+            logger.info("Completed heavy computation task: %s in %.2fs", task_name, execution_time)
             
             return result
             
         except asyncio.TimeoutError:
-            logger.error(f"Heavy computation task {task_name} timed out")
+            logger.error("Heavy computation task %s timed out", task_name)
             raise
         except Exception as e:
             execution_time = time.time() - start_time
-            logger.error(f"Error in heavy computation task {task_name} after {execution_time:.2f}s: {e}")
+            logger.error("Error in heavy computation task %s after %.2fs: %s", task_name, execution_time, e)
             raise
     
     def export_performance_data(self, filepath: str = "performance_data.json"):
@@ -509,7 +508,7 @@ class BackgroundTaskManager:
             with open(filepath, 'w') as f:
                 json.dump(data, f, indent=2, default=str)
             
-            logger.info(f"Performance data exported to {filepath}")
+            logger.info("Performance data exported to %s", filepath)
             
         except Exception as e:
-            logger.error(f"Error exporting performance data: {e}")
\ No newline at end of file
+            logger.error("Error exporting performance data: %s", e)
\ No newline at end of file
@@ -1,27 +1,16 @@
 import discord
 from discord.ext import commands
-import asyncio
 import logging
 from datetime import datetime
 import traceback
 
 from config import Config
+from messages import NOT_READY_MESSAGE
 
 logger = logging.getLogger(__name__)
 
-class ElderScrollsCommands(commands.Cog):
-    """Cog containing all Elder Scrolls Lore Bot commands"""
-    
-    def __init__(self, bot):
-        self.bot = bot
-        self.ask_cooldown = commands.CooldownMapping.from_cooldown(
-            rate=3, per=60.0, type=commands.BucketType.user
-        )
-    
-    @commands.command(name='start')
-    async def start_command(self, ctx):
-        """Handle !start command"""
-        welcome_message = """
+# Static command replies, built once at import (the backend is fixed by the environment)
+WELCOME_MESSAGE = """
 🌟 **Welcome to the Elder Scrolls Lore Bot!** 🌟
 
 I'm your guide to the vast world of Tamriel and beyond. Ask me anything about:
@@ -39,21 +28,9 @@ Use `!ask` followed by your question to get started.
 **Example:** `!ask Who is Tiber Septim?`
 
 Use `!help` for more information.
-        """
-        
-        embed = discord.Embed(
-            title="Welcome to Elder Scrolls Lore Bot!",
-            description=welcome_message,
-            color=discord.Color.blue()
-        )
-        embed.set_footer(text="May the Nine Divines guide your path!")
-        
-        await ctx.send(embed=embed)
-    
-    @commands.command(name='help')
-    async def help_command(self, ctx):
-        """Handle !help command"""
-        help_message = """
+"""
+
+HELP_MESSAGE = """
 📚 **Elder Scrolls Lore Bot Help** 📚
 
 **Commands:**
@@ -82,11 +59,35 @@ Use `!help` for more information.
 **Current LLM Backend:** `{backend}`
 
 Happy exploring, traveler! 🗡️⚔️
-        """.format(backend=Config.get_llm_backend().value)
+""".format(backend=Config.get_llm_backend().value)
+
+class ElderScrollsCommands(commands.Cog):
+    """Cog containing all Elder Scrolls Lore Bot commands"""
+    
+    def __init__(self, bot):
+        self.bot = bot
+        self.ask_cooldown = commands.CooldownMapping.from_cooldown(
+            rate=3, per=60.0, type=commands.BucketType.user
+        )
+    
+    @commands.command(name='start')
+    async def start_command(self, ctx):
+        """Handle !start command"""
+        embed = discord.Embed(
+            title="Welcome to Elder Scrolls Lore Bot!",
+            description=WELCOME_MESSAGE,
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text="May the Nine Divines guide your path!")
         
+        await ctx.send(embed=embed)
+    
+    @commands.command(name='help')
+    async def help_command(self, ctx):
+        """Handle !help command"""
         embed = discord.Embed(
             title="Elder Scrolls Lore Bot Help",
-            description=help_message,
+            description=HELP_MESSAGE,
             color=discord.Color.green()
         )
         embed.set_footer(text="Use !ask followed by your question to get started!")
@@ -104,40 +105,15 @@ Happy exploring, traveler! 🗡️⚔️
             return
         
         if not self.bot.initialized:
-            await ctx.send("⚠️ Bot is still initializing. Please wait a moment and try again.")
+            await ctx.send(NOT_READY_MESSAGE)
             return
         
         if not question:
             await ctx.send("❓ Please provide a question after `!ask`.\n\n**Example:** `!ask Who is Tiber Septim?`")
             return
         
-        # Show typing indicator
-        async with ctx.channel.typing():
-            try:
-                # Search for relevant passages using online search engine with timeout
-                context_passages = await asyncio.wait_for(
-                    self.bot.search_engine.search(question),
-                    timeout=Config.SEARCH_TIMEOUT
-                )
-                
-                if not context_passages:
-                    response = "🤔 I searched multiple online sources but couldn't find specific information about that in the Elder Scrolls lore. Could you try rephrasing your question or ask about something else?"
-                else:
-                    # Process question using RAG with timeout
-                    response = await asyncio.wait_for(
-                        self.bot.rag_processor.process_question(question, context_passages),
-                        timeout=Config.LLM_TIMEOUT
-                    )
-                
-                # Send response
-                await ctx.send(response)
-                
-            except asyncio.TimeoutError:
-                logger.error(f"Timeout processing question '{question}'")
-                await ctx.send("⏰ Sorry, the request took too long to process. Please try again with a simpler question or try later.")
-            except Exception as e:
-                logger.error(f"Error processing question '{question}': {e}")
-                await ctx.send("❌ Sorry, I encountered an error while processing your question. Please try again later.")
+        # Plain messages and !ask share the events cog's question pipeline
+        await self.bot.get_cog('ElderScrollsEvents').handle_question(ctx.message, question)
     
     @commands.command(name='debug')
     async def debug_command(self, ctx):
@@ -149,7 +125,7 @@ Happy exploring, traveler! 🗡️⚔️
             uptime = str(uptime_delta).split('.')[0]  # Remove microseconds
         
         # Get recent errors (last 10)
-        recent_errors = self.bot.error_log[-10:] if self.bot.error_log else []
+        recent_errors = list(self.bot.error_log)[-10:]
         error_summary = "\n".join([f"• {error['time']}: {error['error']}" for error in recent_errors])
         if not error_summary:
             error_summary = "No recent errors"
@@ -5,19 +5,81 @@ Enhanced with caching, rate limiting, error handling, and performance monitoring
 
 import discord
 from discord.ext import commands
-import asyncio
 import logging
 import time
-import hashlib
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 import traceback
 from functools import wraps
 
 from config import Config
+from messages import NOT_READY_MESSAGE
 
 logger = logging.getLogger(__name__)
 
+# Static command replies, built once at import (the backend is fixed by the environment)
+WELCOME_MESSAGE = """
+🌟 **Welcome to the Elder Scrolls Lore Bot!** 🌟
+
+I'm your guide to the vast world of Tamriel and beyond. Ask me anything about:
+
+• **Characters and NPCs** - Heroes, villains, and everyone in between
+• **Locations and cities** - From the frozen north to the scorching south
+• **Historical events** - Wars, treaties, and world-changing moments
+• **Magic and spells** - Schools of magic, artifacts, and enchantments
+• **Races and cultures** - The diverse peoples of Tamriel
+• **Artifacts and weapons** - Legendary items and their histories
+• **And much more!**
+
+**Quick Start:**
+• Use `!ask <question>` for detailed answers
+• Or just type your question directly
+• Use `!help` for more information
+
+**Example:** `!ask Who is Tiber Septim?`
+
+*May the Nine Divines guide your path!* 🗡️⚔️
+"""
+
+HELP_MESSAGE = """
+📚 **Elder Scrolls Lore Bot Help** 📚
+
+**Commands:**
+• `!start` - Welcome message and introduction
+• `!help` - Show this help message
+• `!ask <question>` - Ask a question about Elder Scrolls lore
+• `!debug` - Show bot status and performance information
+• `!stats` - Show your usage statistics
+
+**Examples:**
+• `!ask Who is the Dragonborn?`
+• `!ask What is the history of the Dark Elves?`
+• `!ask Tell me about the Thalmor`
+• `!ask What are the Nine Divines?`
+
+**Features:**
+• 🔍 **Multi-Source Search**: Elder Scrolls Wiki, Hugging Face datasets, Wikipedia
+• 🤖 **AI-Powered**: Advanced language models for accurate responses
+• ⚡ **Real-time**: Latest information from online sources
+• 🚀 **Optimized**: Fast responses with intelligent caching
+• 🛡️ **Secure**: Rate limiting and error handling
+
+**Rate Limits:**
+• **Per User**: 5 requests per minute
+• **Per Guild**: 20 requests per minute
+• **Cooldown**: 3 questions per minute per user
+
+**Tips:**
+• Be specific in your questions for better answers
+• I can answer questions about characters, locations, events, magic, and more
+• If I don't have information on a topic, I'll let you know politely
+• You can also just type your question without using `!ask`
+
+**Current Backend:** `{backend}`
+
+*Happy exploring, traveler!* 🗡️⚔️
+""".format(backend=Config.get_llm_backend().value)
+
 def command_timer(func):
     """Decorator to measure command execution time"""
     @wraps(func)
@@ -36,7 +98,7 @@ def command_timer(func):
             if self.bot.response_times:
                 self.bot.avg_response_time = sum(self.bot.response_times) / len(self.bot.response_times)
             
-            logger.info(f"Command {func.__name__} executed in {execution_time:.3f}s")
+            logger.info("Command %s executed in %.3fs", func.__name__, execution_time)
             return result
             
         except Exception as e:
@@ -44,7 +106,7 @@ def command_timer(func):
             self.bot.request_count += 1
             self.bot.failed_requests += 1
             
-            logger.error(f"Command {func.__name__} failed after {execution_time:.3f}s: {e}")
+            logger.error("Command %s failed after %.3fs: %s", func.__name__, execution_time, e)
             raise
     
     return wrapper
@@ -91,32 +153,9 @@ class ElderScrollsCommands(commands.Cog):
     @command_timer
     async def start_command(self, ctx):
         """Handle !start command with welcome message"""
-        welcome_message = """
-🌟 **Welcome to the Elder Scrolls Lore Bot!** 🌟
-
-I'm your guide to the vast world of Tamriel and beyond. Ask me anything about:
-
-• **Characters and NPCs** - Heroes, villains, and everyone in between
-• **Locations and cities** - From the frozen north to the scorching south
-• **Historical events** - Wars, treaties, and world-changing moments
-• **Magic and spells** - Schools of magic, artifacts, and enchantments
-• **Races and cultures** - The diverse peoples of Tamriel
-• **Artifacts and weapons** - Legendary items and their histories
-• **And much more!**
-
-**Quick Start:**
-• Use `!ask <question>` for detailed answers
-• Or just type your question directly
-• Use `!help` for more information
-
-**Example:** `!ask Who is Tiber Septim?`
-
-*May the Nine Divines guide your path!* 🗡️⚔️
-        """
-        
         embed = discord.Embed(
             title="Welcome to Elder Scrolls Lore Bot!",
-            description=welcome_message,
+            description=WELCOME_MESSAGE,
             color=discord.Color.blue(),
             timestamp=datetime.now()
         )
@@ -128,48 +167,9 @@ I'm your guide to the vast world of Tamriel and beyond. Ask me anything about:
     @command_timer
     async def help_command(self, ctx):
         """Handle !help command with comprehensive help information"""
-        help_message = f"""
-📚 **Elder Scrolls Lore Bot Help** 📚
-
-**Commands:**
-• `!start` - Welcome message and introduction
-• `!help` - Show this help message
-• `!ask <question>` - Ask a question about Elder Scrolls lore
-• `!debug` - Show bot status and performance information
-• `!stats` - Show your usage statistics
-
-**Examples:**
-• `!ask Who is the Dragonborn?`
-• `!ask What is the history of the Dark Elves?`
-• `!ask Tell me about the Thalmor`
-• `!ask What are the Nine Divines?`
-
-**Features:**
-• 🔍 **Multi-Source Search**: Elder Scrolls Wiki, Hugging Face datasets, Wikipedia
-• 🤖 **AI-Powered**: Advanced language models for accurate responses
-• ⚡ **Real-time**: Latest information from online sources
-• 🚀 **Optimized**: Fast responses with intelligent caching
-• 🛡️ **Secure**: Rate limiting and error handling
-
-**Rate Limits:**
-• **Per User**: 5 requests per minute
-• **Per Guild**: 20 requests per minute
-• **Cooldown**: 3 questions per minute per user
-
-**Tips:**
-• Be specific in your questions for better answers
-• I can answer questions about characters, locations, events, magic, and more
-• If I don't have information on a topic, I'll let you know politely
-• You can also just type your question without using `!ask`
-
-**Current Backend:** `{Config.get_llm_backend().value}`
-
-*Happy exploring, traveler!* 🗡️⚔️
-        """
-        
         embed = discord.Embed(
             title="Elder Scrolls Lore Bot Help",
-            description=help_message,
+            description=HELP_MESSAGE,
             color=discord.Color.green(),
             timestamp=datetime.now()
         )
@@ -190,56 +190,15 @@ I'm your guide to the vast world of Tamriel and beyond. Ask me anything about:
             return
         
         if not self.bot.initialized:
-            await ctx.send("⚠️ Bot is still initializing. Please wait a moment and try again.")
+            await ctx.send(NOT_READY_MESSAGE)
             return
         
         if not question:
             await ctx.send("❓ Please provide a question after `!ask`.\n\n**Example:** `!ask Who is Tiber Septim?`")
             return
         
-        # Check cache first
-        cache_key = self._generate_cache_key(question)
-        cached_response = self.bot.cache.get(cache_key)
-        if cached_response:
-            logger.info(f"Cache hit for question: {question[:50]}...")
-            await ctx.send(cached_response)
-            return
-        
-        # Show typing indicator
-        async with ctx.channel.typing():
-            try:
-                # Search for relevant passages with timeout
-                context_passages = await asyncio.wait_for(
-                    self.bot.search_engine.search(question),
-                    timeout=Config.SEARCH_TIMEOUT
-                )
-                
-                if not context_passages:
-                    response = "🤔 I searched multiple online sources but couldn't find specific information about that in the Elder Scrolls lore. Could you try rephrasing your question or ask about something else?"
-                else:
-                    # Process question using RAG with timeout
-                    response = await asyncio.wait_for(
-                        self.bot.rag_processor.process_question(question, context_passages),
-                        timeout=Config.LLM_TIMEOUT
-                    )
-                
-                # Cache the response
-                self.bot.cache.set(cache_key, response, ttl=1800)  # 30 minutes
-                
-                # Send response
-                await ctx.send(response)
-                
-            except asyncio.TimeoutError:
-                logger.error(f"Timeout processing question '{question}'")
-                await ctx.send("⏰ Sorry, the request took too long to process. Please try again with a simpler question or try later.")
-            except Exception as e:
-                logger.error(f"Error processing question '{question}': {e}")
-                self.bot.log_error(f"Ask command error: {e}", {
-                    'question': question,
-                    'user': str(ctx.author),
-                    'guild': ctx.guild.name if ctx.guild else 'DM'
-                })
-                await ctx.send("❌ Sorry, I encountered an error while processing your question. Please try again later.")
+        # Plain messages and !ask share the events cog's question pipeline
+        await self.bot.get_cog('ElderScrollsEvents').handle_question(ctx.message, question)
     
     @commands.command(name='debug')
     @command_timer
@@ -255,7 +214,7 @@ I'm your guide to the vast world of Tamriel and beyond. Ask me anything about:
         stats = self.bot.get_performance_stats()
         
         # Get recent errors (last 5)
-        recent_errors = self.bot.error_log[-5:] if self.bot.error_log else []
+        recent_errors = list(self.bot.error_log)[-5:]
         error_summary = "\n".join([f"• {error['time']}: {error['error'][:50]}..." for error in recent_errors])
         if not error_summary:
             error_summary = "No recent errors"
@@ -371,12 +330,6 @@ I'm your guide to the vast world of Tamriel and beyond. Ask me anything about:
         else:
             await ctx.send("❌ Invalid action. Use 'info' or 'clear'.")
     
-    def _generate_cache_key(self, question: str) -> str:
-        """Generate a cache key for a question"""
-        # Normalize the question for better cache hits
-        normalized = question.lower().strip()
-        return hashlib.md5(normalized.encode()).hexdigest()
-    
     def _calculate_cache_hit_rate(self) -> float:
         """Calculate cache hit rate (simplified)"""
         # This is a simplified calculation - in a real implementation,
@@ -1,9 +1,15 @@
 import os
+import functools
 from dotenv import load_dotenv
 from enum import Enum
 
+@functools.lru_cache(maxsize=None)
+def load_env():
+    """Load .env into the environment, once per process however many config modules ask for it"""
+    load_dotenv()
+
 # Load environment variables
-load_dotenv()
+load_env()
 
 class LLMBackend(Enum):
     OPENROUTER = "openrouter"
@@ -15,6 +21,18 @@ class Config:
     
     # Discord Bot Configuration
     DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
+    DISABLE_UNUSED_INTENTS = os.getenv("DISABLE_UNUSED_INTENTS", "true").lower() == "true"  # skip typing/presence/voice events
+    
+    # Telegram Bot Configuration
+    TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
+    TELEGRAM_READ_TIMEOUT = int(os.getenv("TELEGRAM_READ_TIMEOUT", "30"))  # seconds to wait for a Bot API response
+    TELEGRAM_WRITE_TIMEOUT = int(os.getenv("TELEGRAM_WRITE_TIMEOUT", "30"))  # seconds to send a request
+    TELEGRAM_CONNECT_TIMEOUT = int(os.getenv("TELEGRAM_CONNECT_TIMEOUT", "30"))  # seconds to connect to the Bot API
+    TELEGRAM_POOL_TIMEOUT = int(os.getenv("TELEGRAM_POOL_TIMEOUT", "30"))  # seconds to wait for a free connection
+    
+    # Telegram webhook (updates are pushed to WEBHOOK_URL; long polling is used when unset)
+    WEBHOOK_URL = os.getenv("WEBHOOK_URL", "").rstrip("/")
+    WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8443"))
     
     # LLM Backend Configuration
     LLM_BACKEND = os.getenv("LLM_BACKEND", "openrouter").lower()
@@ -41,6 +59,12 @@ class Config:
     FAISS_INDEX_PATH = "elder_scrolls_index.faiss"
     EMBEDDINGS_PATH = "elder_scrolls_embeddings.npy"
     TEXTS_PATH = "elder_scrolls_texts.json"
+    CORPUS_INDEX_PATH = "elder_scrolls_corpus_hnsw_sq8.faiss"  # ANN index used by online search
+    CORPUS_META_PATH = "elder_scrolls_corpus_meta.json"  # model and dataset the corpus cache was built from
+    HNSW_EF_SEARCH = 64  # higher trades latency for recall
+    HTTP_CACHE_PATH = "http_cache.sqlite"  # upstream pages kept for conditional GETs
+    HTTP_CACHE_MAX_ENTRIES = 5000  # oldest pages beyond this are pruned
+    HTTP_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds a page is kept before it is pruned
     
     # Online Search Configuration
     # Elder Scrolls Wiki API endpoints
@@ -51,19 +75,27 @@ class Config:
     WIKIPEDIA_API_BASE_URL = "https://en.wikipedia.org/api/rest_v1"
     
     # Rate limiting settings
-    REQUEST_DELAY = float(os.getenv("REQUEST_DELAY", "1.0"))  # seconds between requests
+    MAX_CONCURRENT_PER_HOST = int(os.getenv("MAX_CONCURRENT_PER_HOST", "10"))  # in-flight requests per site
     MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
     REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
     
     # Bot timeout settings
     SEARCH_TIMEOUT = float(os.getenv("SEARCH_TIMEOUT", "45.0"))  # seconds for search operations
     LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "30.0"))  # seconds for LLM responses
+    MAX_CONCURRENT_QUESTIONS = int(os.getenv("MAX_CONCURRENT_QUESTIONS", "8"))  # questions searched at once
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))  # LLM requests in flight at once
+    THREAD_POOL_WORKERS = int(os.getenv("THREAD_POOL_WORKERS", "16"))  # threads for blocking search/embedding work
     
     # Retry settings
     MAX_RETRY_ATTEMPTS = int(os.getenv("MAX_RETRY_ATTEMPTS", "2"))  # number of retry attempts
     RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "1.0"))  # base delay for retries
     RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "10.0"))  # maximum delay for retries
     
+    # Semantic cache configuration (cosine similarity needed to reuse an answer)
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+    LLM_CACHE_THRESHOLD = float(os.getenv("LLM_CACHE_THRESHOLD", "0.95"))  # stricter, applied in front of the LLM
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "llm_cache")  # persisted on shutdown, empty to disable
+    
     # Search configuration
     MAX_SEARCH_RESULTS = int(os.getenv("MAX_SEARCH_RESULTS", "5"))
     MIN_CONTENT_LENGTH = int(os.getenv("MIN_CONTENT_LENGTH", "100"))
@@ -73,6 +105,7 @@ class Config:
     USER_AGENT = "ElderScrollsLoreBot/1.0 (Educational Bot; +https://github.com/elder-scrolls-lore-bot)"
     
     @classmethod
+    @functools.lru_cache(maxsize=None)  # LLM_BACKEND is fixed at import, so parse (and warn) once
     def get_llm_backend(cls):
         """Get the configured LLM backend"""
         try:
@@ -82,15 +115,22 @@ class Config:
             return LLMBackend.OPENROUTER
     
     @classmethod
-    def validate_config(cls):
-        """Validate that all required configuration is present"""
+    def validate_config(cls, telegram=False):
+        """Validate that all required configuration is present, for the Telegram bot when telegram is set"""
         errors = []
         
-        if not cls.DISCORD_TOKEN:
+        if telegram:
+            if not cls.TELEGRAM_TOKEN:
+                errors.append("TELEGRAM_TOKEN is required")
+        elif not cls.DISCORD_TOKEN:
             errors.append("DISCORD_TOKEN is required")
         
         backend = cls.get_llm_backend()
         if backend == LLMBackend.OPENROUTER and not cls.OPENROUTER_API_KEY:
             errors.append("OPENROUTER_API_KEY is required when using OpenRouter backend")
         
+        # Telegram only delivers webhook updates over HTTPS
+        if cls.WEBHOOK_URL and not cls.WEBHOOK_URL.startswith("https://"):
+            errors.append("WEBHOOK_URL must be an https:// URL")
+        
         return errors
\ No newline at end of file
@@ -5,15 +5,17 @@ Enhanced with better security, validation, and environment variable handling.
 
 import os
 import logging
-from dotenv import load_dotenv
+import functools
 from enum import Enum
 from typing import List, Dict, Any, Optional
 import json
 import hashlib
 from pathlib import Path
 
-# Load environment variables
-load_dotenv()
+from config import load_env
+
+# Load environment variables (shared with config, so run_bot parses .env only once)
+load_env()
 
 logger = logging.getLogger(__name__)
 
@@ -140,15 +142,16 @@ class Config:
         directories = [cls.CONFIG_DIR, cls.DATA_DIR, cls.LOGS_DIR]
         for directory in directories:
             directory.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Ensured directory exists: {directory}")
+            logger.info("Ensured directory exists: %s", directory)
     
     @classmethod
+    @functools.lru_cache(maxsize=None)  # LLM_BACKEND is fixed at import, so parse (and warn) once
     def get_llm_backend(cls) -> LLMBackend:
         """Get the configured LLM backend with validation"""
         try:
             return LLMBackend(cls.LLM_BACKEND)
         except ValueError:
-            logger.warning(f"Invalid LLM backend: {cls.LLM_BACKEND}. Defaulting to OpenRouter.")
+            logger.warning("Invalid LLM backend: %s. Defaulting to OpenRouter.", cls.LLM_BACKEND)
             return LLMBackend.OPENROUTER
     
     @classmethod
@@ -296,7 +299,7 @@ class Config:
         with open(filepath, 'w') as f:
             json.dump(safe_config, f, indent=2)
         
-        logger.info(f"Configuration exported to {filepath}")
+        logger.info("Configuration exported to %s", filepath)
         return str(filepath)
     
     @classmethod
@@ -319,14 +322,14 @@ class Config:
     def log_config_summary(cls):
         """Log a summary of the current configuration"""
         logger.info("Configuration Summary:")
-        logger.info(f"  Bot: {cls.BOT_NAME} v{cls.BOT_VERSION}")
-        logger.info(f"  LLM Backend: {cls.get_llm_backend().value}")
-        logger.info(f"  Security Level: {cls.SECURITY_LEVEL.value}")
-        logger.info(f"  Allowed Guilds: {len(cls.ALLOWED_GUILDS)}")
-        logger.info(f"  Blocked Users: {len(cls.BLOCKED_USERS)}")
-        logger.info(f"  Rate Limits: {cls.USER_RATE_LIMIT} req/{cls.USER_RATE_WINDOW}s per user")
-        logger.info(f"  Cache: {cls.CACHE_MAX_SIZE} entries, {cls.CACHE_DEFAULT_TTL}s TTL")
-        logger.info(f"  Timeouts: Search={cls.SEARCH_TIMEOUT}s, LLM={cls.LLM_TIMEOUT}s")
+        logger.info("  Bot: %s v%s", cls.BOT_NAME, cls.BOT_VERSION)
+        logger.info("  LLM Backend: %s", cls.get_llm_backend().value)
+        logger.info("  Security Level: %s", cls.SECURITY_LEVEL.value)
+        logger.info("  Allowed Guilds: %s", len(cls.ALLOWED_GUILDS))
+        logger.info("  Blocked Users: %s", len(cls.BLOCKED_USERS))
+        logger.info("  Rate Limits: %s req/%ss per user", cls.USER_RATE_LIMIT, cls.USER_RATE_WINDOW)
+        logger.info("  Cache: %s entries, %ss TTL", cls.CACHE_MAX_SIZE, cls.CACHE_DEFAULT_TTL)
+        logger.info("  Timeouts: Search=%ss, LLM=%ss", cls.SEARCH_TIMEOUT, cls.LLM_TIMEOUT)
 
 # Initialize directories on import
 Config.initialize_directories()
\ No newline at end of file
@@ -1,13 +1,13 @@
 import json
 import numpy as np
 from datasets import load_dataset
-from sentence_transformers import SentenceTransformer
 import faiss
 import os
 from typing import List, Tuple, Optional
 import logging
 
 from config import Config
+from embedding_model import get_embedding_model
 
 logger = logging.getLogger(__name__)
 
@@ -23,17 +23,16 @@ class ElderScrollsDatasetLoader:
     def load_embedding_model(self):
         """Load the sentence transformer model for embeddings"""
         try:
-            logger.info(f"Loading embedding model: {Config.EMBEDDING_MODEL}")
-            self.embedding_model = SentenceTransformer(Config.EMBEDDING_MODEL)
+            self.embedding_model = get_embedding_model()
             logger.info("Embedding model loaded successfully")
         except Exception as e:
-            logger.error(f"Failed to load embedding model: {e}")
+            logger.error("Failed to load embedding model: %s", e)
             raise
     
     def load_dataset(self) -> List[str]:
         """Load the Elder Scrolls Wiki dataset from HuggingFace"""
         try:
-            logger.info(f"Loading dataset: {Config.DATASET_NAME}")
+            logger.info("Loading dataset: %s", Config.DATASET_NAME)
             dataset = load_dataset(Config.DATASET_NAME)
             
             # Extract text passages from the dataset
@@ -56,11 +55,11 @@ class ElderScrollsDatasetLoader:
                                 texts.append(value)
                                 break
             
-            logger.info(f"Loaded {len(texts)} text passages from dataset")
+            logger.info("Loaded %s text passages from dataset", len(texts))
             return texts
             
         except Exception as e:
-            logger.error(f"Failed to load dataset: {e}")
+            logger.error("Failed to load dataset: %s", e)
             raise
     
     def create_embeddings(self, texts: List[str]) -> np.ndarray:
@@ -71,10 +70,10 @@ class ElderScrollsDatasetLoader:
         try:
             logger.info("Creating embeddings for text passages...")
             embeddings = self.embedding_model.encode(texts, show_progress_bar=True)
-            logger.info(f"Created embeddings with shape: {embeddings.shape}")
+            logger.info("Created embeddings with shape: %s", embeddings.shape)
             return embeddings
         except Exception as e:
-            logger.error(f"Failed to create embeddings: {e}")
+            logger.error("Failed to create embeddings: %s", e)
             raise
     
     def build_faiss_index(self, embeddings: np.ndarray):
@@ -87,9 +86,9 @@ class ElderScrollsDatasetLoader:
             self.faiss_index = faiss.IndexFlatIP(dimension)  # Inner product for cosine similarity
             self.faiss_index.add(embeddings.astype('float32'))
             
-            logger.info(f"FAISS index built with {self.faiss_index.ntotal} vectors")
+            logger.info("FAISS index built with %s vectors", self.faiss_index.ntotal)
         except Exception as e:
-            logger.error(f"Failed to build FAISS index: {e}")
+            logger.error("Failed to build FAISS index: %s", e)
             raise
     
     def save_to_disk(self, texts: List[str], embeddings: np.ndarray):
@@ -109,7 +108,7 @@ class ElderScrollsDatasetLoader:
             
             logger.info("Data saved successfully")
         except Exception as e:
-            logger.error(f"Failed to save data to disk: {e}")
+            logger.error("Failed to save data to disk: %s", e)
             raise
     
     def load_from_disk(self) -> bool:
@@ -134,14 +133,14 @@ class ElderScrollsDatasetLoader:
                 # Load embedding model
                 self.load_embedding_model()
                 
-                logger.info(f"Loaded {len(self.texts)} texts and FAISS index with {self.faiss_index.ntotal} vectors")
+                logger.info("Loaded %s texts and FAISS index with %s vectors", len(self.texts), self.faiss_index.ntotal)
                 return True
             else:
                 logger.info("No cached data found, will process dataset from scratch")
                 return False
                 
         except Exception as e:
-            logger.error(f"Failed to load from disk: {e}")
+            logger.error("Failed to load from disk: %s", e)
             return False
     
     def initialize(self) -> bool:
@@ -177,7 +176,7 @@ class ElderScrollsDatasetLoader:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize dataset: {e}")
+            logger.error("Failed to initialize dataset: %s", e)
             return False
     
     def search(self, query: str, top_k: int = None) -> List[Tuple[str, float]]:
@@ -205,9 +204,9 @@ class ElderScrollsDatasetLoader:
                 if idx < len(self.texts):
                     results.append((self.texts[idx], float(score)))
             
-            logger.info(f"Found {len(results)} relevant passages for query: {query}")
+            logger.info("Found %s relevant passages for query: %s", len(results), query)
             return results
             
         except Exception as e:
-            logger.error(f"Search failed: {e}")
+            logger.error("Search failed: %s", e)
             return []
\ No newline at end of file
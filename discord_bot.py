@@ -4,6 +4,7 @@ import asyncio
 import logging
 import os
 from datetime import datetime
+from collections import deque
 
 from config import Config
 from online_search import OnlineSearchEngine
@@ -26,6 +27,13 @@ class ElderScrollsLoreBot(commands.Bot):
         intents.message_content = True
         intents.guilds = True
         
+        # No cog listens to typing, presence or voice events; dropping them
+        # stops the gateway from dispatching (and us from parsing) them at all
+        if Config.DISABLE_UNUSED_INTENTS:
+            intents.typing = False
+            intents.presences = False
+            intents.voice_states = False
+        
         super().__init__(
             command_prefix='!',
             intents=intents,
@@ -37,7 +45,7 @@ class ElderScrollsLoreBot(commands.Bot):
         self.rag_processor = None
         self.initialized = False
         self.start_time = None
-        self.error_log = []
+        self.error_log = deque(maxlen=100)  # Keeps only the last 100 errors
         
         # Initialize background task manager
         self.background_manager = BackgroundTaskManager(self)
@@ -60,15 +68,18 @@ class ElderScrollsLoreBot(commands.Bot):
         try:
             logger.info("Initializing Elder Scrolls Lore Bot with online search...")
             
-            # Initialize online search engine
+            # The search engine and LLM client are independent, so set them up concurrently
             self.search_engine = OnlineSearchEngine()
-            if not await self.search_engine.initialize():
+            search_ready, llm_client = await asyncio.gather(
+                self.search_engine.initialize(),
+                asyncio.to_thread(LLMClientFactory.create_client)
+            )
+            if not search_ready:
                 logger.error("Failed to initialize online search engine")
                 return False
             
-            # Initialize LLM client and RAG processor
-            llm_client = LLMClientFactory.create_client()
-            self.rag_processor = RAGProcessor(llm_client)
+            # Initialize RAG processor
+            self.rag_processor = RAGProcessor(llm_client, self.search_engine.embedding_model)
             
             self.initialized = True
             self.start_time = datetime.now()
@@ -76,7 +87,7 @@ class ElderScrollsLoreBot(commands.Bot):
             return True
             
         except Exception as e:
-            logger.error(f"Bot initialization failed: {e}")
+            logger.error("Bot initialization failed: %s", e)
             return False
     
     async def cleanup(self):
@@ -88,6 +99,10 @@ class ElderScrollsLoreBot(commands.Bot):
         # Cleanup search engine
         if self.search_engine:
             await self.search_engine.close()
+        
+        # Close the LLM client's HTTP session
+        if self.rag_processor:
+            await self.rag_processor.close()
 
 async def main():
     """Main function to run the bot"""
@@ -96,7 +111,7 @@ async def main():
     if config_errors:
         logger.error("Configuration errors:")
         for error in config_errors:
-            logger.error(f"  - {error}")
+            logger.error("  - %s", error)
         return
     
     # Check for Discord token
@@ -115,7 +130,7 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Bot shutdown requested...")
     except Exception as e:
-        logger.error(f"Bot startup failed: {e}")
+        logger.error("Bot startup failed: %s", e)
     finally:
         # Cleanup resources
         await bot.cleanup()
@@ -11,9 +11,10 @@ import logging
 import os
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Deque
 import weakref
-from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, deque, OrderedDict
 import json
 import hashlib
 
@@ -65,13 +66,13 @@ class RateLimiter:
         return max(0.0, oldest_request + self.window_seconds - time.time())
 
 class Cache:
-    """Simple in-memory cache with TTL and size limits"""
+    """Simple in-memory LRU cache with TTL and size limits"""
     
     def __init__(self, max_size: int = 1000, default_ttl: int = 300):
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.access_order = deque()
+        # Ordered oldest -> most recently used, so LRU eviction is O(1)
+        self.cache: Dict[str, Dict[str, Any]] = OrderedDict()
     
     def _cleanup_expired(self):
         """Remove expired entries"""
@@ -81,58 +82,50 @@ class Cache:
             if data['expires_at'] <= now
         ]
         for key in expired_keys:
-            self._remove_key(key)
-    
-    def _remove_key(self, key: str):
-        """Remove a key from cache"""
-        if key in self.cache:
             del self.cache[key]
-            if key in self.access_order:
-                self.access_order.remove(key)
     
-    def _evict_oldest(self):
-        """Evict oldest entry when cache is full"""
-        if self.access_order:
-            oldest_key = self.access_order.popleft()
-            self._remove_key(oldest_key)
+    def evict_oldest(self, count: int = 1) -> int:
+        """Evict up to count least recently used entries, returning how many were removed"""
+        removed = 0
+        while self.cache and removed < count:
+            self.cache.popitem(last=False)
+            removed += 1
+        return removed
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
-        self._cleanup_expired()
+        data = self.cache.get(key)
+        if data is None:
+            return None
         
-        if key in self.cache:
-            # Move to end (most recently used)
-            self.access_order.remove(key)
-            self.access_order.append(key)
-            return self.cache[key]['value']
+        # Expired entries are dropped lazily on access
+        if data['expires_at'] <= time.time():
+            del self.cache[key]
+            return None
         
-        return None
+        # Move to end (most recently used)
+        self.cache.move_to_end(key)
+        return data['value']
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """Set value in cache"""
-        self._cleanup_expired()
-        
-        # Evict if cache is full
-        if len(self.cache) >= self.max_size:
-            self._evict_oldest()
+        if key in self.cache:
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            # Only sweep for expired entries when space is actually needed
+            self._cleanup_expired()
+            if len(self.cache) >= self.max_size:
+                self.evict_oldest()
         
         ttl = ttl or self.default_ttl
-        expires_at = time.time() + ttl
-        
         self.cache[key] = {
             'value': value,
-            'expires_at': expires_at
+            'expires_at': time.time() + ttl
         }
-        
-        # Add to access order
-        if key in self.access_order:
-            self.access_order.remove(key)
-        self.access_order.append(key)
     
     def clear(self) -> None:
         """Clear all cache entries"""
         self.cache.clear()
-        self.access_order.clear()
 
 class ElderScrollsLoreBot(commands.Bot):
     """Optimized Discord bot for Elder Scrolls Lore with production-ready features"""
@@ -144,6 +137,13 @@ class ElderScrollsLoreBot(commands.Bot):
         intents.guilds = True
         intents.members = True  # For better user tracking
         
+        # No cog listens to typing, presence or voice events; dropping them
+        # stops the gateway from dispatching (and us from parsing) them at all
+        if Config.DISABLE_UNUSED_INTENTS:
+            intents.typing = False
+            intents.presences = False
+            intents.voice_states = False
+        
         super().__init__(
             command_prefix='!',
             intents=intents,
@@ -157,7 +157,7 @@ class ElderScrollsLoreBot(commands.Bot):
         self.rag_processor: Optional[RAGProcessor] = None
         self.initialized = False
         self.start_time: Optional[datetime] = None
-        self.error_log: List[Dict[str, Any]] = []
+        self.error_log: Deque[Dict[str, Any]] = deque(maxlen=100)  # Keeps only the last 100 errors
         
         # Performance and monitoring
         self.request_count = 0
@@ -191,6 +191,11 @@ class ElderScrollsLoreBot(commands.Bot):
         """Called when the bot is starting up - optimized for speed"""
         logger.info("Setting up Elder Scrolls Lore Discord Bot...")
         
+        # Blocking search and embedding work runs in this pool so concurrent messages don't queue behind it
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=Config.THREAD_POOL_WORKERS)
+        )
+        
         try:
             # Load cogs asynchronously
             await asyncio.gather(
@@ -207,7 +212,7 @@ class ElderScrollsLoreBot(commands.Bot):
             logger.error("Bot setup timed out")
             raise RuntimeError("Bot setup timed out")
         except Exception as e:
-            logger.error(f"Bot setup failed: {e}")
+            logger.error("Bot setup failed: %s", e)
             raise
     
     async def initialize(self):
@@ -215,18 +220,18 @@ class ElderScrollsLoreBot(commands.Bot):
         try:
             logger.info("Initializing Elder Scrolls Lore Bot components...")
             
-            # Initialize online search engine with timeout
+            # Initialize online search engine (with timeout) and LLM client concurrently
             self.search_engine = OnlineSearchEngine()
-            if not await asyncio.wait_for(
-                self.search_engine.initialize(), 
-                timeout=30.0
-            ):
+            search_ready, llm_client = await asyncio.gather(
+                asyncio.wait_for(self.search_engine.initialize(), timeout=30.0),
+                asyncio.to_thread(LLMClientFactory.create_client)
+            )
+            if not search_ready:
                 logger.error("Failed to initialize online search engine")
                 return False
             
-            # Initialize LLM client and RAG processor
-            llm_client = LLMClientFactory.create_client()
-            self.rag_processor = RAGProcessor(llm_client)
+            # Initialize RAG processor
+            self.rag_processor = RAGProcessor(llm_client, self.search_engine.embedding_model)
             
             # Test components
             await self._test_components()
@@ -238,7 +243,7 @@ class ElderScrollsLoreBot(commands.Bot):
             return True
             
         except Exception as e:
-            logger.error(f"Bot initialization failed: {e}")
+            logger.error("Bot initialization failed: %s", e)
             return False
     
     async def _test_components(self):
@@ -260,7 +265,7 @@ class ElderScrollsLoreBot(commands.Bot):
                 logger.info("RAG processor test passed")
             
         except Exception as e:
-            logger.warning(f"Component test failed: {e}")
+            logger.warning("Component test failed: %s", e)
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get comprehensive performance statistics"""
@@ -297,11 +302,7 @@ class ElderScrollsLoreBot(commands.Bot):
         
         self.error_log.append(error_entry)
         
-        # Keep only last 100 errors
-        if len(self.error_log) > 100:
-            self.error_log = self.error_log[-100:]
-        
-        logger.error(f"Error logged: {error}")
+        logger.error("Error logged: %s", error)
     
     async def cleanup(self):
         """Cleanup resources when bot shuts down"""
@@ -316,6 +317,10 @@ class ElderScrollsLoreBot(commands.Bot):
             if self.search_engine:
                 await self.search_engine.close()
             
+            # Close the LLM client's HTTP session
+            if self.rag_processor:
+                await self.rag_processor.close()
+            
             # Clear caches
             self.cache.clear()
             
@@ -325,7 +330,7 @@ class ElderScrollsLoreBot(commands.Bot):
             logger.info("Bot cleanup completed successfully")
             
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
 async def main():
     """Main function to run the bot with comprehensive error handling"""
@@ -336,7 +341,7 @@ async def main():
     if config_errors:
         logger.error("Configuration errors:")
         for error in config_errors:
-            logger.error(f"  - {error}")
+            logger.error("  - %s", error)
         return
     
     # Check for Discord token
@@ -358,7 +363,7 @@ async def main():
     except asyncio.TimeoutError:
         logger.error("Bot startup timed out")
     except Exception as e:
-        logger.error(f"Bot startup failed: {e}")
+        logger.error("Bot startup failed: %s", e)
         bot.log_error(f"Startup failure: {e}")
     finally:
         # Cleanup resources
@@ -372,5 +377,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Bot interrupted by user")
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         exit(1)
\ No newline at end of file
@@ -0,0 +1,28 @@
+import logging
+import threading
+from typing import Optional
+
+import torch
+from sentence_transformers import SentenceTransformer
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# One SentenceTransformer per process; search, caches and the dataset loader all share it
+_MODEL_SINGLETON: Optional[SentenceTransformer] = None
+_MODEL_LOCK = threading.Lock()
+
+def get_embedding_model() -> SentenceTransformer:
+    """Get the shared embedding model, loading it on first use (blocking - call from a thread in async code)"""
+    global _MODEL_SINGLETON
+    with _MODEL_LOCK:
+        if _MODEL_SINGLETON is None:
+            # Run the encoder on the GPU in FP16 when one is available
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            logger.info("Loading embedding model: %s on %s", Config.EMBEDDING_MODEL, device)
+            model = SentenceTransformer(Config.EMBEDDING_MODEL, device=device)
+            if device == 'cuda':
+                model.half()
+            _MODEL_SINGLETON = model
+        return _MODEL_SINGLETON
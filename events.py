@@ -3,35 +3,24 @@ from discord.ext import commands, tasks
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from functools import wraps
+from typing import Optional
 
 from config import Config
+from retry import TRANSIENT_ERRORS, retry_with_backoff
+from messages import NOT_READY_MESSAGE, NO_RESULTS_MESSAGE, TIMEOUT_MESSAGE, ERROR_MESSAGE
 
 logger = logging.getLogger(__name__)
 
-def retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=10.0):
-    """Decorator to retry async functions with exponential backoff"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt == max_retries:
-                        logger.error(f"Final attempt failed for {func.__name__}: {e}")
-                        raise
-                    
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (2 ** attempt), max_delay)
-                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}. Retrying in {delay:.1f}s...")
-                    await asyncio.sleep(delay)
-            
-            raise last_exception
-        return wrapper
-    return decorator
+COMMAND_PREFIX = '!'
+
+# Discord failures worth retrying; missing access or a deleted channel or message won't change on a resend
+RETRY_SETTINGS = {
+    'max_retries': Config.MAX_RETRY_ATTEMPTS,
+    'base_delay': Config.RETRY_BASE_DELAY,
+    'max_delay': Config.RETRY_MAX_DELAY,
+    'retry_on': (discord.HTTPException, *TRANSIENT_ERRORS),
+    'give_up_on': (discord.Forbidden, discord.NotFound),
+}
 
 class ElderScrollsEvents(commands.Cog):
     """Cog containing all Elder Scrolls Lore Bot event handlers"""
@@ -42,8 +31,8 @@ class ElderScrollsEvents(commands.Cog):
     @commands.Cog.listener()
     async def on_ready(self):
         """Called when the bot is ready"""
-        logger.info(f'Logged in as {self.bot.user} (ID: {self.bot.user.id})')
-        logger.info(f'Connected to {len(self.bot.guilds)} guilds')
+        logger.info('Logged in as %s (ID: %s)', self.bot.user, self.bot.user.id)
+        logger.info('Connected to %s guilds', len(self.bot.guilds))
         
         # Set bot status
         activity = discord.Activity(
@@ -59,23 +48,24 @@ class ElderScrollsEvents(commands.Cog):
         if message.author == self.bot.user:
             return
         
-        # Process commands first
-        await self.bot.process_commands(message)
-        
-        # If it's not a command and the bot is initialized, treat as a question
-        if not message.content.startswith('!') and self.bot.initialized:
+        # Only run the command parser on prefixed messages; everything
+        # else is plain chat and is treated as a question
+        if message.content.startswith(COMMAND_PREFIX):
+            await self.bot.process_commands(message)
+        elif self.bot.initialized:
             await self.handle_question(message)
     
-    async def handle_question(self, message):
-        """Handle regular messages as questions"""
+    async def handle_question(self, message, question: Optional[str] = None):
+        """Answer a question, taken from the message text unless given (shared with !ask)"""
         if not self.bot.initialized:
             await self.safe_send_message(
                 message.channel,
-                "⚠️ Bot is still initializing. Please wait a moment and try again."
+                NOT_READY_MESSAGE
             )
             return
         
-        question = message.content
+        if question is None:
+            question = message.content
         
         # Show typing indicator
         async with message.channel.typing():
@@ -87,7 +77,7 @@ class ElderScrollsEvents(commands.Cog):
                 )
                 
                 if not context_passages:
-                    response = "🤔 I searched multiple online sources but couldn't find specific information about that in the Elder Scrolls lore. Could you try rephrasing your question or ask about something else?"
+                    response = NO_RESULTS_MESSAGE
                 else:
                     # Process question using RAG with timeout
                     response = await asyncio.wait_for(
@@ -99,16 +89,16 @@ class ElderScrollsEvents(commands.Cog):
                 await self.safe_send_message(message.channel, response)
                 
             except asyncio.TimeoutError:
-                logger.error(f"Timeout processing question '{question}'")
+                logger.error("Timeout processing question '%s'", question)
                 await self.safe_send_message(
                     message.channel,
-                    "⏰ Sorry, the request took too long to process. Please try again with a simpler question or try later."
+                    TIMEOUT_MESSAGE
                 )
             except Exception as e:
-                logger.error(f"Error processing question '{question}': {e}")
+                logger.error("Error processing question '%s': %s", question, e)
                 await self.safe_send_message(
                     message.channel,
-                    "❌ Sorry, I encountered an error while processing your question. Please try again later."
+                    ERROR_MESSAGE
                 )
     
     @commands.Cog.listener()
@@ -127,10 +117,6 @@ class ElderScrollsEvents(commands.Cog):
             'command': ctx.command.name if ctx.command else 'Unknown'
         })
         
-        # Keep only last 100 errors
-        if len(self.bot.error_log) > 100:
-            self.bot.error_log = self.bot.error_log[-100:]
-        
         # Send user-friendly error message
         if isinstance(error, commands.CommandNotFound):
             await self.safe_send_message(
@@ -153,12 +139,12 @@ class ElderScrollsEvents(commands.Cog):
                 "❌ An error occurred while processing your command. Please try again later."
             )
     
-    @retry_with_backoff(max_retries=Config.MAX_RETRY_ATTEMPTS, base_delay=Config.RETRY_BASE_DELAY, max_delay=Config.RETRY_MAX_DELAY)
+    @retry_with_backoff(**RETRY_SETTINGS)
     async def safe_send_message(self, channel, content, **kwargs):
         """Safely send a message with retry logic"""
         return await channel.send(content, **kwargs)
     
-    @retry_with_backoff(max_retries=Config.MAX_RETRY_ATTEMPTS, base_delay=Config.RETRY_BASE_DELAY, max_delay=Config.RETRY_MAX_DELAY)
+    @retry_with_backoff(**RETRY_SETTINGS)
     async def safe_edit_message(self, message, content, **kwargs):
         """Safely edit a message with retry logic"""
         return await message.edit(content=content, **kwargs)
@@ -166,8 +152,8 @@ class ElderScrollsEvents(commands.Cog):
     @commands.Cog.listener()
     async def on_ready(self):
         """Called when the bot is ready"""
-        logger.info(f'Logged in as {self.bot.user} (ID: {self.bot.user.id})')
-        logger.info(f'Connected to {len(self.bot.guilds)} guilds')
+        logger.info('Logged in as %s (ID: %s)', self.bot.user, self.bot.user.id)
+        logger.info('Connected to %s guilds', len(self.bot.guilds))
         
         # Set bot status
         activity = discord.Activity(
@@ -1,6 +1,10 @@
 """
 Optimized Events Module for Elder Scrolls Lore Bot
 Enhanced with error handling, performance monitoring, and event debouncing.
+
+This cog only consumes message, command and ready events. Intents are fixed at
+login, so the bot constructor is expected to disable the typing, presence and
+voice state intents (see Config.DISABLE_UNUSED_INTENTS).
 """
 
 import discord
@@ -9,69 +13,105 @@ import asyncio
 import logging
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List, Set
-from functools import wraps
-from collections import defaultdict, deque
+from typing import Optional, Dict, Any, List, Set, Tuple
+from functools import lru_cache
+from collections import defaultdict, deque, namedtuple
 import hashlib
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 from config import Config
+from retry import TRANSIENT_ERRORS, retry_with_backoff
+from messages import NOT_READY_MESSAGE, NO_RESULTS_MESSAGE, TIMEOUT_MESSAGE, ERROR_MESSAGE
+from llm_client import FALLBACK_RESPONSES
+from semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
-def retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=10.0):
-    """Decorator to retry async functions with exponential backoff"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt == max_retries:
-                        logger.error(f"Final attempt failed for {func.__name__}: {e}")
-                        raise
-                    
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (2 ** attempt), max_delay)
-                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}. Retrying in {delay:.1f}s...")
-                    await asyncio.sleep(delay)
-            
-            raise last_exception
-        return wrapper
-    return decorator
+COMMAND_PREFIX = '!'
+
+# Streamed answers are edited into the reply at most this often (seconds)
+STREAM_EDIT_INTERVAL = 0.5
+DISCORD_MESSAGE_LIMIT = 2000
+
+# Discord failures worth retrying; missing access or a deleted channel or message won't change on a resend
+RETRY_SETTINGS = {
+    'max_retries': Config.MAX_RETRY_ATTEMPTS,
+    'base_delay': Config.RETRY_BASE_DELAY,
+    'max_delay': Config.RETRY_MAX_DELAY,
+    'retry_on': (discord.HTTPException, *TRANSIENT_ERRORS),
+    'give_up_on': (discord.Forbidden, discord.NotFound),
+}
 
 class EventDebouncer:
-    """Debouncer for frequent events to prevent spam"""
+    """Debouncer for frequent events to prevent spam
+    
+    A single drain task sleeps until the earliest pending deadline and releases
+    the callers that are due; each caller then runs its own coroutine, so no
+    task is created per debounced event.
+    """
     
     def __init__(self, delay_seconds: float = 2.0):
         self.delay_seconds = delay_seconds
-        self.pending_tasks: Dict[str, asyncio.Task] = {}
+        self.pending: Dict[str, Tuple[float, asyncio.Future]] = {}
+        self._drain_task: Optional[asyncio.Task] = None
     
     async def debounce(self, key: str, coro_func, *args, **kwargs):
         """Debounce a coroutine function"""
-        # Cancel existing task if it exists
-        if key in self.pending_tasks:
-            self.pending_tasks[key].cancel()
+        loop = asyncio.get_running_loop()
+        
+        # Supersede the existing call for this key, if any
+        if key in self.pending:
+            self.pending[key][1].cancel()
         
-        # Create new task
-        task = asyncio.create_task(self._delayed_execution(key, coro_func, *args, **kwargs))
-        self.pending_tasks[key] = task
+        ready = loop.create_future()
+        self.pending[key] = (loop.time() + self.delay_seconds, ready)
+        
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
         
         try:
-            return await task
+            await ready
         except asyncio.CancelledError:
-            logger.debug(f"Debounced task cancelled: {key}")
+            logger.debug("Debounced task cancelled: %s", key)
             raise
-        finally:
-            if key in self.pending_tasks:
-                del self.pending_tasks[key]
-    
-    async def _delayed_execution(self, key: str, coro_func, *args, **kwargs):
-        """Execute the coroutine after delay"""
-        await asyncio.sleep(self.delay_seconds)
+        
         return await coro_func(*args, **kwargs)
+    
+    async def _drain(self):
+        """Release pending callers as their deadlines elapse"""
+        loop = asyncio.get_running_loop()
+        
+        while self.pending:
+            now = loop.time()
+            next_deadline = min(deadline for deadline, _ in self.pending.values())
+            if next_deadline > now:
+                await asyncio.sleep(next_deadline - now)
+                continue
+            
+            for key, (deadline, ready) in list(self.pending.items()):
+                if deadline <= now:
+                    del self.pending[key]
+                    if not ready.done():
+                        ready.set_result(None)
+
+@lru_cache(maxsize=1024)
+def _question_cache_key(question: str) -> str:
+    """Normalize and hash a question; memoized for repeat askers (messages cap at 2000 chars)"""
+    normalized = question.lower().strip()
+    return hashlib.md5(normalized.encode()).hexdigest()
+
+# Activity stores are split into this many partitions (must be a power of two)
+ACTIVITY_PARTITIONS = 16
+
+def _new_activity_entry():
+    return {'last_activity': 0, 'message_count': 0}
+
+# Compact per-message record for the history buffer (no dict per message)
+MessageRecord = namedtuple('MessageRecord', ['id', 'author', 'guild', 'content', 'timestamp'])
 
 class ElderScrollsEvents(commands.Cog):
     """Optimized cog containing all Elder Scrolls Lore Bot event handlers"""
@@ -79,12 +119,16 @@ class ElderScrollsEvents(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.message_history = deque(maxlen=1000)  # Track recent messages
-        self.user_activity = defaultdict(lambda: {'last_activity': 0, 'message_count': 0})
-        self.guild_activity = defaultdict(lambda: {'last_activity': 0, 'message_count': 0})
+        # Partitioned by id so busy shards don't all write into one large dict
+        self.user_activity = [defaultdict(_new_activity_entry) for _ in range(ACTIVITY_PARTITIONS)]
+        self.guild_activity = [defaultdict(_new_activity_entry) for _ in range(ACTIVITY_PARTITIONS)]
         
         # Event debouncing
         self.debouncer = EventDebouncer(delay_seconds=1.0)
         
+        # Paraphrase-tolerant response cache, built once the embedding model is loaded
+        self.semantic_cache: Optional[SemanticCache] = None
+        
         # Performance tracking
         self.event_count = 0
         self.event_times = deque(maxlen=100)
@@ -93,13 +137,20 @@ class ElderScrollsEvents(commands.Cog):
         self.last_heartbeat = time.time()
         self.heartbeat_interval = 45.0  # Discord heartbeat interval
         
+        # Error timestamps are formatted at most once per second
+        self._last_fmt_sec = -1
+        self._last_fmt_str = ''
+        
+        # Memory sampling (one process handle for the cog's lifetime)
+        self._process = psutil.Process() if psutil else None
+        
         logger.info("ElderScrollsEvents cog initialized")
     
     @commands.Cog.listener()
     async def on_ready(self):
         """Called when the bot is ready - optimized for performance"""
-        logger.info(f'Logged in as {self.bot.user} (ID: {self.bot.user.id})')
-        logger.info(f'Connected to {len(self.bot.guilds)} guilds')
+        logger.info('Logged in as %s (ID: %s)', self.bot.user, self.bot.user.id)
+        logger.info('Connected to %s guilds', len(self.bot.guilds))
         
         # Set bot status
         activity = discord.Activity(
@@ -125,21 +176,30 @@ class ElderScrollsEvents(commands.Cog):
         start_time = time.time()
         self.event_count += 1
         
+        # Bind hot attributes once; each access below would otherwise be a lookup
+        bot = self.bot
+        author = message.author
+        guild = message.guild
+        content = message.content
+        
         try:
             # Ignore messages from the bot itself
-            if message.author == self.bot.user:
+            if author == bot.user:
                 return
             
-            # Update activity tracking
-            self._update_activity_tracking(message)
+            author_id = author.id
+            guild_id = guild.id if guild else None
             
-            # Process commands first
-            await self.bot.process_commands(message)
+            # Update activity tracking
+            self._update_activity_tracking(author_id, guild_id, start_time)
             
-            # If it's not a command and the bot is initialized, treat as a question
-            if not message.content.startswith('!') and self.bot.initialized:
+            # Only run the command parser on prefixed messages; everything
+            # else is plain chat and is treated as a question
+            if content.startswith(COMMAND_PREFIX):
+                await bot.process_commands(message)
+            elif bot.initialized:
                 # Debounce question processing to prevent spam
-                question_key = f"question_{message.author.id}_{message.guild.id if message.guild else 'dm'}"
+                question_key = f"question_{author_id}_{guild_id or 'dm'}"
                 await self.debouncer.debounce(
                     question_key,
                     self.handle_question,
@@ -147,37 +207,37 @@ class ElderScrollsEvents(commands.Cog):
                 )
             
             # Track message in history
-            self.message_history.append({
-                'id': message.id,
-                'author': message.author.id,
-                'guild': message.guild.id if message.guild else None,
-                'content': message.content[:100],  # Truncate for memory efficiency
-                'timestamp': time.time()
-            })
+            self.message_history.append(MessageRecord(
+                message.id,
+                author_id,
+                guild_id,
+                content[:100],  # Truncate for memory efficiency
+                start_time
+            ))
             
         except Exception as e:
-            logger.error(f"Error processing message: {e}")
-            self.bot.log_error(f"Message processing error: {e}", {
+            logger.error("Error processing message: %s", e)
+            bot.log_error(f"Message processing error: {e}", {
                 'message_id': message.id,
-                'author': str(message.author),
-                'guild': message.guild.name if message.guild else 'DM',
-                'content_length': len(message.content)
+                'author': str(author),
+                'guild': guild.name if guild else 'DM',
+                'content_length': len(content)
             })
         finally:
             # Record event processing time
             processing_time = time.time() - start_time
             self.event_times.append(processing_time)
     
-    async def handle_question(self, message):
-        """Handle regular messages as questions with optimized processing"""
+    async def handle_question(self, message, question: Optional[str] = None):
+        """Answer a question, taken from the message text unless given (shared with !ask)"""
         if not self.bot.initialized:
             await self.safe_send_message(
                 message.channel,
-                "⚠️ Bot is still initializing. Please wait a moment and try again."
+                NOT_READY_MESSAGE
             )
             return
         
-        question = message.content.strip()
+        question = (message.content if question is None else question).strip()
         
         # Skip very short or very long questions
         if len(question) < 3:
@@ -193,51 +253,105 @@ class ElderScrollsEvents(commands.Cog):
         cache_key = self._generate_cache_key(question)
         cached_response = self.bot.cache.get(cache_key)
         if cached_response:
-            logger.info(f"Cache hit for question: {question[:50]}...")
+            logger.info("Cache hit for question: %s...", question[:50])
             await self.safe_send_message(message.channel, cached_response)
             return
         
+        # Fall back to a similarity lookup so paraphrased questions also hit
+        semantic_cache = self._get_semantic_cache()
+        question_embedding = None
+        if semantic_cache:
+            question_embedding = await asyncio.to_thread(semantic_cache.encode, question)
+            cached_response = semantic_cache.get(question_embedding)
+            if cached_response:
+                logger.info("Semantic cache hit for question: %s...", question[:50])
+                await self.safe_send_message(message.channel, cached_response)
+                return
+        
         # Show typing indicator
         async with message.channel.typing():
             try:
-                # Search for relevant passages with timeout
-                context_passages = await asyncio.wait_for(
-                    self.bot.search_engine.search(question),
-                    timeout=Config.SEARCH_TIMEOUT
-                )
-                
-                if not context_passages:
-                    response = "🤔 I searched multiple online sources but couldn't find specific information about that in the Elder Scrolls lore. Could you try rephrasing your question or ask about something else?"
+                # Search and RAG share one deadline, so the LLM gets whatever the search didn't use
+                budget = Config.SEARCH_TIMEOUT + Config.LLM_TIMEOUT
+                # The reply streamed so far is recorded here, so a failure can be reported under it
+                streamed = {}
+                if hasattr(asyncio, 'timeout'):
+                    async with asyncio.timeout(budget):
+                        response = await self._answer_question(message, question, question_embedding, streamed)
                 else:
-                    # Process question using RAG with timeout
                     response = await asyncio.wait_for(
-                        self.bot.rag_processor.process_question(question, context_passages),
-                        timeout=Config.LLM_TIMEOUT
+                        self._answer_question(message, question, question_embedding, streamed), timeout=budget
                     )
                 
-                # Cache the response
-                self.bot.cache.set(cache_key, response, ttl=1800)  # 30 minutes
-                
-                # Send response with retry logic
-                await self.safe_send_message(message.channel, response)
+                # Cache the response; "no results" and backend fallback replies are transient, so only real answers are kept
+                if response != NO_RESULTS_MESSAGE and response not in FALLBACK_RESPONSES:
+                    self.bot.cache.set(cache_key, response, ttl=1800)  # 30 minutes
+                    if question_embedding is not None:
+                        semantic_cache.set(question_embedding, response, ttl=1800)
                 
             except asyncio.TimeoutError:
-                logger.error(f"Timeout processing question '{question}'")
-                await self.safe_send_message(
-                    message.channel,
-                    "⏰ Sorry, the request took too long to process. Please try again with a simpler question or try later."
-                )
+                logger.error("Timeout processing question '%s'", question)
+                await self._send_failure(message.channel, streamed, TIMEOUT_MESSAGE)
             except Exception as e:
-                logger.error(f"Error processing question '{question}': {e}")
+                logger.error("Error processing question '%s': %s", question, e)
                 self.bot.log_error(f"Question processing error: {e}", {
                     'question': question,
                     'user': str(message.author),
                     'guild': message.guild.name if message.guild else 'DM'
                 })
-                await self.safe_send_message(
-                    message.channel,
-                    "❌ Sorry, I encountered an error while processing your question. Please try again later."
-                )
+                await self._send_failure(message.channel, streamed, ERROR_MESSAGE)
+    
+    async def _send_failure(self, channel, streamed: Dict[str, Any], notice: str):
+        """Tell the user an answer failed, under the part of it already streamed if any"""
+        reply = streamed.get('reply')
+        if reply is None:
+            await self.safe_send_message(channel, notice)
+            return
+        
+        # Keep the partial answer, cut short where needed so the notice still fits in the message
+        partial = streamed['text'][:DISCORD_MESSAGE_LIMIT - len(notice) - 2]
+        await self.safe_edit_message(reply, f"{partial}\n\n{notice}")
+    
+    async def _answer_question(self, message, question: str, question_embedding=None,
+                               streamed: Optional[Dict[str, Any]] = None) -> str:
+        """Search for relevant passages and stream the RAG answer into a reply, returning the full text
+        
+        The reply and the text shown in it so far are kept in streamed, when given, as they change.
+        """
+        if streamed is None:
+            streamed = {}
+        context_passages = await self.bot.search_engine.search(question)
+        
+        if not context_passages:
+            response = NO_RESULTS_MESSAGE
+            await self.safe_send_message(message.channel, response)
+            return response
+        
+        # Post the first chunk as soon as it arrives, then edit the reply at most every STREAM_EDIT_INTERVAL
+        response = ""
+        shown = ""
+        reply = None
+        last_edit = 0.0
+        # Reuse the embedding from the semantic cache lookup so the RAG processor doesn't encode the question again
+        async for chunk in self.bot.rag_processor.process_question_stream(question, context_passages, question_embedding):
+            response += chunk
+            now = time.monotonic()
+            if reply is None or now - last_edit >= STREAM_EDIT_INTERVAL:
+                shown = response[:DISCORD_MESSAGE_LIMIT]
+                if reply is None:
+                    reply = streamed['reply'] = await self.safe_send_message(message.channel, shown)
+                else:
+                    await self.safe_edit_message(reply, shown)
+                streamed['text'] = shown
+                last_edit = now
+        
+        if reply is None:
+            response = ERROR_MESSAGE
+            await self.safe_send_message(message.channel, response)
+        elif shown != response[:DISCORD_MESSAGE_LIMIT]:
+            await self.safe_edit_message(reply, response[:DISCORD_MESSAGE_LIMIT])
+        
+        return response
     
     @commands.Cog.listener()
     async def on_command_error(self, ctx, error):
@@ -252,7 +366,7 @@ class ElderScrollsEvents(commands.Cog):
             
             # Add to error log with enhanced context
             self.bot.error_log.append({
-                'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'time': self._format_error_time(),
                 'error': str(error),
                 'user': str(ctx.author),
                 'guild': ctx.guild.name if ctx.guild else 'DM',
@@ -261,15 +375,11 @@ class ElderScrollsEvents(commands.Cog):
                 'channel': str(ctx.channel)
             })
             
-            # Keep only last 100 errors
-            if len(self.bot.error_log) > 100:
-                self.bot.error_log = self.bot.error_log[-100:]
-            
             # Send user-friendly error message based on error type
             await self._handle_command_error(ctx, error)
             
         except Exception as e:
-            logger.error(f"Error in command error handler: {e}")
+            logger.error("Error in command error handler: %s", e)
         finally:
             # Record error handling time
             processing_time = time.time() - start_time
@@ -308,35 +418,51 @@ class ElderScrollsEvents(commands.Cog):
                 "❌ An error occurred while processing your command. Please try again later."
             )
     
-    @retry_with_backoff(max_retries=Config.MAX_RETRY_ATTEMPTS, base_delay=Config.RETRY_BASE_DELAY, max_delay=Config.RETRY_MAX_DELAY)
+    @retry_with_backoff(**RETRY_SETTINGS)
     async def safe_send_message(self, channel, content, **kwargs):
         """Safely send a message with retry logic"""
         return await channel.send(content, **kwargs)
     
-    @retry_with_backoff(max_retries=Config.MAX_RETRY_ATTEMPTS, base_delay=Config.RETRY_BASE_DELAY, max_delay=Config.RETRY_MAX_DELAY)
+    @retry_with_backoff(**RETRY_SETTINGS)
     async def safe_edit_message(self, message, content, **kwargs):
         """Safely edit a message with retry logic"""
         return await message.edit(content=content, **kwargs)
     
-    def _update_activity_tracking(self, message):
+    def _update_activity_tracking(self, user_id: int, guild_id: Optional[int], current_time: float):
         """Update user and guild activity tracking"""
-        current_time = time.time()
-        
         # Update user activity
-        user_id = message.author.id
-        self.user_activity[user_id]['last_activity'] = current_time
-        self.user_activity[user_id]['message_count'] += 1
+        user_data = self.user_activity[user_id & (ACTIVITY_PARTITIONS - 1)][user_id]
+        user_data['last_activity'] = current_time
+        user_data['message_count'] += 1
         
         # Update guild activity
-        if message.guild:
-            guild_id = message.guild.id
-            self.guild_activity[guild_id]['last_activity'] = current_time
-            self.guild_activity[guild_id]['message_count'] += 1
+        if guild_id is not None:
+            guild_data = self.guild_activity[guild_id & (ACTIVITY_PARTITIONS - 1)][guild_id]
+            guild_data['last_activity'] = current_time
+            guild_data['message_count'] += 1
+    
+    def _format_error_time(self) -> str:
+        """Format the current time for error records, reusing the string within a second"""
+        sec = int(time.time())
+        if sec != self._last_fmt_sec:
+            self._last_fmt_str = datetime.fromtimestamp(sec).strftime('%Y-%m-%d %H:%M:%S')
+            self._last_fmt_sec = sec
+        return self._last_fmt_str
+    
+    def _get_semantic_cache(self) -> Optional[SemanticCache]:
+        """Get the semantic cache, sharing the search engine's embedding model"""
+        if self.semantic_cache is None:
+            search_engine = self.bot.search_engine
+            if search_engine and search_engine.embedding_model:
+                self.semantic_cache = SemanticCache(
+                    search_engine.embedding_model,
+                    threshold=Config.SEMANTIC_CACHE_THRESHOLD
+                )
+        return self.semantic_cache
     
     def _generate_cache_key(self, question: str) -> str:
         """Generate a cache key for a question"""
-        normalized = question.lower().strip()
-        return hashlib.md5(normalized.encode()).hexdigest()
+        return _question_cache_key(question)
     
     @tasks.loop(seconds=30)
     async def monitor_connection(self):
@@ -353,26 +479,29 @@ class ElderScrollsEvents(commands.Cog):
             # Check latency
             latency = self.bot.latency * 1000
             if latency > 1000:  # More than 1 second
-                logger.warning(f"High latency detected: {latency:.0f}ms")
+                logger.warning("High latency detected: %.0fms", latency)
                 self.bot.connection_issues += 1
             
             # Check memory usage
-            try:
-                import psutil
-                process = psutil.Process()
-                memory_mb = process.memory_info().rss / 1024 / 1024
+            memory_mb = self._get_memory_mb()
+            if memory_mb is not None:
                 self.bot.memory_usage_history.append(memory_mb)
                 
                 if memory_mb > 500:  # More than 500MB
-                    logger.warning(f"High memory usage: {memory_mb:.1f}MB")
-            except ImportError:
-                pass
+                    logger.warning("High memory usage: %.1fMB", memory_mb)
             
             # Update last heartbeat
             self.last_heartbeat = current_time
             
         except Exception as e:
-            logger.error(f"Error during connection monitoring: {e}")
+            logger.error("Error during connection monitoring: %s", e)
+    
+    def _get_memory_mb(self) -> Optional[float]:
+        """Get current RSS in MB, or None when psutil is missing"""
+        # resource's ru_maxrss is no stand-in: it is the peak, not the current, RSS
+        if self._process:
+            return self._process.memory_info().rss / 1024 / 1024
+        return None
     
     @monitor_connection.before_loop
     async def before_monitor_connection(self):
@@ -386,33 +515,32 @@ class ElderScrollsEvents(commands.Cog):
             current_time = time.time()
             cutoff_time = current_time - 3600  # 1 hour ago
             
-            # Clean up user activity
-            expired_users = [
-                user_id for user_id, data in self.user_activity.items()
-                if data['last_activity'] < cutoff_time
-            ]
-            for user_id in expired_users:
-                del self.user_activity[user_id]
-            
-            # Clean up guild activity
-            expired_guilds = [
-                guild_id for guild_id, data in self.guild_activity.items()
-                if data['last_activity'] < cutoff_time
-            ]
-            for guild_id in expired_guilds:
-                del self.guild_activity[guild_id]
+            # Clean up user and guild activity, one partition at a time
+            expired_users = self._prune_activity(self.user_activity, cutoff_time)
+            expired_guilds = self._prune_activity(self.guild_activity, cutoff_time)
             
             # Clean up old messages from history
             cutoff_timestamp = current_time - 1800  # 30 minutes ago
             self.message_history = deque(
-                [msg for msg in self.message_history if msg['timestamp'] > cutoff_timestamp],
+                [msg for msg in self.message_history if msg.timestamp > cutoff_timestamp],
                 maxlen=1000
             )
             
-            logger.debug(f"Cleaned up activity data: {len(expired_users)} users, {len(expired_guilds)} guilds")
+            logger.debug("Cleaned up activity data: %s users, %s guilds", expired_users, expired_guilds)
             
         except Exception as e:
-            logger.error(f"Error during activity cleanup: {e}")
+            logger.error("Error during activity cleanup: %s", e)
+    
+    @staticmethod
+    def _prune_activity(partitions: List[defaultdict], cutoff_time: float) -> int:
+        """Remove entries idle since before the cutoff, returning how many were removed"""
+        removed = 0
+        for partition in partitions:
+            expired = [key for key, data in partition.items() if data['last_activity'] < cutoff_time]
+            for key in expired:
+                del partition[key]
+            removed += len(expired)
+        return removed
     
     @cleanup_activity_data.before_loop
     async def before_cleanup_activity_data(self):
@@ -425,19 +553,19 @@ class ElderScrollsEvents(commands.Cog):
         
         # Calculate active users (active in last 10 minutes)
         active_users = sum(
-            1 for data in self.user_activity.values()
+            1 for partition in self.user_activity for data in partition.values()
             if current_time - data['last_activity'] < 600
         )
         
         # Calculate active guilds (active in last 10 minutes)
         active_guilds = sum(
-            1 for data in self.guild_activity.values()
+            1 for partition in self.guild_activity for data in partition.values()
             if current_time - data['last_activity'] < 600
         )
         
         return {
-            'total_users_tracked': len(self.user_activity),
-            'total_guilds_tracked': len(self.guild_activity),
+            'total_users_tracked': sum(len(partition) for partition in self.user_activity),
+            'total_guilds_tracked': sum(len(partition) for partition in self.guild_activity),
             'active_users': active_users,
             'active_guilds': active_guilds,
             'total_events_processed': self.event_count,
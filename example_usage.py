@@ -6,10 +6,6 @@ This script demonstrates how to use the bot's search and LLM capabilities progra
 
 import asyncio
 import logging
-import nest_asyncio
-
-# Patch asyncio to allow nested event loops
-nest_asyncio.apply()
 
 from config import Config
 from online_search import OnlineSearchEngine
@@ -35,7 +31,7 @@ async def example_search_and_answer():
         await search_engine.initialize()
         
         llm_client = LLMClientFactory.create_client()
-        rag_processor = RAGProcessor(llm_client)
+        rag_processor = RAGProcessor(llm_client, search_engine.embedding_model)
         
         print("✅ Components initialized successfully")
         
@@ -96,11 +92,12 @@ async def example_search_and_answer():
         
         # Cleanup
         await search_engine.close()
+        await rag_processor.close()
         print("\n✅ Example completed successfully")
         
     except Exception as e:
         print(f"❌ Example failed: {e}")
-        logger.error(f"Example failed: {e}")
+        logger.error("Example failed: %s", e)
 
 async def example_custom_search():
     """Example of custom search functionality"""
@@ -132,7 +129,7 @@ async def example_custom_search():
     except Exception as e:
         print(f"❌ Custom search failed: {e}")
 
-def example_llm_only():
+async def example_llm_only():
     """Example of using LLM client directly"""
     
     print("\n🤖 LLM Client Example")
@@ -146,11 +143,13 @@ def example_llm_only():
         Please provide a brief overview of the different races in Tamriel. Provide direct, confident answers without mentioning what information may or may not be in the context."""
         
         print("Sending prompt to LLM...")
-        response = llm_client.generate_response(prompt)
+        response = await llm_client.generate_response(prompt)
         
         print("Response:")
         print(response)
         
+        await llm_client.close()
+        
     except Exception as e:
         print(f"❌ LLM example failed: {e}")
 
@@ -171,7 +170,7 @@ async def main():
     # Run examples
     await example_search_and_answer()
     await example_custom_search()
-    example_llm_only()
+    await example_llm_only()
     
     print("\n🎉 All examples completed!")
     print("\nYou can now integrate these components into your own applications.")
@@ -0,0 +1,93 @@
+import sqlite3
+import logging
+import threading
+import time
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class HTTPCache:
+    """SQLite store of response bodies and their validators, for conditional GET requests
+
+    Reads and writes block on disk, so callers on the event loop run them in a worker thread;
+    one lock serializes the threads' use of the shared connection.
+    """
+
+    # Writes between prunes of expired and excess entries
+    PRUNE_INTERVAL = 100
+
+    def __init__(self, path: str, max_entries: int, max_age: float):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(responses)")}
+        if columns and 'stored_at' not in columns:
+            # Written before entries were timestamped; it is only a cache, so start over
+            self.conn.execute("DROP TABLE responses")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body BLOB, stored_at REAL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS responses_stored_at ON responses (stored_at)")
+        self.prune()
+
+    def get(self, url: str) -> Optional[Tuple[Optional[str], Optional[str], bytes]]:
+        """Get (etag, last_modified, body) stored for a URL"""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+
+    @staticmethod
+    def validator_headers(entry: Optional[Tuple[Optional[str], Optional[str], bytes]]) -> dict:
+        """Build If-None-Match / If-Modified-Since headers from an entry returned by get()"""
+        if entry is None:
+            return {}
+
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def set(self, url: str, etag: Optional[str], last_modified: Optional[str], body: bytes) -> None:
+        """Store a response; only responses carrying a validator are worth keeping"""
+        if not etag and not last_modified:
+            return
+
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (url, etag, last_modified, body, stored_at) VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, body, time.time())
+            )
+            self.conn.commit()
+            self._writes += 1
+            if self._writes < self.PRUNE_INTERVAL:
+                return
+            self._writes = 0
+        self.prune()
+
+    def prune(self) -> None:
+        """Drop entries older than max_age, then the oldest beyond max_entries"""
+        with self._lock:
+            expired = self.conn.execute(
+                "DELETE FROM responses WHERE stored_at < ?", (time.time() - self.max_age,)
+            ).rowcount
+            excess = self.conn.execute(
+                "DELETE FROM responses WHERE url IN "
+                "(SELECT url FROM responses ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            ).rowcount
+            self.conn.commit()
+        if expired or excess:
+            logger.info("Pruned %s expired and %s excess cached responses", expired, excess)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self.conn.close()
@@ -1,21 +1,128 @@
-import aiohttp
-import json
+import httpx
+import orjson
+import asyncio
+import bisect
+import hashlib
 import subprocess
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, AsyncIterator
 
 from config import Config, LLMBackend
+from semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
+# Fallback replies returned when a backend fails; these are never cached
+CONNECTION_ERROR_RESPONSE = "Sorry, I'm having trouble connecting to my knowledge base right now."
+LOCAL_CONNECTION_ERROR_RESPONSE = "Sorry, I'm having trouble connecting to my local knowledge base right now."
+REQUEST_ERROR_RESPONSE = "Sorry, I encountered an error while processing your request."
+RAG_ERROR_RESPONSE = "Sorry, I encountered an error while processing your question. Please try again."
+FALLBACK_RESPONSES = frozenset({
+    CONNECTION_ERROR_RESPONSE,
+    LOCAL_CONNECTION_ERROR_RESPONSE,
+    REQUEST_ERROR_RESPONSE,
+    RAG_ERROR_RESPONSE
+})
+
+# System instructions shared by every backend
+SYSTEM_PROMPT = "You are an expert on The Elder Scrolls universe. Answer questions based on the provided lore context. Be accurate, concise, and engaging. Provide direct, confident answers without mentioning what information may or may not be in the context."
+
+# Stands in for the user prompt in request templates; each client serializes its
+# template once and splices the JSON-escaped prompt in at this marker
+PROMPT_PLACEHOLDER = "__PROMPT__"
+_PROMPT_PLACEHOLDER_BYTES = PROMPT_PLACEHOLDER.encode()
+
+# Ollama takes one flat prompt, so the system instructions wrap the context
+OLLAMA_PROMPT_TEMPLATE = f"{SYSTEM_PROMPT}\n\nContext: {PROMPT_PLACEHOLDER}\n\nAnswer:"
+
+# Context passage source, inferred from its relevance score: scores above each
+# threshold map to the next source name (bisect lookup instead of an if/elif chain)
+SCORE_THRESHOLDS = (0.4, 0.5, 0.7)
+SOURCE_NAMES = ("Web Search", "Wikipedia", "Hugging Face Dataset", "Elder Scrolls Wiki API")
+
 class LLMClient(ABC):
     """Abstract base class for LLM clients"""
     
+    # Total timeout for a single request, in seconds
+    request_timeout = 30
+    _client: Optional[httpx.AsyncClient] = None
+    _http_version_logged = False
+    _payload_parts: Optional[Dict[bool, Tuple[bytes, bytes]]] = None
+    
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers sent with every request to the backend"""
+        return {"Content-Type": "application/json"}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, creating it on first use so concurrent requests multiplex over one connection"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                headers=self._default_headers(),
+                timeout=self.request_timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return self._client
+    
+    def _log_http_version(self, response: httpx.Response):
+        """Log the negotiated HTTP version once per client"""
+        if not self._http_version_logged:
+            logger.debug("%s negotiated %s", type(self).__name__, response.http_version)
+            self._http_version_logged = True
+    
+    def _payload_template(self, stream: bool) -> Dict[str, Any]:
+        """Request body with PROMPT_PLACEHOLDER inside the string that carries the prompt"""
+        raise NotImplementedError
+    
+    def _build_payload(self, prompt: str, stream: bool) -> bytes:
+        """Serialize the request body by splicing the prompt into the pre-serialized template"""
+        if self._payload_parts is None:
+            self._payload_parts = {}
+        parts = self._payload_parts.get(stream)
+        if parts is None:
+            body = orjson.dumps(self._payload_template(stream))
+            parts = self._payload_parts[stream] = tuple(body.split(_PROMPT_PLACEHOLDER_BYTES, 1))
+        # orjson quotes a bare string; strip the quotes to splice it inside the template's string
+        return parts[0] + orjson.dumps(prompt)[1:-1] + parts[1]
+    
+    async def _post(self, url: str, payload: bytes) -> httpx.Response:
+        """POST a serialized JSON payload through the shared client"""
+        response = await self._get_client().post(url, content=payload)
+        self._log_http_version(response)
+        return response
+    
+    @staticmethod
+    async def _iter_sse_content(response: httpx.Response) -> AsyncIterator[str]:
+        """Yield content deltas from an OpenAI-style server-sent event stream"""
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[6:]
+            if data == "[DONE]":
+                break
+            choices = orjson.loads(data).get("choices")
+            if choices:
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    yield content
+    
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self._client and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
     @abstractmethod
     async def generate_response(self, prompt: str) -> str:
         """Generate a response for the given prompt"""
         pass
+    
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Generate a response as a stream of text chunks"""
+        yield await self.generate_response(prompt)
 
 class OpenRouterClient(LLMClient):
     """Client for OpenRouter API"""
@@ -28,155 +135,237 @@ class OpenRouterClient(LLMClient):
         if not self.api_key:
             raise ValueError("OpenRouter API key is required")
     
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers sent with every request to the backend"""
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://github.com/elder-scrolls-lore-bot",
+            "X-Title": "Elder Scrolls Lore Bot"
+        }
+    
+    def _payload_template(self, stream: bool) -> Dict[str, Any]:
+        """Chat completion request body"""
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": PROMPT_PLACEHOLDER
+                }
+            ],
+            "max_tokens": 1000,
+            "temperature": 0.7,
+            "stream": stream
+        }
+    
     async def generate_response(self, prompt: str) -> str:
         """Generate response using OpenRouter API"""
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://github.com/elder-scrolls-lore-bot",
-                "X-Title": "Elder Scrolls Lore Bot"
-            }
+            payload = self._build_payload(prompt, stream=False)
             
-            payload = {
-                "model": self.model,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are an expert on The Elder Scrolls universe. Answer questions based on the provided lore context. Be accurate, concise, and engaging. Provide direct, confident answers without mentioning what information may or may not be in the context."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "max_tokens": 1000,
-                "temperature": 0.7
-            }
+            response = await self._post(f"{self.base_url}/chat/completions", payload)
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                return result["choices"][0]["message"]["content"]
+            else:
+                error_text = response.text
+                logger.error("OpenRouter API error: %s - %s", response.status_code, error_text)
+                return CONNECTION_ERROR_RESPONSE
+            
+        except httpx.HTTPError as e:
+            logger.error("OpenRouter API request failed: %s", e)
+            return CONNECTION_ERROR_RESPONSE
+        except Exception as e:
+            logger.error("OpenRouter API error: %s", e)
+            return REQUEST_ERROR_RESPONSE
+    
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream response tokens from OpenRouter as they are generated"""
+        # A fallback reply only makes sense before any of the answer has been sent; a failure
+        # part way through is raised so the caller can tell the answer is cut short
+        streamed = False
+        try:
+            payload = self._build_payload(prompt, stream=True)
             
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result["choices"][0]["message"]["content"]
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"OpenRouter API error: {response.status} - {error_text}")
-                        return "Sorry, I'm having trouble connecting to my knowledge base right now."
+            async with self._get_client().stream("POST", f"{self.base_url}/chat/completions", content=payload) as response:
+                self._log_http_version(response)
+                if response.status_code != 200:
+                    error_text = (await response.aread()).decode(errors="replace")
+                    logger.error("OpenRouter API error: %s - %s", response.status_code, error_text)
+                    yield CONNECTION_ERROR_RESPONSE
+                    return
                 
-        except aiohttp.ClientError as e:
-            logger.error(f"OpenRouter API request failed: {e}")
-            return "Sorry, I'm having trouble connecting to my knowledge base right now."
+                async for content in self._iter_sse_content(response):
+                    streamed = True
+                    yield content
+            
+        except httpx.HTTPError as e:
+            logger.error("OpenRouter API request failed: %s", e)
+            if streamed:
+                raise
+            yield CONNECTION_ERROR_RESPONSE
         except Exception as e:
-            logger.error(f"OpenRouter API error: {e}")
-            return "Sorry, I encountered an error while processing your request."
+            logger.error("OpenRouter API error: %s", e)
+            if streamed:
+                raise
+            yield REQUEST_ERROR_RESPONSE
 
 class OllamaClient(LLMClient):
     """Client for Ollama local LLM"""
     
+    request_timeout = 60
+    
     def __init__(self):
         self.base_url = Config.OLLAMA_BASE_URL
         self.model = Config.OLLAMA_MODEL
     
+    def _payload_template(self, stream: bool) -> Dict[str, Any]:
+        """Generate request body"""
+        return {
+            "model": self.model,
+            "prompt": OLLAMA_PROMPT_TEMPLATE,
+            "stream": stream,
+            "options": {
+                "temperature": 0.7,
+                "num_predict": 1000
+            }
+        }
+    
     async def generate_response(self, prompt: str) -> str:
         """Generate response using Ollama API"""
         try:
-            headers = {
-                "Content-Type": "application/json"
-            }
+            payload = self._build_payload(prompt, stream=False)
             
-            payload = {
-                "model": self.model,
-                "prompt": f"""You are an expert on The Elder Scrolls universe. Answer questions based on the provided lore context. Be accurate, concise, and engaging. Provide direct, confident answers without mentioning what information may or may not be in the context.
-
-Context: {prompt}
-
-Answer:""",
-                "stream": False,
-                "options": {
-                    "temperature": 0.7,
-                    "num_predict": 1000
-                }
-            }
+            response = await self._post(f"{self.base_url}/api/generate", payload)
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                return result["response"]
+            else:
+                error_text = response.text
+                logger.error("Ollama API error: %s - %s", response.status_code, error_text)
+                return LOCAL_CONNECTION_ERROR_RESPONSE
             
-            timeout = aiohttp.ClientTimeout(total=60)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    f"{self.base_url}/api/generate",
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result["response"]
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Ollama API error: {response.status} - {error_text}")
-                        return "Sorry, I'm having trouble connecting to my local knowledge base right now."
+        except httpx.HTTPError as e:
+            logger.error("Ollama API request failed: %s", e)
+            return LOCAL_CONNECTION_ERROR_RESPONSE
+        except Exception as e:
+            logger.error("Ollama API error: %s", e)
+            return REQUEST_ERROR_RESPONSE
+    
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream response tokens from Ollama (one JSON object per line)"""
+        streamed = False
+        try:
+            payload = self._build_payload(prompt, stream=True)
+            
+            async with self._get_client().stream("POST", f"{self.base_url}/api/generate", content=payload) as response:
+                if response.status_code != 200:
+                    error_text = (await response.aread()).decode(errors="replace")
+                    logger.error("Ollama API error: %s - %s", response.status_code, error_text)
+                    yield LOCAL_CONNECTION_ERROR_RESPONSE
+                    return
                 
-        except aiohttp.ClientError as e:
-            logger.error(f"Ollama API request failed: {e}")
-            return "Sorry, I'm having trouble connecting to my local knowledge base right now."
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    if chunk.get("response"):
+                        streamed = True
+                        yield chunk["response"]
+                    if chunk.get("done"):
+                        break
+            
+        except httpx.HTTPError as e:
+            logger.error("Ollama API request failed: %s", e)
+            if streamed:
+                raise
+            yield LOCAL_CONNECTION_ERROR_RESPONSE
         except Exception as e:
-            logger.error(f"Ollama API error: {e}")
-            return "Sorry, I encountered an error while processing your request."
+            logger.error("Ollama API error: %s", e)
+            if streamed:
+                raise
+            yield REQUEST_ERROR_RESPONSE
 
 class LMStudioClient(LLMClient):
     """Client for LM Studio local LLM"""
     
+    request_timeout = 60
+    
     def __init__(self):
         self.base_url = Config.LM_STUDIO_BASE_URL
         self.model = Config.LM_STUDIO_MODEL
     
+    def _payload_template(self, stream: bool) -> Dict[str, Any]:
+        """Chat completion request body"""
+        return {
+            "messages": [
+                {
+                    "role": "system",
+                    "content": SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": PROMPT_PLACEHOLDER
+                }
+            ],
+            "temperature": 0.7,
+            "max_tokens": 1000,
+            "stream": stream
+        }
+    
     async def generate_response(self, prompt: str) -> str:
         """Generate response using LM Studio API"""
         try:
-            headers = {
-                "Content-Type": "application/json"
-            }
+            payload = self._build_payload(prompt, stream=False)
             
-            payload = {
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are an expert on The Elder Scrolls universe. Answer questions based on the provided lore context. Be accurate, concise, and engaging. Provide direct, confident answers without mentioning what information may or may not be in the context."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.7,
-                "max_tokens": 1000,
-                "stream": False
-            }
+            response = await self._post(f"{self.base_url}/v1/chat/completions", payload)
+            if response.status_code == 200:
+                result = orjson.loads(response.content)
+                return result["choices"][0]["message"]["content"]
+            else:
+                error_text = response.text
+                logger.error("LM Studio API error: %s - %s", response.status_code, error_text)
+                return LOCAL_CONNECTION_ERROR_RESPONSE
+            
+        except httpx.HTTPError as e:
+            logger.error("LM Studio API request failed: %s", e)
+            return LOCAL_CONNECTION_ERROR_RESPONSE
+        except Exception as e:
+            logger.error("LM Studio API error: %s", e)
+            return REQUEST_ERROR_RESPONSE
+    
+    async def generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream response tokens from LM Studio as they are generated"""
+        streamed = False
+        try:
+            payload = self._build_payload(prompt, stream=True)
             
-            timeout = aiohttp.ClientTimeout(total=60)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    f"{self.base_url}/v1/chat/completions",
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result["choices"][0]["message"]["content"]
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"LM Studio API error: {response.status} - {error_text}")
-                        return "Sorry, I'm having trouble connecting to my local knowledge base right now."
+            async with self._get_client().stream("POST", f"{self.base_url}/v1/chat/completions", content=payload) as response:
+                if response.status_code != 200:
+                    error_text = (await response.aread()).decode(errors="replace")
+                    logger.error("LM Studio API error: %s - %s", response.status_code, error_text)
+                    yield LOCAL_CONNECTION_ERROR_RESPONSE
+                    return
                 
-        except aiohttp.ClientError as e:
-            logger.error(f"LM Studio API request failed: {e}")
-            return "Sorry, I'm having trouble connecting to my local knowledge base right now."
+                async for content in self._iter_sse_content(response):
+                    streamed = True
+                    yield content
+            
+        except httpx.HTTPError as e:
+            logger.error("LM Studio API request failed: %s", e)
+            if streamed:
+                raise
+            yield LOCAL_CONNECTION_ERROR_RESPONSE
         except Exception as e:
-            logger.error(f"LM Studio API error: {e}")
-            return "Sorry, I encountered an error while processing your request."
+            logger.error("LM Studio API error: %s", e)
+            if streamed:
+                raise
+            yield REQUEST_ERROR_RESPONSE
 
 class LLMClientFactory:
     """Factory for creating LLM clients based on configuration"""
@@ -198,8 +387,57 @@ class LLMClientFactory:
 class RAGProcessor:
     """Handles RAG (Retrieval-Augmented Generation) processing with online search results"""
     
-    def __init__(self, llm_client: LLMClient):
+    # Exact-match prompt cache limits
+    EXACT_CACHE_SIZE = 1024
+    EXACT_CACHE_TTL = 3600
+    
+    def __init__(self, llm_client: LLMClient, embedding_model=None):
         self.llm_client = llm_client
+        
+        # Identical prompts (same question and context) skip the LLM entirely
+        self._exact_cache: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        
+        # Answers are reused for paraphrased questions, but only from the same model
+        self.semantic_cache: Optional[SemanticCache] = None
+        self._cache_metadata = {'model': getattr(llm_client, 'model', type(llm_client).__name__)}
+        if embedding_model is not None:
+            self.semantic_cache = SemanticCache(embedding_model, threshold=Config.LLM_CACHE_THRESHOLD, ttl=3600)
+            if Config.LLM_CACHE_PATH and self.semantic_cache.load(Config.LLM_CACHE_PATH, self._cache_metadata):
+                logger.info("Loaded %s cached LLM responses", len(self.semantic_cache))
+    
+    async def close(self):
+        """Persist the response cache and close the underlying LLM client"""
+        if self.semantic_cache and Config.LLM_CACHE_PATH:
+            try:
+                self.semantic_cache.save(Config.LLM_CACHE_PATH, self._cache_metadata)
+            except Exception as e:
+                logger.error("Failed to save LLM response cache: %s", e)
+        await self.llm_client.close()
+    
+    def _prompt_cache_key(self, prompt: str) -> str:
+        """Hash the model and prompt into an exact-match cache key"""
+        return hashlib.sha256((self._cache_metadata['model'] + prompt).encode()).hexdigest()
+    
+    def _get_exact(self, key: str) -> Optional[str]:
+        """Get a cached response for an identical prompt, dropping it if expired"""
+        entry = self._exact_cache.get(key)
+        if entry is None:
+            return None
+        
+        response, cached_at = entry
+        if time.time() - cached_at > self.EXACT_CACHE_TTL:
+            del self._exact_cache[key]
+            return None
+        
+        self._exact_cache.move_to_end(key)
+        return response
+    
+    def _set_exact(self, key: str, response: str):
+        """Cache a response, evicting the least recently used entry when full"""
+        self._exact_cache[key] = (response, time.time())
+        self._exact_cache.move_to_end(key)
+        if len(self._exact_cache) > self.EXACT_CACHE_SIZE:
+            self._exact_cache.popitem(last=False)
     
     def create_rag_prompt(self, question: str, context_passages: list) -> str:
         """Create a RAG prompt with question and retrieved context from online sources"""
@@ -209,21 +447,10 @@ class RAGProcessor:
 I don't have any relevant information about this in my Elder Scrolls knowledge base. I searched multiple online sources including the Elder Scrolls Wiki, Hugging Face datasets, and Wikipedia, but couldn't find specific information about your query. Please try rephrasing your question or ask about a different aspect of Elder Scrolls lore."""
         
         # Format context with source information
-        context_parts = []
-        for i, (passage, score) in enumerate(context_passages):
-            # Determine source based on score
-            if score > 0.7:
-                source = "Elder Scrolls Wiki API"
-            elif score > 0.5:
-                source = "Hugging Face Dataset"
-            elif score > 0.4:
-                source = "Wikipedia"
-            else:
-                source = "Web Search"
-            
-            context_parts.append(f"Context {i+1} (Source: {source}, Relevance: {score:.2f}):\n{passage}")
-        
-        context_text = "\n\n".join(context_parts)
+        context_text = "\n\n".join(
+            f"Context {i+1} (Source: {SOURCE_NAMES[bisect.bisect_left(SCORE_THRESHOLDS, score)]}, Relevance: {score:.2f}):\n{passage}"
+            for i, (passage, score) in enumerate(context_passages)
+        )
         
         prompt = f"""You are an expert on The Elder Scrolls universe. Based on the following context retrieved from online Elder Scrolls lore sources, please answer the question accurately and engagingly.
 
@@ -235,17 +462,76 @@ Please provide a clear, accurate, and engaging answer based on the Elder Scrolls
         
         return prompt
     
-    async def process_question(self, question: str, context_passages: list) -> str:
+    async def _lookup_cached(self, question: str, prompt: str,
+                             question_embedding: Any = None) -> Tuple[Optional[str], str, Any]:
+        """Check the response caches, returning (cached response, prompt key, question embedding)"""
+        # Cheapest tier first: the exact same prompt was answered recently
+        prompt_key = self._prompt_cache_key(prompt)
+        cached_response = self._get_exact(prompt_key)
+        if cached_response:
+            logger.info("Exact LLM cache hit for question: %s...", question[:50])
+            return cached_response, prompt_key, None
+        
+        # Serve paraphrases of previously answered questions without calling the LLM; a caller
+        # that already embedded the question with the same model passes the embedding in
+        if self.semantic_cache:
+            if question_embedding is None:
+                question_embedding = await asyncio.to_thread(self.semantic_cache.encode, question)
+            cached_response = self.semantic_cache.get(question_embedding)
+            if cached_response:
+                logger.info("LLM cache hit for question: %s...", question[:50])
+        
+        return cached_response, prompt_key, question_embedding
+    
+    def _store_response(self, prompt_key: str, question_embedding: Any, response: str):
+        """Cache a generated response unless it is a backend fallback reply"""
+        if response in FALLBACK_RESPONSES:
+            return
+        self._set_exact(prompt_key, response)
+        if self.semantic_cache and question_embedding is not None:
+            self.semantic_cache.set(question_embedding, response)
+    
+    async def process_question(self, question: str, context_passages: list, question_embedding: Any = None) -> str:
         """Process a question using RAG with online search results"""
         try:
             # Create RAG prompt
             prompt = self.create_rag_prompt(question, context_passages)
             
+            cached_response, prompt_key, question_embedding = await self._lookup_cached(question, prompt, question_embedding)
+            if cached_response:
+                return cached_response
+            
             # Generate response using LLM
             response = await self.llm_client.generate_response(prompt)
+            self._store_response(prompt_key, question_embedding, response)
             
             return response
             
         except Exception as e:
-            logger.error(f"RAG processing failed: {e}")
-            return "Sorry, I encountered an error while processing your question. Please try again."
\ No newline at end of file
+            logger.error("RAG processing failed: %s", e)
+            return RAG_ERROR_RESPONSE
+    
+    async def process_question_stream(self, question: str, context_passages: list,
+                                      question_embedding: Any = None) -> AsyncIterator[str]:
+        """Process a question using RAG, yielding the answer in chunks as the LLM generates it"""
+        chunks = []
+        try:
+            # Create RAG prompt
+            prompt = self.create_rag_prompt(question, context_passages)
+            
+            cached_response, prompt_key, question_embedding = await self._lookup_cached(question, prompt, question_embedding)
+            if cached_response:
+                yield cached_response
+                return
+            
+            # Stream response from LLM, caching the full text once complete
+            async for chunk in self.llm_client.generate_stream(prompt):
+                chunks.append(chunk)
+                yield chunk
+            self._store_response(prompt_key, question_embedding, "".join(chunks))
+            
+        except Exception as e:
+            logger.error("RAG processing failed: %s", e)
+            if chunks:
+                raise
+            yield RAG_ERROR_RESPONSE
@@ -0,0 +1,6 @@
+"""User-facing replies shared by the Discord and Telegram front ends"""
+
+NOT_READY_MESSAGE = "⚠️ Bot is still initializing. Please wait a moment and try again."
+NO_RESULTS_MESSAGE = "🤔 I searched multiple online sources but couldn't find specific information about that in the Elder Scrolls lore. Could you try rephrasing your question or ask about something else?"
+TIMEOUT_MESSAGE = "⏰ Sorry, the request took too long to process. Please try again with a simpler question or try later."
+ERROR_MESSAGE = "❌ Sorry, I encountered an error while processing your question. Please try again later."
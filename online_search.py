@@ -1,122 +1,345 @@
 import asyncio
 import aiohttp
 import json
-import time
+import orjson
+import os
+import re
 import logging
-from typing import List, Tuple, Optional, Dict, Any
-from urllib.parse import quote, urljoin
-from bs4 import BeautifulSoup
+import time
+from typing import List, Tuple, Optional, Dict, Any, Sequence
+from collections import OrderedDict
+from urllib.parse import quote, urljoin, urlencode
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    # Pure-Python fallback parser
+    from bs4 import BeautifulSoup
+    HTMLParser = None
 import wikipediaapi
-from sentence_transformers import SentenceTransformer
 from datasets import load_dataset
 import numpy as np
+import faiss
 
 from config import Config
+from embedding_model import get_embedding_model
+from http_cache import HTTPCache
 
 logger = logging.getLogger(__name__)
 
+# Dataset fields checked, in order, for a row's passage text
+TEXT_KEYS = ('text', 'content', 'passage', 'article')
+
+# Terms that mark a Wikipedia page as Elder Scrolls related, matched in one regex scan
+ELDER_SCROLLS_KEYWORDS = ('elder scrolls', 'tamriel', 'skyrim', 'oblivion', 'morrowind', 'cyrodiil')
+ELDER_SCROLLS_PATTERN = re.compile('|'.join(map(re.escape, ELDER_SCROLLS_KEYWORDS)), re.IGNORECASE)
+
+# Elements stripped from scraped pages before extracting text
+NON_CONTENT_TAGS = ('script', 'style', 'nav', 'table')
+
+def html_to_text(html: str) -> str:
+    """Strip tags from an HTML fragment (selectolax when available, BeautifulSoup otherwise)"""
+    if HTMLParser is not None:
+        return HTMLParser(html).text()
+    return BeautifulSoup(html, 'html.parser').get_text()
+
+def find_links(html: str) -> List[Tuple[str, str]]:
+    """Get (href, link text) for every link in a page"""
+    if HTMLParser is not None:
+        return [
+            (node.attributes.get('href') or '', node.text())
+            for node in HTMLParser(html).css('a[href]')
+        ]
+    return [
+        (link.get('href', ''), link.get_text())
+        for link in BeautifulSoup(html, 'html.parser').find_all('a', href=True)
+    ]
+
+def extract_page_content(html: str) -> Optional[str]:
+    """Get the main article text from a wiki page, without navigation, scripts or tables"""
+    if HTMLParser is not None:
+        content_div = HTMLParser(html).css_first('#mw-content-text')
+        if content_div is None:
+            return None
+        for element in content_div.css(','.join(NON_CONTENT_TAGS)):
+            element.decompose()
+        return content_div.text(separator=' ')
+    
+    content_div = BeautifulSoup(html, 'html.parser').find('div', id='mw-content-text')
+    if content_div is None:
+        return None
+    for element in content_div.find_all(list(NON_CONTENT_TAGS)):
+        element.decompose()
+    return content_div.get_text()
+
 class OnlineSearchEngine:
     """Online search engine for Elder Scrolls lore with three-tier search strategy"""
     
+    # Recent search results, keyed on the normalized query
+    RESULT_CACHE_SIZE = 512
+    RESULT_CACHE_TTL = 3600
+    
     def __init__(self):
         self.embedding_model = None
+        self._device = 'cpu'
         self.session = None
-        self.last_request_time = 0
+        
+        # Caps on in-flight requests per site, created in initialize()
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        
+        # Validators and bodies of upstream pages, for conditional GETs
+        self._http_cache: Optional[HTTPCache] = None
+        
+        # Hugging Face corpus, embedded and indexed once and reused for every query
+        self._corpus_texts: List[str] = []
+        self._corpus_index = None
+        self._corpus_task: Optional[asyncio.Task] = None
+        
+        self._result_cache: OrderedDict[str, Tuple[List[Tuple[str, float]], float]] = OrderedDict()
+        
+        # wikipedia-api is synchronous; its calls are always made from worker threads.
+        # Cancelling the awaiting coroutine can't stop a thread, so each request carries its own timeout
+        self._wiki = wikipediaapi.Wikipedia(
+            language='en',
+            extract_format=wikipediaapi.ExtractFormat.WIKI,
+            user_agent=Config.USER_AGENT,
+            timeout=Config.REQUEST_TIMEOUT
+        )
         
     async def initialize(self):
         """Initialize the search engine"""
         try:
-            # Initialize embedding model for similarity search (run in thread to avoid blocking)
-            logger.info(f"Loading embedding model: {Config.EMBEDDING_MODEL}")
-            self.embedding_model = await asyncio.to_thread(SentenceTransformer, Config.EMBEDDING_MODEL)
+            # Shared process-wide embedding model (run in thread to avoid blocking)
+            self.embedding_model = await asyncio.to_thread(get_embedding_model)
+            self._device = self.embedding_model.device.type
+            
+            self._host_limits = {
+                'uesp': asyncio.Semaphore(Config.MAX_CONCURRENT_PER_HOST),
+                'wikipedia': asyncio.Semaphore(Config.MAX_CONCURRENT_PER_HOST)
+            }
             
-            # Initialize aiohttp session for async requests
+            self._http_cache = await asyncio.to_thread(
+                HTTPCache, Config.HTTP_CACHE_PATH, Config.HTTP_CACHE_MAX_ENTRIES, Config.HTTP_CACHE_MAX_AGE
+            )
+            
+            # One pooled session for every source. Idle connections are kept for a minute (aiohttp
+            # defaults to 15s) and DNS answers for five, so back-to-back questions skip the TCP and TLS
+            # handshakes and the DNS lookup
             self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(keepalive_timeout=60, ttl_dns_cache=300),
                 headers={"User-Agent": Config.USER_AGENT},
-                timeout=aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT)
+                timeout=aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT),
+                json_serialize=lambda obj: orjson.dumps(obj).decode()
             )
             
+            # Embed the dataset in the background so startup isn't held up on first run
+            self._corpus_task = asyncio.create_task(self._load_corpus())
+            
             logger.info("Online search engine initialized successfully")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize online search engine: {e}")
+            logger.error("Failed to initialize online search engine: %s", e)
             return False
     
     async def close(self):
         """Close the search engine and cleanup resources"""
+        if self._corpus_task and not self._corpus_task.done():
+            self._corpus_task.cancel()
         if self.session:
             await self.session.close()
+        if self._http_cache:
+            self._http_cache.close()
     
-    async def _rate_limit(self):
-        """Implement rate limiting between requests"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < Config.REQUEST_DELAY:
-            await asyncio.sleep(Config.REQUEST_DELAY - time_since_last)
-        self.last_request_time = time.time()
+    async def _fetch(self, host: str, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[int, Optional[bytes]]:
+        """GET a URL under the host's concurrency cap, revalidating cached copies with ETag / Last-Modified"""
+        cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+        # The SQLite store blocks on disk, so it is only touched from worker threads
+        entry = await asyncio.to_thread(self._http_cache.get, cache_key) if self._http_cache else None
+        headers = HTTPCache.validator_headers(entry)
+        
+        async with self._host_limits[host], self.session.get(url, params=params, headers=headers) as response:
+            if response.status == 304 and entry is not None:
+                # Not modified: reuse the stored body and skip the download
+                return 200, entry[2]
+            if response.status != 200:
+                return response.status, None
+            
+            body = await response.read()
+            if self._http_cache:
+                await asyncio.to_thread(
+                    self._http_cache.set,
+                    cache_key,
+                    response.headers.get('ETag'),
+                    response.headers.get('Last-Modified'),
+                    body
+                )
+            return 200, body
+    
+    async def _load_corpus(self):
+        """Load the dataset corpus and its embeddings into memory"""
+        try:
+            texts, index = await asyncio.to_thread(self._build_corpus)
+            self._corpus_texts = texts
+            self._corpus_index = index
+            logger.info("Hugging Face corpus ready: %s passages", len(texts))
+        except Exception as e:
+            logger.error("Failed to prepare Hugging Face corpus: %s", e)
+    
+    def _build_corpus(self) -> Tuple[List[str], Any]:
+        """Load the corpus texts and its ANN index, building and caching whatever is missing"""
+        # What the cached files were built from; a cache built from anything else is stale
+        metadata = {
+            'model': Config.EMBEDDING_MODEL,
+            'dataset': Config.DATASET_NAME,
+            'dimension': self.embedding_model.get_sentence_embedding_dimension(),
+        }
+        cached = self._load_cached_corpus(metadata)
+        if cached is None:
+            self._discard_corpus_cache()
+            texts, embeddings = self._embed_corpus()
+        else:
+            texts, embeddings = cached
+        
+        index = faiss.read_index(Config.CORPUS_INDEX_PATH) if os.path.exists(Config.CORPUS_INDEX_PATH) else None
+        if index is not None and (index.d != embeddings.shape[1] or index.ntotal != len(texts)):
+            logger.warning("Cached corpus index doesn't match the embeddings; rebuilding it")
+            index = None
+        if index is None:
+            logger.info("Building HNSW index over %s passages...", len(texts))
+            # Vectors are stored as 8-bit scalar-quantized codes: 4x less memory traffic per distance
+            index = faiss.IndexHNSWSQ(embeddings.shape[1], faiss.ScalarQuantizer.QT_8bit, 32, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = 200
+            vectors = np.ascontiguousarray(embeddings, dtype=np.float32)
+            index.train(vectors)
+            index.add(vectors)
+            faiss.write_index(index, Config.CORPUS_INDEX_PATH)
+        
+        # Written last, so an interrupted build is redone on the next start
+        if cached is None:
+            with open(Config.CORPUS_META_PATH, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f)
+        
+        index.hnsw.efSearch = Config.HNSW_EF_SEARCH
+        return texts, index
+    
+    def _load_cached_corpus(self, metadata: Dict[str, Any]) -> Optional[Tuple[List[str], np.ndarray]]:
+        """Load the cached corpus texts and embeddings, or None if missing or built with other settings"""
+        if not (os.path.exists(Config.TEXTS_PATH) and os.path.exists(Config.EMBEDDINGS_PATH)):
+            return None
+        
+        try:
+            with open(Config.CORPUS_META_PATH, 'r', encoding='utf-8') as f:
+                cached_metadata = json.load(f)
+        except (OSError, ValueError):
+            cached_metadata = None
+        if cached_metadata != metadata:
+            logger.warning("Cached corpus was built with %s, not %s; rebuilding", cached_metadata, metadata)
+            return None
+        
+        logger.info("Loading cached corpus embeddings from disk...")
+        try:
+            with open(Config.TEXTS_PATH, 'r', encoding='utf-8') as f:
+                texts = json.load(f)
+            # Memory-mapped so startup doesn't copy the whole matrix into RAM
+            embeddings = np.load(Config.EMBEDDINGS_PATH, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            logger.warning("Cached corpus is unreadable (%s); rebuilding", e)
+            return None
+        
+        # A partly written or mismatched pair would map passages to the wrong vectors
+        if embeddings.shape != (len(texts), metadata['dimension']):
+            logger.warning(
+                "Cached corpus embeddings have shape %s for %s texts of dimension %s; rebuilding",
+                embeddings.shape, len(texts), metadata['dimension']
+            )
+            return None
+        return texts, embeddings
+    
+    @staticmethod
+    def _discard_corpus_cache():
+        """Delete the cached corpus files, so none of them outlives a rebuild"""
+        for path in (Config.CORPUS_META_PATH, Config.CORPUS_INDEX_PATH, Config.TEXTS_PATH, Config.EMBEDDINGS_PATH):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def _embed_corpus(self) -> Tuple[List[str], np.ndarray]:
+        """Embed the dataset and cache the texts and embeddings on disk"""
+        logger.info("Embedding dataset %s (first run only)...", Config.DATASET_NAME)
+        # Streamed so rows are read shard by shard instead of materialising the whole dataset
+        texts = self._extract_texts(load_dataset(Config.DATASET_NAME, streaming=True))
+        embeddings = self.embedding_model.encode(
+            texts,
+            batch_size=256 if self._device == 'cuda' else 64,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=True
+        ).astype(np.float32)
+        
+        with open(Config.TEXTS_PATH, 'w', encoding='utf-8') as f:
+            json.dump(texts, f, ensure_ascii=False)
+        np.save(Config.EMBEDDINGS_PATH, embeddings)
+        
+        return texts, embeddings
+    
+    @classmethod
+    def _extract_texts(cls, dataset) -> List[str]:
+        """Extract text passages from every split of a (streaming) dataset"""
+        texts = []
+        for split in dataset.values():
+            for item in split:
+                text = cls._extract_text(item)
+                if text is not None:
+                    texts.append(text)
+        return texts
+    
+    @staticmethod
+    def _extract_text(item: Dict[str, Any]) -> Optional[str]:
+        """Get the passage text from a dataset row"""
+        for key in TEXT_KEYS:
+            if key in item:
+                return item[key]
+        
+        # Find any text-like field
+        for value in item.values():
+            if isinstance(value, str) and len(value) > 50:
+                return value
+        return None
+    
+    def _query_corpus(self, query: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Encode the query and run an approximate nearest-neighbour search over the corpus (blocking)"""
+        # Only the query needs encoding; corpus embeddings are precomputed
+        query_embedding = self.embedding_model.encode([query], normalize_embeddings=True)
+        return self._corpus_index.search(query_embedding.astype(np.float32), Config.TOP_K_RESULTS)
     
     async def search_huggingface_datasets(self, query: str) -> List[Tuple[str, float]]:
         """Search the Elder Scrolls Wiki dataset via Hugging Face Datasets API"""
         try:
-            await self._rate_limit()
-            
-            logger.info(f"Searching Hugging Face dataset for: {query}")
-            
-            # Load dataset from Hugging Face (run in thread to avoid blocking)
-            dataset = await asyncio.to_thread(load_dataset, Config.DATASET_NAME)
-            
-            # Extract text passages
-            texts = []
-            for split in dataset.keys():
-                for item in dataset[split]:
-                    if 'text' in item:
-                        texts.append(item['text'])
-                    elif 'content' in item:
-                        texts.append(item['content'])
-                    elif 'passage' in item:
-                        texts.append(item['passage'])
-                    elif 'article' in item:
-                        texts.append(item['article'])
-                    else:
-                        # Find any text-like field
-                        for key, value in item.items():
-                            if isinstance(value, str) and len(value) > 50:
-                                texts.append(value)
-                                break
-            
-            if not texts:
-                logger.warning("No texts found in Hugging Face dataset")
-                return []
+            logger.info("Searching Hugging Face dataset for: %s", query)
             
-            # Create embeddings for query and texts (run in thread to avoid blocking)
-            query_embedding = await asyncio.to_thread(self.embedding_model.encode, [query])
-            text_embeddings = await asyncio.to_thread(self.embedding_model.encode, texts)
-            
-            # Calculate similarities
-            similarities = np.dot(text_embeddings, query_embedding.T).flatten()
+            texts = self._corpus_texts
+            if self._corpus_index is None or not texts:
+                logger.warning("Hugging Face corpus not ready yet")
+                return []
             
-            # Get top results
-            top_indices = np.argsort(similarities)[::-1][:Config.TOP_K_RESULTS]
+            # Encoding and graph search are CPU-bound, so both run in a worker thread
+            scores, indices = await asyncio.to_thread(self._query_corpus, query)
             
             results = []
-            for idx in top_indices:
-                if similarities[idx] > 0.1:  # Minimum similarity threshold
-                    results.append((texts[idx], float(similarities[idx])))
+            for score, idx in zip(scores[0], indices[0]):
+                if idx >= 0 and score > 0.1:  # Minimum similarity threshold
+                    results.append((texts[idx], float(score)))
             
-            logger.info(f"Found {len(results)} relevant passages from Hugging Face dataset")
+            logger.info("Found %s relevant passages from Hugging Face dataset", len(results))
             return results
             
         except Exception as e:
-            logger.error(f"Error searching Hugging Face dataset: {e}")
+            logger.error("Error searching Hugging Face dataset: %s", e)
             return []
     
     async def search_uesp_wiki(self, query: str) -> List[Tuple[str, float]]:
         """Search the Elder Scrolls Wiki (UESP) via API"""
         try:
-            await self._rate_limit()
-            
-            logger.info(f"Searching UESP Wiki for: {query}")
+            logger.info("Searching UESP Wiki for: %s", query)
             
             # Search UESP using their search API
             search_params = {
@@ -128,48 +351,38 @@ class OnlineSearchEngine:
                 'srnamespace': 0  # Main namespace
             }
             
-            async with self.session.get(Config.UESP_API_BASE_URL, params=search_params) as response:
-                if response.status != 200:
-                    logger.warning(f"UESP API returned status {response.status}")
-                    return []
-                
-                data = await response.json()
-                
-                if 'query' not in data or 'search' not in data['query']:
-                    logger.warning("No search results from UESP API")
-                    return []
-                
-                results = []
-                for item in data['query']['search']:
-                    # Extract relevant content from search result
-                    content = item.get('snippet', '')
-                    if len(content) >= Config.MIN_CONTENT_LENGTH:
-                        # Clean HTML tags
-                        soup = BeautifulSoup(content, 'html.parser')
-                        clean_content = soup.get_text()
-                        if len(clean_content) >= Config.MIN_CONTENT_LENGTH:
-                            results.append((clean_content, 0.8))  # Default score for API results
-                
-                logger.info(f"Found {len(results)} relevant passages from UESP Wiki")
-                return results
-                
+            status, body = await self._fetch('uesp', Config.UESP_API_BASE_URL, search_params)
+            if status != 200:
+                logger.warning("UESP API returned status %s", status)
+                return []
+            
+            data = orjson.loads(body)
+            
+            if 'query' not in data or 'search' not in data['query']:
+                logger.warning("No search results from UESP API")
+                return []
+            
+            results = []
+            for item in data['query']['search']:
+                # Extract relevant content from search result
+                content = item.get('snippet', '')
+                if len(content) >= Config.MIN_CONTENT_LENGTH:
+                    # Clean HTML tags
+                    clean_content = html_to_text(content)
+                    if len(clean_content) >= Config.MIN_CONTENT_LENGTH:
+                        results.append((clean_content, 0.8))  # Default score for API results
+            
+            logger.info("Found %s relevant passages from UESP Wiki", len(results))
+            return results
+            
         except Exception as e:
-            logger.error(f"Error searching UESP Wiki: {e}")
+            logger.error("Error searching UESP Wiki: %s", e)
             return []
     
     async def search_wikipedia_elder_scrolls(self, query: str) -> List[Tuple[str, float]]:
         """Search Wikipedia for Elder Scrolls related content"""
         try:
-            await self._rate_limit()
-            
-            logger.info(f"Searching Wikipedia for Elder Scrolls content: {query}")
-            
-            # Use wikipedia-api to search for Elder Scrolls content
-            wiki = wikipediaapi.Wikipedia(
-                language='en',
-                extract_format=wikipediaapi.ExtractFormat.WIKI,
-                user_agent=Config.USER_AGENT
-            )
+            logger.info("Searching Wikipedia for Elder Scrolls content: %s", query)
             
             # Search for Elder Scrolls related pages using Wikipedia's search API
             search_query = f"Elder Scrolls {query}"
@@ -185,133 +398,197 @@ class OnlineSearchEngine:
                 'srnamespace': 0  # Main namespace only
             }
             
-            async with self.session.get(search_url, params=params) as response:
-                if response.status != 200:
-                    logger.warning(f"Wikipedia search API returned status {response.status}")
-                    return []
-                
-                data = await response.json()
-                search_results = data.get('query', {}).get('search', [])
+            status, body = await self._fetch('wikipedia', search_url, params)
+            if status != 200:
+                logger.warning("Wikipedia search API returned status %s", status)
+                return []
+            
+            data = orjson.loads(body)
+            search_results = data.get('query', {}).get('search', [])
+            
+            # Page lookups block on HTTP, so fetch the summaries concurrently in worker threads
+            summaries = await asyncio.gather(*(
+                asyncio.to_thread(self._get_wikipedia_summary, result.get('title', ''))
+                for result in search_results
+            ))
             
             results = []
-            for result in search_results:
-                page_title = result.get('title', '')
-                page = wiki.page(page_title)
-                if page.exists() and page.summary:
-                    # Check if content is Elder Scrolls related
-                    if any(keyword in page.summary.lower() for keyword in 
-                          ['elder scrolls', 'tamriel', 'skyrim', 'oblivion', 'morrowind', 'cyrodiil']):
-                        content = page.summary[:Config.MAX_CONTENT_LENGTH]
-                        if len(content) >= Config.MIN_CONTENT_LENGTH:
-                            results.append((content, 0.7))  # Lower score than UESP
-            
-            logger.info(f"Found {len(results)} relevant passages from Wikipedia")
+            for summary in summaries:
+                # Check if content is Elder Scrolls related
+                if summary and ELDER_SCROLLS_PATTERN.search(summary):
+                    content = summary[:Config.MAX_CONTENT_LENGTH]
+                    if len(content) >= Config.MIN_CONTENT_LENGTH:
+                        results.append((content, 0.7))  # Lower score than UESP
+            
+            logger.info("Found %s relevant passages from Wikipedia", len(results))
             return results
             
         except Exception as e:
-            logger.error(f"Error searching Wikipedia: {e}")
+            logger.error("Error searching Wikipedia: %s", e)
             return []
     
+    def _get_wikipedia_summary(self, title: str) -> Optional[str]:
+        """Get a Wikipedia page summary (blocking - call via asyncio.to_thread)"""
+        try:
+            page = self._wiki.page(title)
+            if page.exists():
+                return page.summary
+        except Exception as e:
+            logger.warning("Failed to fetch Wikipedia page %s: %s", title, e)
+        return None
+    
     async def scrape_uesp_pages(self, query: str) -> List[Tuple[str, float]]:
         """Scrape UESP pages for relevant content (fallback method)"""
         try:
-            await self._rate_limit()
-            
-            logger.info(f"Scraping UESP pages for: {query}")
+            logger.info("Scraping UESP pages for: %s", query)
             
             # First, search for relevant pages
             search_url = f"https://en.uesp.net/search.php?search={quote(query)}"
             
-            async with self.session.get(search_url) as response:
-                if response.status != 200:
-                    logger.warning(f"UESP search page returned status {response.status}")
-                    return []
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Find search result links
-                search_results = soup.find_all('a', href=True)
-                relevant_links = []
-                
-                for link in search_results:
-                    href = link.get('href', '')
-                    if href.startswith('/wiki/') and any(keyword in link.get_text().lower() 
-                                                       for keyword in query.lower().split()):
-                        relevant_links.append(href)
-                        if len(relevant_links) >= 3:  # Limit to 3 pages
-                            break
-                
-                results = []
-                for link in relevant_links:
-                    try:
-                        await self._rate_limit()
+            status, body = await self._fetch('uesp', search_url)
+            if status != 200:
+                logger.warning("UESP search page returned status %s", status)
+                return []
+            
+            html = body.decode('utf-8', errors='replace')
+            
+            # Find search result links
+            search_results = find_links(html)
+            relevant_links = []
+            
+            # One case-insensitive pass per link instead of a substring scan per query word
+            query_words = query.split()
+            if not query_words:
+                return []
+            query_pattern = re.compile('|'.join(map(re.escape, query_words)), re.IGNORECASE)
+            
+            for href, link_text in search_results:
+                if href.startswith('/wiki/') and query_pattern.search(link_text):
+                    relevant_links.append(href)
+                    if len(relevant_links) >= 3:  # Limit to 3 pages
+                        break
+            
+            results = []
+            for link in relevant_links:
+                try:
+                    full_url = urljoin("https://en.uesp.net", link)
+                    status, page_body = await self._fetch('uesp', full_url)
+                    if status == 200:
+                        page_html = page_body.decode('utf-8', errors='replace')
                         
-                        full_url = urljoin("https://en.uesp.net", link)
-                        async with self.session.get(full_url) as page_response:
-                            if page_response.status == 200:
-                                page_html = await page_response.text()
-                                page_soup = BeautifulSoup(page_html, 'html.parser')
-                                
-                                # Extract main content
-                                content_div = page_soup.find('div', id='mw-content-text')
-                                if content_div:
-                                    # Remove navigation and other non-content elements
-                                    for element in content_div.find_all(['script', 'style', 'nav', 'table']):
-                                        element.decompose()
-                                    
-                                    content = content_div.get_text()
-                                    # Clean up whitespace
-                                    content = ' '.join(content.split())
-                                    
-                                    if len(content) >= Config.MIN_CONTENT_LENGTH:
-                                        content = content[:Config.MAX_CONTENT_LENGTH]
-                                        results.append((content, 0.6))  # Lower score for scraped content
-                    
-                    except Exception as e:
-                        logger.warning(f"Error scraping page {link}: {e}")
-                        continue
-                
-                logger.info(f"Found {len(results)} relevant passages from scraped UESP pages")
-                return results
+                        # Extract main content
+                        content = extract_page_content(page_html)
+                        if content:
+                            # Clean up whitespace
+                            content = ' '.join(content.split())
+                            
+                            if len(content) >= Config.MIN_CONTENT_LENGTH:
+                                content = content[:Config.MAX_CONTENT_LENGTH]
+                                results.append((content, 0.6))  # Lower score for scraped content
                 
+                except Exception as e:
+                    logger.warning("Error scraping page %s: %s", link, e)
+                    continue
+            
+            logger.info("Found %s relevant passages from scraped UESP pages", len(results))
+            return results
+            
         except Exception as e:
-            logger.error(f"Error scraping UESP pages: {e}")
+            logger.error("Error scraping UESP pages: %s", e)
             return []
     
-    async def search(self, query: str) -> List[Tuple[str, float]]:
-        """Main search method implementing three-tier strategy"""
-        all_results = []
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Normalize a query so trivially different phrasings share a cache entry"""
+        return " ".join(query.lower().split())
+    
+    def _get_cached_results(self, key: str) -> Optional[List[Tuple[str, float]]]:
+        """Get a fresh cached result list for a normalized query, dropping it if expired"""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
         
-        # Tier 1: Try Hugging Face Datasets API
-        logger.info("Tier 1: Searching Hugging Face Datasets API")
-        hf_results = await self.search_huggingface_datasets(query)
-        all_results.extend(hf_results)
+        results, cached_at = entry
+        if time.time() - cached_at > self.RESULT_CACHE_TTL:
+            del self._result_cache[key]
+            return None
         
-        # If we have enough good results, return them
-        if len([r for r in all_results if r[1] > 0.5]) >= Config.TOP_K_RESULTS:
-            logger.info("Sufficient results found from Hugging Face dataset")
-            return sorted(all_results, key=lambda x: x[1], reverse=True)[:Config.TOP_K_RESULTS]
+        self._result_cache.move_to_end(key)
+        return results
+    
+    async def search(self, query: str, related_queries: Sequence[str] = ()) -> List[Tuple[str, float]]:
+        """Main search method, serving repeated questions from the result cache
         
-        # Tier 2: Try Elder Scrolls Wiki API
-        logger.info("Tier 2: Searching Elder Scrolls Wiki API")
-        uesp_results = await self.search_uesp_wiki(query)
-        all_results.extend(uesp_results)
+        Cached results of related_queries (such as names mentioned in the question, searched ahead
+        of time) are counted as already found, so the online sources are only asked for the rest.
+        """
+        key = self._normalize_query(query)
+        results = self._get_cached_results(key)
+        if results is not None:
+            logger.info("Search cache hit for: %s", query)
+            return list(results)
         
-        # Check if we have enough results
-        if len([r for r in all_results if r[1] > 0.4]) >= Config.TOP_K_RESULTS:
-            logger.info("Sufficient results found from API sources")
-            return sorted(all_results, key=lambda x: x[1], reverse=True)[:Config.TOP_K_RESULTS]
+        known_results = [
+            result
+            for related_query in related_queries
+            for result in self._get_cached_results(self._normalize_query(related_query)) or ()
+        ]
+        if known_results:
+            logger.info("Reusing %s cached passages for: %s", len(known_results), query)
         
-        # Tier 3: Try Wikipedia for Elder Scrolls content
-        logger.info("Tier 3: Searching Wikipedia for Elder Scrolls content")
-        wiki_results = await self.search_wikipedia_elder_scrolls(query)
-        all_results.extend(wiki_results)
+        results = await self._search_sources(query, known_results)
+        
+        # Empty results are usually a transient upstream failure, so they aren't cached
+        if results:
+            self._result_cache[key] = (results, time.time())
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return list(results)
+    
+    @staticmethod
+    def _top_results(results: List[Tuple[str, float]]) -> List[Tuple[str, float]]:
+        """Get the highest-scoring distinct passages, best first"""
+        best = {}
+        for passage, score in results:
+            best[passage] = max(score, best.get(passage, score))
+        return sorted(best.items(), key=lambda x: x[1], reverse=True)[:Config.TOP_K_RESULTS]
+    
+    async def _search_sources(self, query: str, known_results: Sequence[Tuple[str, float]] = ()) -> List[Tuple[str, float]]:
+        """Query the online sources: tiers 1-3 run concurrently, scraping is the fallback"""
+        all_results = list(known_results)
+        
+        # Passages already in hand may be enough on their own
+        if len([r for r in all_results if r[1] > 0.5]) >= Config.TOP_K_RESULTS:
+            logger.info("Sufficient high-relevance results already cached")
+            return self._top_results(all_results)
+        
+        # Tiers 1-3: Hugging Face dataset, Elder Scrolls Wiki API and Wikipedia in parallel,
+        # so latency is the slowest source rather than the sum of all three
+        logger.info("Tiers 1-3: Searching Hugging Face dataset, UESP Wiki API and Wikipedia concurrently")
+        tasks = [
+            asyncio.create_task(search_func(query))
+            for search_func in (
+                self.search_huggingface_datasets,
+                self.search_uesp_wiki,
+                self.search_wikipedia_elder_scrolls
+            )
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                all_results.extend(await next_done)
+                
+                # Stop waiting on slower sources once there are enough strong results
+                if len([r for r in all_results if r[1] > 0.5]) >= Config.TOP_K_RESULTS:
+                    logger.info("Sufficient high-relevance results found")
+                    return self._top_results(all_results)
+        finally:
+            for task in tasks:
+                task.cancel()
         
         # Check if we have enough results
         if len([r for r in all_results if r[1] > 0.3]) >= Config.TOP_K_RESULTS:
-            logger.info("Sufficient results found including Wikipedia")
-            return sorted(all_results, key=lambda x: x[1], reverse=True)[:Config.TOP_K_RESULTS]
+            logger.info("Sufficient results found from API sources")
+            return self._top_results(all_results)
         
         # Tier 4: Fallback to polite scraping
         logger.info("Tier 4: Fallback to polite scraping")
@@ -319,8 +596,8 @@ class OnlineSearchEngine:
         all_results.extend(scrape_results)
         
         # Return top results
-        final_results = sorted(all_results, key=lambda x: x[1], reverse=True)[:Config.TOP_K_RESULTS]
-        logger.info(f"Final search results: {len(final_results)} passages found")
+        final_results = self._top_results(all_results)
+        logger.info("Final search results: %s passages found", len(final_results))
         
         return final_results
     
@@ -351,5 +628,5 @@ class OnlineSearchEngine:
             return content[:max_length] + "..." if len(content) > max_length else content
             
         except Exception as e:
-            logger.error(f"Error extracting snippet: {e}")
+            logger.error("Error extracting snippet: %s", e)
             return content[:max_length] + "..." if len(content) > max_length else content
\ No newline at end of file
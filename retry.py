@@ -0,0 +1,67 @@
+"""
+Retry decorator shared by the bot and its tests
+"""
+
+import asyncio
+import logging
+import random
+import time
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+# Failures worth retrying by default (ConnectionError and TimeoutError are OSErrors); anything else is raised at once
+TRANSIENT_ERRORS = (OSError, asyncio.TimeoutError)
+
+def retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=10.0, retry_on=TRANSIENT_ERRORS,
+                       give_up_on=(), server_delay=None, total_timeout=None):
+    """Decorator to retry async functions on transient errors with exponential backoff
+    
+    Errors in give_up_on are raised at once even when they subclass one in retry_on. server_delay, when given,
+    maps an error to the wait the server asked for (or None), which then replaces the backoff delay.
+    When total_timeout is set, retrying stops once that many seconds have passed since the first attempt.
+    """
+    # Upper bound of each retry's delay, fixed by the settings
+    backoff_caps = tuple(min(base_delay * (1 << attempt), max_delay) for attempt in range(max_retries))
+    
+    def decorator(func):
+        name = func.__name__
+        
+        async def retry(args, kwargs, error, start):
+            """Back off and retry after the first attempt failed with error"""
+            for attempt in range(max_retries):
+                delay = server_delay(error) if server_delay else None
+                if delay is None:
+                    # Full jitter: a random delay up to the exponential backoff cap, so callers that
+                    # failed together don't retry in lockstep
+                    delay = random.uniform(0, backoff_caps[attempt])
+                if total_timeout is not None:
+                    remaining = total_timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        break
+                    delay = min(delay, remaining)
+                logger.warning("Attempt %s failed for %s: %s. Retrying in %.1fs...", attempt + 1, name, error, delay)
+                await asyncio.sleep(delay)
+                
+                try:
+                    return await func(*args, **kwargs)
+                except give_up_on:
+                    raise
+                except retry_on as e:
+                    error = e
+            
+            logger.error("Final attempt failed for %s: %s", name, error)
+            raise error
+        
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            # Fast path: a call that succeeds first time never enters the retry loop
+            start = time.monotonic()
+            try:
+                return await func(*args, **kwargs)
+            except give_up_on:
+                raise
+            except retry_on as e:
+                return await retry(args, kwargs, e, start)
+        return wrapper
+    return decorator
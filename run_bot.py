@@ -7,7 +7,10 @@ Provides an easy way to run the optimized bot with proper error handling.
 import os
 import sys
 import asyncio
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Add the current directory to Python path
@@ -19,15 +22,21 @@ def setup_logging():
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
     
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(logs_dir / "discord_bot.log"),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [
+        logging.FileHandler(logs_dir / "discord_bot.log"),
+        logging.StreamHandler(sys.stdout)
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Log calls only enqueue the record; file and console writes happen on
+    # the listener thread so slow I/O never blocks the event loop
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(log_queue)])
+    listener.start()
+    atexit.register(listener.stop)
 
 def check_environment():
     """Check if required environment variables are set"""
@@ -132,7 +141,7 @@ async def main():
         print("\n🛑 Bot shutdown requested by user")
     except Exception as e:
         print(f"❌ Bot startup failed: {e}")
-        logger.error(f"Bot startup failed: {e}")
+        logger.error("Bot startup failed: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -141,6 +150,13 @@ if __name__ == "__main__":
         print("❌ Python 3.8 or higher is required")
         sys.exit(1)
     
+    # Use uvloop's libuv-backed event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run the bot
     try:
         asyncio.run(main())
@@ -0,0 +1,102 @@
+import os
+import json
+import time
+import logging
+from typing import Any, List, Optional
+
+import faiss
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """Cache that matches entries by embedding similarity instead of exact keys"""
+
+    def __init__(self, embedding_model, threshold: float = 0.92, max_size: int = 1000, ttl: int = 1800):
+        self.embedding_model = embedding_model
+        self.threshold = threshold
+        self.max_size = max_size
+        self.ttl = ttl
+        self.index = None
+        self.values: List[Any] = []
+        self.expires_at: List[float] = []
+
+    def encode(self, text: str) -> np.ndarray:
+        """Embed text as a normalized float32 row vector (CPU-bound, run in a thread)"""
+        embedding = self.embedding_model.encode([text], normalize_embeddings=True)
+        return np.asarray(embedding, dtype='float32')
+
+    def get(self, embedding: np.ndarray) -> Optional[Any]:
+        """Get the value of the most similar entry above the threshold"""
+        if self.index is None or self.index.ntotal == 0:
+            return None
+
+        scores, indices = self.index.search(embedding, 1)
+        idx = int(indices[0][0])
+        if idx < 0 or scores[0][0] < self.threshold:
+            return None
+        if self.expires_at[idx] <= time.time():
+            return None
+
+        return self.values[idx]
+
+    def set(self, embedding: np.ndarray, value: Any, ttl: Optional[int] = None) -> None:
+        """Add an entry, evicting the oldest 10% when the cache is full"""
+        if self.index is None:
+            self.index = faiss.IndexFlatIP(embedding.shape[1])
+
+        if self.index.ntotal >= self.max_size:
+            evict_count = max(1, self.max_size // 10)
+            # Flat indexes compact on removal, so positions stay aligned with the lists
+            self.index.remove_ids(np.arange(evict_count, dtype='int64'))
+            del self.values[:evict_count]
+            del self.expires_at[:evict_count]
+
+        self.index.add(embedding)
+        self.values.append(value)
+        self.expires_at.append(time.time() + (ttl or self.ttl))
+
+    def save(self, path: str, metadata: Optional[dict] = None) -> None:
+        """Persist the index and entries to path.faiss / path.json"""
+        if self.index is None or self.index.ntotal == 0:
+            return
+
+        faiss.write_index(self.index, f"{path}.faiss")
+        with open(f"{path}.json", 'w') as f:
+            json.dump({
+                'metadata': metadata or {},
+                'values': self.values,
+                'expires_at': self.expires_at
+            }, f)
+
+    def load(self, path: str, metadata: Optional[dict] = None) -> bool:
+        """Restore entries saved by save(); skipped if missing or saved with different metadata"""
+        if not (os.path.exists(f"{path}.faiss") and os.path.exists(f"{path}.json")):
+            return False
+
+        try:
+            with open(f"{path}.json") as f:
+                data = json.load(f)
+            if data.get('metadata', {}) != (metadata or {}):
+                logger.info("Ignoring semantic cache at %s: saved with different metadata", path)
+                return False
+
+            self.index = faiss.read_index(f"{path}.faiss")
+            self.values = data['values']
+            self.expires_at = data['expires_at']
+            return True
+
+        except Exception as e:
+            logger.error("Failed to load semantic cache from %s: %s", path, e)
+            self.clear()
+            return False
+
+    def clear(self) -> None:
+        """Clear all cache entries"""
+        if self.index is not None:
+            self.index.reset()
+        self.values.clear()
+        self.expires_at.clear()
+
+    def __len__(self) -> int:
+        return len(self.values)
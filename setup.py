@@ -5,9 +5,15 @@ This script helps users set up the bot with proper configuration
 """
 
 import os
+import io
 import sys
+import asyncio
+import contextlib
+import hashlib
 import subprocess
 import shutil
+from collections import deque
+from importlib import metadata
 from pathlib import Path
 
 def check_python_version():
@@ -19,12 +25,88 @@ def check_python_version():
     print(f"✅ Python version: {sys.version.split()[0]}")
     return True
 
+# Project-specific pip cache, so wheels built once survive across setup runs
+PIP_CACHE_DIR = Path.home() / ".cache" / "elderscrolls-bot-pip"
+
+# Marker recording the requirements that were last installed successfully
+SETUP_CACHE_FILE = Path(".setup_cache")
+
+# Packages whose absence means the environment was reset since the last install
+SENTINEL_PACKAGES = ("discord.py", "sentence-transformers")
+
+# Fully pinned dependency set, regenerated whenever requirements.txt changes with:
+#   uv pip compile requirements.txt --universal --python-version 3.9 -o requirements.lock
+LOCK_FILE = Path("requirements.lock")
+
+def requirement_args():
+    """Get the install arguments: the lockfile without dependency resolution when present, else requirements.txt"""
+    if LOCK_FILE.exists():
+        return ["--no-deps", "-r", str(LOCK_FILE)]
+    return ["-r", "requirements.txt"]
+
+def requirements_hash():
+    """Hash the requirement files together with the interpreter they are installed into"""
+    digest = hashlib.sha256(Path("requirements.txt").read_bytes())
+    if LOCK_FILE.exists():
+        digest.update(LOCK_FILE.read_bytes())
+    digest.update(sys.executable.encode())
+    return digest.hexdigest()
+
+def dependencies_up_to_date(req_hash):
+    """Check whether the current requirements were already installed into this environment"""
+    try:
+        if SETUP_CACHE_FILE.read_text().strip() != req_hash:
+            return False
+        for package in SENTINEL_PACKAGES:
+            metadata.version(package)
+        return True
+    except (OSError, metadata.PackageNotFoundError):
+        return False
+
+def find_uv(env):
+    """Get the command for running uv, installing it with pip if it isn't on PATH"""
+    uv = shutil.which("uv")
+    if uv:
+        return [uv]
+    
+    try:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "uv"], env=env)
+        return [sys.executable, "-m", "uv"]
+    except subprocess.CalledProcessError:
+        return None
+
 def install_dependencies():
     """Install required dependencies"""
+    req_hash = requirements_hash()
+    if dependencies_up_to_date(req_hash):
+        print("✅ Dependencies already up to date")
+        return True
+    
     print("📦 Installing dependencies...")
     
+    PIP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    env = {**os.environ, "PIP_CACHE_DIR": str(PIP_CACHE_DIR)}
+    
+    # With the lockfile every version is already pinned, so the resolver is skipped entirely
+    req_args = requirement_args()
+    
+    # uv resolves and downloads in parallel and reuses its global wheel cache, so prefer it over pip
+    uv = find_uv(env)
+    if uv:
+        try:
+            subprocess.check_call(uv + ["pip", "install", "--python", sys.executable] + req_args, env=env)
+            SETUP_CACHE_FILE.write_text(req_hash)
+            print("✅ Dependencies installed successfully")
+            return True
+        except subprocess.CalledProcessError as e:
+            print(f"⚠️  uv install failed ({e}), falling back to pip")
+    
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+        # A current pip with wheel installed caches built wheels instead of rebuilding sdists every run
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip", "wheel"], env=env)
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--prefer-binary",
+                               "--cache-dir", str(PIP_CACHE_DIR)] + req_args, env=env)
+        SETUP_CACHE_FILE.write_text(req_hash)
         print("✅ Dependencies installed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -43,15 +125,20 @@ def create_env_file():
             print("   Skipping .env file creation")
             return True
     
-    if not env_example.exists():
-        print("❌ .env.example file not found")
-        return False
-    
     try:
-        shutil.copy(env_example, env_file)
+        # Copy into a temporary file and rename it over .env, so an interrupted setup never leaves a
+        # partial file; copyfile uses the kernel's zero-copy path and skips the template's mode bits
+        tmp_file = env_file.with_name(".env.tmp")
+        shutil.copyfile(env_example, tmp_file)
+        # The file will hold bot tokens and API keys, so only the owner may read it
+        os.chmod(tmp_file, 0o600)
+        tmp_file.replace(env_file)
         print("✅ Created .env file from template")
         print("   Please edit .env file with your configuration")
         return True
+    except FileNotFoundError:
+        print("❌ .env.example file not found")
+        return False
     except Exception as e:
         print(f"❌ Failed to create .env file: {e}")
         return False
@@ -82,23 +169,48 @@ def validate_configuration():
         print(f"❌ Configuration validation failed: {e}")
         return False
 
+class OutputTail(io.TextIOBase):
+    """Stream writes through to the terminal, keeping only the last lines for a failure summary"""
+    
+    def __init__(self, stream, max_lines=200):
+        self.stream = stream
+        self.lines = deque(maxlen=max_lines)
+        self._partial = ""
+    
+    def write(self, text):
+        self.stream.write(text)
+        # print() writes in pieces, so only complete lines go into the buffer
+        *complete, self._partial = (self._partial + text).split("\n")
+        self.lines.extend(complete)
+        return len(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def tail(self):
+        """Get the buffered output, oldest line first"""
+        return "\n".join([*self.lines, self._partial])
+
 def run_tests():
     """Run the test suite"""
     print("🧪 Running tests...")
     
     try:
-        result = subprocess.run([sys.executable, "test_bot.py"], capture_output=True, text=True)
+        # Run in this interpreter rather than a child process, so already-imported modules are reused
+        import test_bot
+        
+        # Show progress live; only a bounded tail is kept in memory
+        output = OutputTail(sys.stdout)
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            success = asyncio.run(test_bot.main())
         
-        if result.returncode == 0:
+        if success:
             print("✅ All tests passed")
             return True
         else:
             print("❌ Some tests failed")
-            print("   Test output:")
-            print(result.stdout)
-            if result.stderr:
-                print("   Errors:")
-                print(result.stderr)
+            print("   Last test output:")
+            print(output.tail())
             return False
             
     except Exception as e:
@@ -1,17 +1,27 @@
+from __future__ import annotations
+
 import logging
 from telegram import Update
-from telegram.ext import Application, CommandHandler, MessageHandler, filters, ContextTypes
+from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError
+from telegram.request import HTTPXRequest
 import asyncio
-import nest_asyncio
+import hashlib
+import orjson
+import re
 import time
-from functools import wraps
-
-# Patch asyncio to allow nested event loops
-nest_asyncio.apply()
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, List, Optional, Tuple
 
+import retry
 from config import Config
-from online_search import OnlineSearchEngine
-from llm_client import LLMClientFactory, RAGProcessor
+from messages import NOT_READY_MESSAGE, NO_RESULTS_MESSAGE, TIMEOUT_MESSAGE, ERROR_MESSAGE
+
+# telegram.ext and the search/LLM stack (datasets, faiss, sentence-transformers) are slow to import,
+# so they are imported where first needed; importing this module for ElderScrollsLoreBot stays cheap
+if TYPE_CHECKING:
+    from telegram.ext import ContextTypes
 
 # Configure logging
 logging.basicConfig(
@@ -20,79 +30,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=10.0):
-    """Decorator to retry async functions with exponential backoff"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt == max_retries:
-                        logger.error(f"Final attempt failed for {func.__name__}: {e}")
-                        raise
-                    
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (2 ** attempt), max_delay)
-                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}. Retrying in {delay:.1f}s...")
-                    await asyncio.sleep(delay)
-            
-            raise last_exception
-        return wrapper
-    return decorator
-
-class ElderScrollsLoreBot:
-    """Main Telegram bot class for Elder Scrolls Lore Bot with online search capabilities"""
-    
-    def __init__(self):
-        self.search_engine = None
-        self.rag_processor = None
-        self.initialized = False
-        
-    async def initialize(self):
-        """Initialize the bot components"""
-        try:
-            logger.info("Initializing Elder Scrolls Lore Bot with online search...")
-            
-            # Initialize online search engine
-            self.search_engine = OnlineSearchEngine()
-            if not await self.search_engine.initialize():
-                logger.error("Failed to initialize online search engine")
-                return False
-            
-            # Initialize LLM client and RAG processor
-            llm_client = LLMClientFactory.create_client()
-            self.rag_processor = RAGProcessor(llm_client)
-            
-            self.initialized = True
-            logger.info("Bot initialization completed successfully")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Bot initialization failed: {e}")
-            return False
-    
-    async def cleanup(self):
-        """Cleanup resources when bot shuts down"""
-        if self.search_engine:
-            await self.search_engine.close()
-    
-    @retry_with_backoff(max_retries=Config.MAX_RETRY_ATTEMPTS, base_delay=Config.RETRY_BASE_DELAY, max_delay=Config.RETRY_MAX_DELAY)
-    async def safe_reply(self, message, text, **kwargs):
-        """Safely send a reply with retry logic"""
-        return await message.reply_text(text, **kwargs)
-    
-    @retry_with_backoff(max_retries=Config.MAX_RETRY_ATTEMPTS, base_delay=Config.RETRY_BASE_DELAY, max_delay=Config.RETRY_MAX_DELAY)
-    async def safe_send_chat_action(self, bot, chat_id, action):
-        """Safely send chat action with retry logic"""
-        return await bot.send_chat_action(chat_id=chat_id, action=action)
-    
-    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /start command"""
-        welcome_message = """
+# Static command replies, built once at import (the backend is fixed by the environment)
+WELCOME_MESSAGE = """
 🌟 Welcome to the Elder Scrolls Lore Bot! 🌟
 
 I'm your guide to the vast world of Tamriel and beyond. Ask me anything about:
@@ -111,12 +50,8 @@ Example: `/ask Who is Tiber Septim?`
 
 Use /help for more information.
         """
-        
-        await self.safe_reply(update.message, welcome_message, parse_mode='Markdown')
-    
-    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle /help command"""
-        help_message = """
+
+HELP_MESSAGE = """
 📚 **Elder Scrolls Lore Bot Help** 📚
 
 **Commands:**
@@ -144,15 +79,316 @@ Use /help for more information.
 
 Happy exploring, traveler! 🗡️⚔️
         """.format(backend=Config.get_llm_backend().value)
+
+ASK_USAGE_MESSAGE = "❓ Please provide a question after /ask.\n\nExample: `/ask Who is Tiber Septim?`"
+
+# Settings used on every request, read from Config once (the environment is loaded at import)
+SEARCH_TIMEOUT = Config.SEARCH_TIMEOUT
+LLM_TIMEOUT = Config.LLM_TIMEOUT
+RETRY_SETTINGS = {
+    'max_retries': Config.MAX_RETRY_ATTEMPTS,
+    'base_delay': Config.RETRY_BASE_DELAY,
+    'max_delay': Config.RETRY_MAX_DELAY,
+}
+
+# Longest text Telegram accepts in one message; longer sends fail with BadRequest
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+def split_message(text: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> List[str]:
+    """Split text into parts of at most limit characters, preferring paragraph and line breaks"""
+    parts = []
+    while len(text) > limit:
+        cut = text.rfind("\n\n", 0, limit)
+        if cut <= 0:
+            cut = text.rfind("\n", 0, limit)
+        if cut <= 0:
+            cut = text.rfind(" ", 0, limit)
+        if cut <= 0:
+            cut = limit
+        parts.append(text[:cut])
+        text = text[cut:].lstrip()
+    if text:
+        parts.append(text)
+    return parts
+
+# Runs of capitalized words, which in lore questions are mostly names ("Tiber Septim", "Nine Divines")
+ENTITY_PATTERN = re.compile(r"\b[A-Z][\w'-]*(?:\s+[A-Z][\w'-]*)*")
+NON_ENTITY_WORDS = frozenset({
+    "who", "what", "when", "where", "why", "how", "which", "is", "are", "was", "were",
+    "do", "does", "did", "can", "tell", "explain", "describe", "compare", "list", "name",
+    "the", "a", "an", "i",
+})
+
+def extract_entities(question: str) -> List[str]:
+    """Get the distinct names mentioned in a question, skipping capitalized question words"""
+    entities = []
+    for match in ENTITY_PATTERN.findall(question):
+        # A sentence-initial question word is capitalized too ("Did Alduin ..."), so drop it
+        words = match.split()
+        while words and words[0].casefold() in NON_ENTITY_WORDS:
+            words.pop(0)
+        entity = " ".join(words)
+        if entity and entity not in entities:
+            entities.append(entity)
+    return entities
+
+# Errors worth retrying: connection problems (including TimedOut) and flood control
+TRANSIENT_ERRORS = (NetworkError, RetryAfter)
+
+def retry_after_seconds(error: RetryAfter) -> float:
+    """Get the wait Telegram asked for, which newer library versions report as a timedelta"""
+    retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return retry_after
+
+def requested_delay(error: Exception) -> Optional[float]:
+    """Get the wait Telegram asked for when error is flood control, None otherwise"""
+    return retry_after_seconds(error) if isinstance(error, RetryAfter) else None
+
+def retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=10.0, retry_on=TRANSIENT_ERRORS):
+    """The shared retry decorator with Telegram's rules: flood control waits as long as asked, and
+    BadRequest (a NetworkError subclass) is raised at once, as resending a rejected request can't succeed"""
+    return retry.retry_with_backoff(max_retries, base_delay, max_delay, retry_on=retry_on,
+                                    give_up_on=(BadRequest,), server_delay=requested_delay)
+
+class TokenBucket:
+    """Paces actions to a steady rate, allowing bursts of up to `capacity`"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+    
+    def try_acquire(self) -> bool:
+        """Take a token if one is available right now, without waiting"""
+        if self._lock.locked():
+            return False
+        self._refill()
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+    
+    def pause(self, seconds: float):
+        """Withhold tokens for the given time, e.g. after the server asks us to back off"""
+        self._refill()
+        self.tokens = min(self.tokens, 0) - seconds * self.rate
+
+class OrjsonRequest(HTTPXRequest):
+    """HTTPX request backend that decodes Telegram's responses with orjson instead of the json module"""
+    
+    @staticmethod
+    def parse_json_payload(payload: bytes):
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError as exc:
+            raise TelegramError("Invalid server response") from exc
+
+class ElderScrollsLoreBot:
+    """Main Telegram bot class for Elder Scrolls Lore Bot with online search capabilities"""
+    
+    # Answers to recently asked questions, keyed on the normalized question text
+    ANSWER_CACHE_SIZE = 1024
+    ANSWER_CACHE_TTL = 3600
+    SEMANTIC_CACHE_SIZE = 10000
+    
+    # Telegram's send limits: ~30 messages/second overall and 20 messages/minute per group
+    SEND_RATE = 30
+    GROUP_SEND_RATE = 20 / 60
+    GROUP_SEND_BURST = 20
+    
+    # Streamed answers are edited into the reply at most this often (Telegram allows about one edit per second per chat)
+    STREAM_EDIT_INTERVAL = 1.0
+    
+    # Seconds a chat's question worker waits for more questions before exiting
+    CHAT_WORKER_IDLE_TIMEOUT = 300
+    
+    # Seconds a typing indicator stays visible (Telegram shows it for up to 5)
+    TYPING_DURATION = 4
+    
+    # Speculative searches for names in a question, run while the LLM writes its answer
+    MAX_PREFETCHES = 2
+    
+    def __init__(self):
+        self.search_engine = None
+        self.rag_processor = None
+        self.initialized = False
+        self._question_slots = None
+        self._llm_slots = None
+        self._answer_cache: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self.semantic_cache = None
+        
+        # Answers being generated, so concurrent askers of the same question share one pipeline run
+        self._inflight: Dict[str, asyncio.Task] = {}
+        
+        # References to fire-and-forget tasks so they aren't garbage collected mid-flight
+        self._background_tasks = set()
+        
+        # Outgoing messages are paced below Telegram's limits instead of reacting to 429s
+        self._send_bucket = TokenBucket(self.SEND_RATE, self.SEND_RATE)
+        self._group_buckets: Dict[int, TokenBucket] = {}
+        
+        # Pending questions per chat, each drained in order by its own worker task
+        self._chat_queues: Dict[int, asyncio.Queue] = {}
+        
+        # When each chat was last sent a typing indicator that is still showing
+        self._last_typing: Dict[int, float] = {}
+        
+        # Names currently being searched ahead of likely follow-up questions
+        self._prefetching = set()
+        
+    async def initialize(self):
+        """Initialize the bot components"""
+        try:
+            logger.info("Initializing Elder Scrolls Lore Bot with online search...")
+            
+            from online_search import OnlineSearchEngine
+            from semantic_cache import SemanticCache
+            from llm_client import LLMClientFactory, RAGProcessor
+            
+            # The search engine and LLM client are independent, so set them up concurrently
+            self.search_engine = OnlineSearchEngine()
+            search_ready, llm_client = await asyncio.gather(
+                self.search_engine.initialize(),
+                asyncio.to_thread(LLMClientFactory.create_client)
+            )
+            if not search_ready:
+                logger.error("Failed to initialize online search engine")
+                return False
+            
+            # Initialize RAG processor
+            self.rag_processor = RAGProcessor(llm_client, self.search_engine.embedding_model)
+            
+            # Matches paraphrases of answered questions, sharing the search engine's embedding model
+            self.semantic_cache = SemanticCache(
+                self.search_engine.embedding_model,
+                threshold=Config.SEMANTIC_CACHE_THRESHOLD,
+                max_size=self.SEMANTIC_CACHE_SIZE,
+                ttl=self.ANSWER_CACHE_TTL
+            )
+            
+            # Excess questions queue here instead of all hitting the search sources at once
+            self._question_slots = asyncio.Semaphore(Config.MAX_CONCURRENT_QUESTIONS)
+            # Separately, LLM calls are capped at the provider's concurrency budget
+            self._llm_slots = asyncio.Semaphore(Config.LLM_MAX_CONCURRENCY)
+            
+            self.initialized = True
+            logger.info("Bot initialization completed successfully")
+            return True
+            
+        except Exception as e:
+            logger.error("Bot initialization failed: %s", e)
+            return False
+    
+    async def cleanup(self):
+        """Cleanup resources when bot shuts down"""
+        if self.search_engine:
+            await self.search_engine.close()
+        if self.rag_processor:
+            await self.rag_processor.close()
+    
+    @retry_with_backoff(**RETRY_SETTINGS)
+    async def safe_reply(self, message, text, **kwargs):
+        """Safely send a reply with retry logic, within Telegram's rate limits"""
+        for bucket in self._rate_buckets(message):
+            await bucket.acquire()
         
-        await self.safe_reply(update.message, help_message, parse_mode='Markdown')
+        try:
+            sent = await message.reply_text(text, **kwargs)
+        except RetryAfter as e:
+            # Hold every send for as long as Telegram asked
+            self._send_bucket.pause(retry_after_seconds(e))
+            raise
+        
+        # A new message clears the chat's typing indicator
+        self._last_typing.pop(message.chat_id, None)
+        return sent
+    
+    @retry_with_backoff(**RETRY_SETTINGS)
+    async def safe_edit(self, sent_message, text, **kwargs):
+        """Safely edit a sent message with retry logic, within Telegram's rate limits"""
+        for bucket in self._rate_buckets(sent_message):
+            await bucket.acquire()
+        
+        try:
+            return await sent_message.edit_text(text, **kwargs)
+        except RetryAfter as e:
+            self._send_bucket.pause(retry_after_seconds(e))
+            raise
+    
+    def _rate_buckets(self, message) -> List[TokenBucket]:
+        """Get the buckets a message to this chat draws from: the group's own, if any, then the global one"""
+        if message.chat.type == 'private':
+            return [self._send_bucket]
+        bucket = self._group_buckets.get(message.chat_id)
+        if bucket is None:
+            bucket = self._group_buckets[message.chat_id] = TokenBucket(self.GROUP_SEND_RATE, self.GROUP_SEND_BURST)
+        return [bucket, self._send_bucket]
+    
+    async def send_reply(self, message, text, **kwargs):
+        """Reply with text of any length, as several messages if it is over Telegram's limit"""
+        # Each part is retried on its own, so a failure never resends parts already delivered
+        for part in split_message(text):
+            await self.safe_reply(message, part, **kwargs)
+    
+    @retry_with_backoff(**RETRY_SETTINGS)
+    async def safe_send_chat_action(self, bot, chat_id, action):
+        """Safely send chat action with retry logic"""
+        return await bot.send_chat_action(chat_id=chat_id, action=action)
+    
+    def _run_in_background(self, coro):
+        """Start a task, keeping a reference to it until it finishes"""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    def start_typing(self, bot, chat_id):
+        """Send the typing indicator in the background so it overlaps with answering the question"""
+        # Skip the call while an earlier indicator is still showing in this chat
+        now = time.monotonic()
+        if now - self._last_typing.get(chat_id, 0) < self.TYPING_DURATION:
+            return
+        self._last_typing[chat_id] = now
+        self._run_in_background(self._send_typing(bot, chat_id))
+    
+    async def _send_typing(self, bot, chat_id):
+        """Send the typing indicator, logging rather than raising on failure"""
+        try:
+            await self.safe_send_chat_action(bot, chat_id, "typing")
+        except Exception as e:
+            logger.warning("Failed to send typing indicator: %s", e)
+    
+    async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /start command"""
+        await self.safe_reply(update.message, WELCOME_MESSAGE, parse_mode='Markdown')
+    
+    async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle /help command"""
+        await self.safe_reply(update.message, HELP_MESSAGE, parse_mode='Markdown')
     
     async def ask_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /ask command"""
         if not self.initialized:
             await self.safe_reply(
                 update.message,
-                "⚠️ Bot is still initializing. Please wait a moment and try again."
+                NOT_READY_MESSAGE
             )
             return
         
@@ -160,97 +396,231 @@ Happy exploring, traveler! 🗡️⚔️
         if not context.args:
             await self.safe_reply(
                 update.message,
-                "❓ Please provide a question after /ask.\n\nExample: `/ask Who is Tiber Septim?`",
+                ASK_USAGE_MESSAGE,
                 parse_mode='Markdown'
             )
             return
         
-        question = " ".join(context.args)
-        
-        # Send typing indicator
-        await self.safe_send_chat_action(context.bot, update.effective_chat.id, "typing")
-        
-        try:
-            # Search for relevant passages using online search engine with timeout
-            context_passages = await asyncio.wait_for(
-                self.search_engine.search(question),
-                timeout=Config.SEARCH_TIMEOUT
-            )
-            
-            if not context_passages:
-                response = "🤔 I searched multiple online sources but couldn't find specific information about that in the Elder Scrolls lore. Could you try rephrasing your question or ask about something else?"
-            else:
-                # Process question using RAG with timeout
-                response = await asyncio.wait_for(
-                    self.rag_processor.process_question(question, context_passages),
-                    timeout=Config.LLM_TIMEOUT
-                )
-            
-            # Send response with retry logic
-            await self.safe_reply(update.message, response)
-            
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout processing question '{question}'")
-            await self.safe_reply(
-                update.message,
-                "⏰ Sorry, the request took too long to process. Please try again with a simpler question or try later."
-            )
-        except Exception as e:
-            logger.error(f"Error processing question '{question}': {e}")
-            await self.safe_reply(
-                update.message,
-                "❌ Sorry, I encountered an error while processing your question. Please try again later."
-            )
+        self._enqueue_question(update.message, context.bot, " ".join(context.args))
     
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle regular messages (treat as questions)"""
         if not self.initialized:
             await self.safe_reply(
                 update.message,
-                "⚠️ Bot is still initializing. Please wait a moment and try again."
+                NOT_READY_MESSAGE
             )
             return
         
-        question = update.message.text
+        self._enqueue_question(update.message, context.bot, update.message.text)
+    
+    def _enqueue_question(self, message, bot, question: str):
+        """Queue a question on its chat's worker, so the handler returns without waiting for the answer"""
+        chat_id = message.chat_id
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = self._chat_queues[chat_id] = asyncio.Queue()
+            self._run_in_background(self._chat_worker(chat_id, queue))
+        queue.put_nowait((message, bot, question))
+    
+    async def _chat_worker(self, chat_id: int, queue: asyncio.Queue):
+        """Answer one chat's questions in the order they arrived, exiting once the chat goes idle"""
+        try:
+            while True:
+                try:
+                    message, bot, question = await asyncio.wait_for(queue.get(), timeout=self.CHAT_WORKER_IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    # A question can land just as the wait times out; keep going if so
+                    if queue.empty():
+                        return
+                    continue
+                try:
+                    await self._answer(message, bot, question)
+                except Exception:
+                    # One failed answer must not stop the chat's later questions from being answered
+                    logger.exception("Failed to answer question '%s' in chat %s", question, chat_id)
+        finally:
+            # However the worker exits, the next question for this chat starts a fresh one
+            if self._chat_queues.get(chat_id) is queue:
+                del self._chat_queues[chat_id]
+            self._last_typing.pop(chat_id, None)
+    
+    async def _answer(self, message, bot, question: str):
+        """Search for context, generate an answer and reply to the message"""
+        # Send typing indicator without waiting for Telegram to acknowledge it
+        self.start_typing(bot, message.chat_id)
+        
+        # The answer is posted as soon as the LLM starts writing it, then edited as it grows
+        reply = None
+        shown = ""
+        last_edit = 0.0
+        streaming = True
         
-        # Send typing indicator
-        await self.safe_send_chat_action(context.bot, update.effective_chat.id, "typing")
+        async def show_partial(text: str):
+            nonlocal reply, shown, last_edit, streaming
+            if not streaming:
+                return
+            text = text[:TELEGRAM_MESSAGE_LIMIT]
+            now = time.monotonic()
+            # This runs inside the LLM's timeout, so partial sends and edits are best effort: skipped
+            # rather than waited for or retried when rate limited, so Telegram backoff isn't charged to the LLM
+            try:
+                if reply is None:
+                    if not all(bucket.try_acquire() for bucket in self._rate_buckets(message)):
+                        return
+                    reply = await message.reply_text(text)
+                    self._last_typing.pop(message.chat_id, None)
+                elif now - last_edit < self.STREAM_EDIT_INTERVAL or text == shown:
+                    return
+                elif all(bucket.try_acquire() for bucket in self._rate_buckets(reply)):
+                    await reply.edit_text(text)
+                else:
+                    return
+            except Exception as e:
+                if isinstance(e, RetryAfter):
+                    # Hold every send for as long as Telegram asked
+                    self._send_bucket.pause(retry_after_seconds(e))
+                # The answer itself is unaffected; it is sent in full once complete
+                logger.warning("Failed to stream answer: %s", e)
+                streaming = False
+                return
+            shown = text
+            last_edit = now
         
         try:
-            # Search for relevant passages using online search engine with timeout
-            context_passages = await asyncio.wait_for(
-                self.search_engine.search(question),
-                timeout=Config.SEARCH_TIMEOUT
-            )
+            response = await self._get_answer(question, show_partial)
             
-            if not context_passages:
-                response = "🤔 I searched multiple online sources but couldn't find specific information about that in the Elder Scrolls lore. Could you try rephrasing your question or ask about something else?"
+            # Send response with retry logic, split up if it is too long for one message
+            if reply is None:
+                await self.send_reply(message, response)
             else:
-                # Process question using RAG with timeout
-                response = await asyncio.wait_for(
-                    self.rag_processor.process_question(question, context_passages),
-                    timeout=Config.LLM_TIMEOUT
-                )
-            
-            # Send response with retry logic
-            await self.safe_reply(update.message, response)
+                first, *rest = split_message(response)
+                if first != shown:
+                    await self.safe_edit(reply, first)
+                for part in rest:
+                    await self.safe_reply(message, part)
             
         except asyncio.TimeoutError:
-            logger.error(f"Timeout processing message '{question}'")
-            await self.safe_reply(
-                update.message,
-                "⏰ Sorry, the request took too long to process. Please try again with a simpler question or try later."
-            )
+            logger.error("Timeout processing question '%s'", question)
+            await self._send_failure(message, reply, shown, TIMEOUT_MESSAGE)
         except Exception as e:
-            logger.error(f"Error processing message '{question}': {e}")
-            await self.safe_reply(
-                update.message,
-                "❌ Sorry, I encountered an error while processing your question. Please try again later."
+            logger.error("Error processing question '%s': %s", question, e)
+            await self._send_failure(message, reply, shown, ERROR_MESSAGE)
+    
+    async def _send_failure(self, message, reply, shown: str, notice: str):
+        """Tell the user an answer failed, under the part of it already streamed into reply if any"""
+        if reply is None:
+            await self.safe_reply(message, notice)
+            return
+        
+        # Keep the partial answer, cut short where needed so the notice still fits in the message
+        partial = shown[:TELEGRAM_MESSAGE_LIMIT - len(notice) - 2]
+        await self.safe_edit(reply, f"{partial}\n\n{notice}")
+    
+    @staticmethod
+    def _answer_cache_key(question: str) -> str:
+        """Key a question so case and surrounding whitespace don't matter"""
+        return hashlib.blake2b(question.strip().casefold().encode(), digest_size=16).hexdigest()
+    
+    async def _get_answer(self, question: str, on_partial: Optional[Callable[[str], Awaitable[None]]] = None) -> str:
+        """Answer a question from the cache, or by searching and running it through the RAG pipeline"""
+        # Only the asker that starts a generation sees it stream; the rest get the finished answer
+        key = self._answer_cache_key(question)
+        entry = self._answer_cache.get(key)
+        if entry is not None:
+            response, cached_at = entry
+            if time.time() - cached_at <= self.ANSWER_CACHE_TTL:
+                self._answer_cache.move_to_end(key)
+                logger.info("Answer cache hit for question: %s...", question[:50])
+                return response
+            del self._answer_cache[key]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._generate_answer(question, key, on_partial))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info("Joining in-flight answer for question: %s...", question[:50])
+        
+        # Shielded so one asker timing out or disconnecting doesn't cancel the others' answer
+        return await asyncio.shield(task)
+    
+    async def _generate_answer(self, question: str, key: str,
+                               on_partial: Optional[Callable[[str], Awaitable[None]]] = None) -> str:
+        """Answer a question that isn't in the exact-match cache"""
+        # Fall back to a similarity lookup so reworded questions also hit
+        question_embedding = await asyncio.to_thread(self.semantic_cache.encode, question)
+        response = self.semantic_cache.get(question_embedding)
+        if response is not None:
+            logger.info("Semantic cache hit for question: %s...", question[:50])
+            return response
+        
+        async with self._question_slots:
+            # Search for relevant passages using online search engine with timeout; passages already
+            # prefetched for names in the question count toward the result
+            context_passages = await asyncio.wait_for(
+                self.search_engine.search(question, extract_entities(question)),
+                timeout=SEARCH_TIMEOUT
+            )
+        
+        if not context_passages:
+            return NO_RESULTS_MESSAGE
+        
+        # Follow-ups tend to ask about names in this question; search for them while the LLM runs
+        self._prefetch_entities(question)
+        
+        # Process question using RAG with timeout; waiting for a free LLM slot doesn't count against it
+        async with self._llm_slots:
+            response = await asyncio.wait_for(
+                self._stream_rag(question, context_passages, on_partial, question_embedding),
+                timeout=LLM_TIMEOUT
             )
+        
+        # Backend fallback replies are transient, so only real answers are kept
+        from llm_client import FALLBACK_RESPONSES
+        if response not in FALLBACK_RESPONSES:
+            self._answer_cache[key] = (response, time.time())
+            if len(self._answer_cache) > self.ANSWER_CACHE_SIZE:
+                self._answer_cache.popitem(last=False)
+            self.semantic_cache.set(question_embedding, response)
+        return response
+    
+    async def _stream_rag(self, question: str, context_passages: list,
+                          on_partial: Optional[Callable[[str], Awaitable[None]]], question_embedding=None) -> str:
+        """Run the RAG pipeline, passing the answer so far to on_partial as the LLM streams it"""
+        # The RAG processor's response cache embeds with the same model, so the question is encoded once
+        response = ""
+        async for chunk in self.rag_processor.process_question_stream(question, context_passages, question_embedding):
+            response += chunk
+            if on_partial is not None:
+                await on_partial(response)
+        if not response:
+            raise RuntimeError("LLM returned an empty answer")
+        return response
+    
+    def _prefetch_entities(self, question: str):
+        """Warm the search engine's result cache for the names in a question, for later questions naming them"""
+        for entity in extract_entities(question):
+            if len(self._prefetching) >= self.MAX_PREFETCHES:
+                return
+            if entity in self._prefetching or entity.casefold() == question.strip(" ?!.").casefold():
+                continue
+            self._prefetching.add(entity)
+            self._run_in_background(self._prefetch(entity))
+    
+    async def _prefetch(self, entity: str):
+        """Search for an entity only to cache the results, ignoring failures"""
+        try:
+            await asyncio.wait_for(self.search_engine.search(entity), timeout=SEARCH_TIMEOUT)
+        except Exception as e:
+            logger.debug("Prefetch for '%s' failed: %s", entity, e)
+        finally:
+            self._prefetching.discard(entity)
     
     async def error_handler(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle errors with improved resilience"""
-        logger.error(f"Exception while handling an update: {context.error}")
+        logger.error("Exception while handling an update: %s", context.error)
         
         # Only try to send error message if we have a valid update and message
         if update and update.effective_message:
@@ -262,35 +632,55 @@ Happy exploring, traveler! 🗡️⚔️
                 )
             except Exception as error_handler_error:
                 # If even the error handler fails, just log it and don't re-raise
-                logger.error(f"Error handler itself failed: {error_handler_error}")
+                logger.error("Error handler itself failed: %s", error_handler_error)
                 # Don't re-raise to prevent cascading failures
 
-async def main():
+def main():
     """Main function to run the bot"""
+    from telegram.ext import Application, CommandHandler, MessageHandler, filters
+    
     # Validate configuration
-    config_errors = Config.validate_config()
+    config_errors = Config.validate_config(telegram=True)
     if config_errors:
         logger.error("Configuration errors:")
         for error in config_errors:
-            logger.error(f"  - {error}")
+            logger.error("  - %s", error)
         return
     
     # Create bot instance
     bot = ElderScrollsLoreBot()
     
-    # Initialize bot components
-    if not await bot.initialize():
-        logger.error("Failed to initialize bot. Exiting.")
-        return
+    async def post_init(application: Application):
+        # Runs on the loop run_polling/run_webhook owns, before the first update is fetched
+        # Blocking search and embedding work runs in this pool so concurrent updates don't queue behind it
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=Config.THREAD_POOL_WORKERS)
+        )
+        
+        # Initialize bot components
+        if not await bot.initialize():
+            raise RuntimeError("Failed to initialize bot")
+    
+    async def post_shutdown(application: Application):
+        # Cleanup resources
+        await bot.cleanup()
+        logger.info("Bot shutdown complete.")
     
-    # Create application with increased timeout configuration
+    # Create application with increased timeout configuration; every API response, including
+    # each getUpdates batch, is parsed by orjson
+    timeouts = {
+        'read_timeout': Config.TELEGRAM_READ_TIMEOUT,
+        'write_timeout': Config.TELEGRAM_WRITE_TIMEOUT,
+        'connect_timeout': Config.TELEGRAM_CONNECT_TIMEOUT,
+        'pool_timeout': Config.TELEGRAM_POOL_TIMEOUT,
+    }
     application = (
         Application.builder()
         .token(Config.TELEGRAM_TOKEN)
-        .read_timeout(Config.TELEGRAM_READ_TIMEOUT)
-        .write_timeout(Config.TELEGRAM_WRITE_TIMEOUT)
-        .connect_timeout(Config.TELEGRAM_CONNECT_TIMEOUT)
-        .pool_timeout(Config.TELEGRAM_POOL_TIMEOUT)
+        .request(OrjsonRequest(connection_pool_size=256, **timeouts))
+        .get_updates_request(OrjsonRequest(**timeouts))
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
         .build()
     )
     
@@ -305,17 +695,27 @@ async def main():
     # Add error handler
     application.add_error_handler(bot.error_handler)
     
-    try:
-        # Start the bot
-        logger.info("Starting Elder Scrolls Lore Bot with online search capabilities...")
-        await application.run_polling(allowed_updates=Update.ALL_TYPES)
-    except KeyboardInterrupt:
-        logger.info("Bot shutdown requested...")
-    finally:
-        # Cleanup resources
-        await bot.cleanup()
-        logger.info("Bot shutdown complete.")
+    # Start the bot; run_polling/run_webhook create and own the event loop and handle Ctrl+C
+    logger.info("Starting Elder Scrolls Lore Bot with online search capabilities...")
+    if Config.WEBHOOK_URL:
+        # Telegram pushes each update as it happens instead of the bot long-polling getUpdates;
+        # the token in the path keeps the endpoint unguessable
+        application.run_webhook(
+            listen="0.0.0.0",
+            port=Config.WEBHOOK_PORT,
+            url_path=Config.TELEGRAM_TOKEN,
+            webhook_url=f"{Config.WEBHOOK_URL}/{Config.TELEGRAM_TOKEN}",
+            allowed_updates=Update.ALL_TYPES
+        )
+    else:
+        application.run_polling(allowed_updates=Update.ALL_TYPES)
 
 if __name__ == "__main__":
-    asyncio.run(main())
-    
\ No newline at end of file
+    # libuv-backed event loop where available; the stock loop otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    main()
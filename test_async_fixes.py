@@ -15,22 +15,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def test_async_operations():
+async def test_async_operations(bot):
     """Test that async operations work correctly"""
     print("🧪 Testing Async Operations...")
     
     try:
-        # Create bot instance
-        bot = ElderScrollsLoreBot()
-        
-        # Initialize bot components
-        print("   Initializing bot components...")
-        if not await bot.initialize():
-            print("❌ Bot initialization failed")
-            return False
-        
-        print("✅ Bot initialization successful")
-        
         # Test search operation
         print("   Testing search operation...")
         test_question = "Who is the Dragonborn?"
@@ -64,29 +53,17 @@ async def test_async_operations():
                 print(f"❌ RAG processing failed: {e}")
                 return False
         
-        # Cleanup
-        await bot.cleanup()
-        print("✅ Cleanup successful")
-        
         return True
         
     except Exception as e:
         print(f"❌ Test failed: {e}")
         return False
 
-async def test_timeout_handling():
+async def test_timeout_handling(bot):
     """Test that timeout handling works correctly"""
     print("\n⏰ Testing Timeout Handling...")
     
     try:
-        # Create bot instance
-        bot = ElderScrollsLoreBot()
-        
-        # Initialize bot components
-        if not await bot.initialize():
-            print("❌ Bot initialization failed")
-            return False
-        
         # Test with a very short timeout
         print("   Testing with short timeout...")
         test_question = "What is the history of Tamriel?"
@@ -104,8 +81,6 @@ async def test_timeout_handling():
             print(f"❌ Unexpected error: {e}")
             return False
         
-        # Cleanup
-        await bot.cleanup()
         return True
         
     except Exception as e:
@@ -117,7 +92,7 @@ async def main():
     print("🚀 Testing Async Fixes for Elder Scrolls Lore Bot...\n")
     
     # Check configuration
-    config_errors = Config.validate_config()
+    config_errors = Config.validate_config(telegram=True)
     if config_errors:
         print("❌ Configuration errors found:")
         for error in config_errors:
@@ -126,9 +101,21 @@ async def main():
     
     print("✅ Configuration validated")
     
+    # One bot serves every test, so its components are initialized only once
+    bot = ElderScrollsLoreBot()
+    print("   Initializing bot components...")
+    if not await bot.initialize():
+        print("❌ Bot initialization failed")
+        return
+    print("✅ Bot initialization successful")
+    
     # Run tests
-    test1_passed = await test_async_operations()
-    test2_passed = await test_timeout_handling()
+    try:
+        test1_passed = await test_async_operations(bot)
+        test2_passed = await test_timeout_handling(bot)
+    finally:
+        await bot.cleanup()
+        print("✅ Cleanup successful")
     
     print("\n📊 Test Results:")
     print(f"   Async Operations: {'✅ PASSED' if test1_passed else '❌ FAILED'}")
@@ -140,4 +127,11 @@ async def main():
         print("\n⚠️  Some tests failed. Please check the implementation.")
 
 if __name__ == "__main__":
+    # libuv-backed event loop where available; the stock loop otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file
@@ -5,15 +5,15 @@ Run this to verify everything works before starting the Telegram bot
 """
 
 import asyncio
+import hashlib
 import logging
-import nest_asyncio
-
-# Patch asyncio to allow nested event loops
-nest_asyncio.apply()
+import os
+import shelve
 
 from config import Config
 from online_search import OnlineSearchEngine
-from llm_client import LLMClientFactory, RAGProcessor
+from llm_client import FALLBACK_RESPONSES, LLMClientFactory, RAGProcessor
+from test_common import run_concurrently, check_config as test_configuration
 
 # Configure logging
 logging.basicConfig(
@@ -22,15 +22,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Components shared by every test, so the embedding model and HTTP sessions are set up only once per run
+_search_engine_task = None
+_llm_client = None
+
+async def _init_search_engine():
+    search_engine = OnlineSearchEngine()
+    if await search_engine.initialize():
+        return search_engine
+    return None
+
+async def get_search_engine():
+    """Get the shared search engine, initializing it on first use (None if that fails)"""
+    # Tests run concurrently, so callers share one initialization task instead of racing to start their own
+    global _search_engine_task
+    if _search_engine_task is None:
+        _search_engine_task = asyncio.ensure_future(_init_search_engine())
+    return await _search_engine_task
+
+def get_llm_client():
+    """Get the shared LLM client for the configured backend"""
+    global _llm_client
+    if _llm_client is None:
+        _llm_client = LLMClientFactory.create_client()
+    return _llm_client
+
+async def close_shared_components():
+    """Close the shared components once every test has run"""
+    global _search_engine_task, _llm_client, _rag_probe_task
+    _rag_probe_task = None
+    if _search_engine_task:
+        search_engine = await _search_engine_task
+        if search_engine:
+            await search_engine.close()
+        _search_engine_task = None
+    if _llm_client:
+        await _llm_client.close()
+        _llm_client = None
+
 async def test_online_search_engine():
     """Test the online search engine component"""
     print("🧪 Testing Online Search Engine...")
     
     try:
-        search_engine = OnlineSearchEngine()
-        success = await search_engine.initialize()
+        search_engine = await get_search_engine()
         
-        if success:
+        if search_engine:
             print("✅ Online search engine initialized successfully")
             
             # Test search functionality
@@ -44,9 +81,6 @@ async def test_online_search_engine():
                     print(f"   Result {i+1} (score: {score:.3f}): {text[:100]}...")
             else:
                 print("⚠️  Search returned no results")
-            
-            # Cleanup
-            await search_engine.close()
                 
         else:
             print("❌ Online search engine initialization failed")
@@ -58,6 +92,44 @@ async def test_online_search_engine():
     
     return True
 
+# Optional on-disk cache of RAG answers for quick reruns while developing; when unset every run asks the live LLM
+RAG_CACHE_PATH = os.getenv("TEST_RAG_CACHE")
+
+async def process_question(rag_processor, question, context_passages):
+    """Answer a question with the RAG processor, reusing an earlier run's answer when RAG_CACHE_PATH is set"""
+    if not RAG_CACHE_PATH:
+        return await rag_processor.process_question(question, context_passages)
+    
+    texts = "||".join(text for text, _ in context_passages)
+    key = hashlib.sha256(f"{question}|{texts}".encode()).hexdigest()
+    with shelve.open(RAG_CACHE_PATH) as cache:
+        if key in cache:
+            return cache[key]
+    
+    response = await rag_processor.process_question(question, context_passages)
+    # Error fallbacks are left out so the next run tries the LLM again
+    if response and response not in FALLBACK_RESPONSES:
+        with shelve.open(RAG_CACHE_PATH) as cache:
+            cache[key] = response
+    return response
+
+# RAGProcessor answers through the LLM client's generate_response, so the LLM client and RAG processor
+# tests share this one probe instead of each sending its own request
+RAG_PROBE_QUESTION = "Who is the Dragonborn?"
+RAG_PROBE_CONTEXT = [
+    ("The Dragonborn is a legendary figure in Elder Scrolls lore who can absorb dragon souls and use the Thu'um.", 0.9),
+    ("Dragonborn individuals have the ability to shout like dragons and are destined to face great challenges.", 0.8)
+]
+_rag_probe_task = None
+
+async def get_rag_probe_response():
+    """Get the answer to the shared RAG probe, sending the request on first use"""
+    global _rag_probe_task
+    if _rag_probe_task is None:
+        rag_processor = RAGProcessor(get_llm_client())
+        _rag_probe_task = asyncio.ensure_future(process_question(rag_processor, RAG_PROBE_QUESTION, RAG_PROBE_CONTEXT))
+    return await _rag_probe_task
+
 async def test_llm_client():
     """Test the LLM client component"""
     print("\n🧪 Testing LLM Client...")
@@ -72,15 +144,12 @@ async def test_llm_client():
             return False
         
         # Create LLM client
-        llm_client = LLMClientFactory.create_client()
+        get_llm_client()
         backend = Config.get_llm_backend()
         print(f"✅ LLM client created successfully for backend: {backend.value}")
         
-        # Test simple generation
-        test_prompt = "Hello, this is a test message. Please respond with 'Test successful' if you can read this."
-        
         print("   Testing LLM response generation...")
-        response = llm_client.generate_response(test_prompt)
+        response = await get_rag_probe_response()
         
         if response and len(response) > 0:
             print(f"✅ LLM response test successful")
@@ -100,19 +169,8 @@ async def test_rag_processor():
     print("\n🧪 Testing RAG Processor...")
     
     try:
-        # Create LLM client
-        llm_client = LLMClientFactory.create_client()
-        rag_processor = RAGProcessor(llm_client)
-        
-        # Test RAG processing
-        test_question = "Who is the Dragonborn?"
-        test_context = [
-            ("The Dragonborn is a legendary figure in Elder Scrolls lore who can absorb dragon souls and use the Thu'um.", 0.9),
-            ("Dragonborn individuals have the ability to shout like dragons and are destined to face great challenges.", 0.8)
-        ]
-        
-        print(f"   Testing RAG processing for: '{test_question}'")
-        response = await rag_processor.process_question(test_question, test_context)
+        print(f"   Testing RAG processing for: '{RAG_PROBE_QUESTION}'")
+        response = await get_rag_probe_response()
         
         if response and len(response) > 0:
             print(f"✅ RAG processing test successful")
@@ -132,12 +190,12 @@ async def test_full_pipeline():
     print("\n🧪 Testing Full Pipeline...")
     
     try:
-        # Initialize components
-        search_engine = OnlineSearchEngine()
-        await search_engine.initialize()
+        search_engine = await get_search_engine()
+        if not search_engine:
+            print("❌ Full pipeline test failed - search engine unavailable")
+            return False
         
-        llm_client = LLMClientFactory.create_client()
-        rag_processor = RAGProcessor(llm_client)
+        rag_processor = RAGProcessor(get_llm_client())
         
         # Test complete pipeline
         test_question = "What is the history of the Dark Elves?"
@@ -150,7 +208,7 @@ async def test_full_pipeline():
             print(f"   Found {len(context_passages)} context passages")
             
             # Process with RAG
-            response = await rag_processor.process_question(test_question, context_passages)
+            response = await process_question(rag_processor, test_question, context_passages)
             
             if response and len(response) > 0:
                 print(f"✅ Full pipeline test successful")
@@ -161,9 +219,6 @@ async def test_full_pipeline():
         else:
             print("⚠️  No context found for test question")
             print("   This might be normal if the search sources are unavailable")
-        
-        # Cleanup
-        await search_engine.close()
             
     except Exception as e:
         print(f"❌ Full pipeline test failed: {e}")
@@ -171,38 +226,6 @@ async def test_full_pipeline():
     
     return True
 
-async def test_configuration():
-    """Test configuration validation"""
-    print("🧪 Testing Configuration...")
-    
-    try:
-        config_errors = Config.validate_config()
-        
-        if not config_errors:
-            print("✅ Configuration validation passed")
-            print(f"   LLM Backend: {Config.get_llm_backend().value}")
-            print(f"   Telegram Token: {'Set' if Config.TELEGRAM_TOKEN else 'Missing'}")
-            
-            backend = Config.get_llm_backend()
-            if backend.value == "openrouter":
-                print(f"   OpenRouter API Key: {'Set' if Config.OPENROUTER_API_KEY else 'Missing'}")
-            elif backend.value == "ollama":
-                print(f"   Ollama URL: {Config.OLLAMA_BASE_URL}")
-            elif backend.value == "lm_studio":
-                print(f"   LM Studio URL: {Config.LM_STUDIO_BASE_URL}")
-                
-        else:
-            print("❌ Configuration validation failed:")
-            for error in config_errors:
-                print(f"   - {error}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Configuration test failed: {e}")
-        return False
-    
-    return True
-
 async def main():
     """Run all tests"""
     print("🚀 Starting Elder Scrolls Lore Bot Tests...\n")
@@ -217,13 +240,23 @@ async def main():
     
     results = []
     
-    for test_name, test_func in tests:
-        try:
-            result = await test_func()
-            results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
-            results.append((test_name, False))
+    # Configuration is a quick local check, so it runs on its own first; the other tests are
+    # independent network-bound probes, so they run concurrently and overlap their waits
+    try:
+        for batch in (tests[:1], tests[1:]):
+            outcomes = await run_concurrently([test_func for _, test_func in batch])
+            for (test_name, _), result in zip(batch, outcomes):
+                if isinstance(result, Exception):
+                    print(f"❌ {test_name} test crashed: {result}")
+                    result = False
+                results.append((test_name, result))
+            
+            # Every later test needs a valid configuration, so don't sit through their network timeouts
+            if not results[0][1]:
+                print("\n⚠️ Configuration is invalid, skipping the remaining tests")
+                break
+    finally:
+        await close_shared_components()
     
     # Summary
     print("\n" + "="*50)
@@ -249,5 +282,12 @@ async def main():
     return passed == total
 
 if __name__ == "__main__":
+    # libuv-backed event loop where available; the stock loop otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     success = asyncio.run(main())
     exit(0 if success else 1)
\ No newline at end of file
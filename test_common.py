@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Checks shared by the Elder Scrolls Lore Bot test scripts
+Each script imports these under its own test names instead of keeping a copy
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import inspect
+import io
+import sys
+
+from config import Config, LLMBackend
+
+# Output buffer of the test running in the current task (None outside run_buffered)
+_test_output = contextvars.ContextVar('test_output', default=None)
+
+class TaskOutput(io.TextIOBase):
+    """stdout replacement that collects each running test's prints in that test's own buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+    
+    def write(self, text):
+        buffer = _test_output.get()
+        if buffer is None:
+            self.stream.write(text)
+        else:
+            buffer.append(text)
+        return len(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+@contextlib.contextmanager
+def buffered_output():
+    """Route prints through TaskOutput for the duration of a test run"""
+    stream = sys.stdout
+    sys.stdout = TaskOutput(stream)
+    try:
+        yield
+    finally:
+        sys.stdout = stream
+
+async def run_buffered(test_func):
+    """Run a test (sync or async), writing its output out in one piece when it finishes
+
+    Concurrently running tests then print as whole blocks instead of interleaved lines,
+    with one write per test rather than one per print call.
+    """
+    buffer = []
+    token = _test_output.set(buffer)
+    try:
+        result = test_func()
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+    finally:
+        _test_output.reset(token)
+        sys.stdout.write("".join(buffer))
+        sys.stdout.flush()
+
+async def run_concurrently(test_funcs):
+    """Run tests concurrently with buffered output, returning their results in order
+
+    A test that crashes gets its exception in place of a result, so the other tests still finish.
+    Synchronous tests do no I/O, so they are called directly before the async ones are started.
+    Uses a TaskGroup on Python 3.11+ and gather on older versions.
+    """
+    async def run(test_func):
+        try:
+            return await run_buffered(test_func)
+        except Exception as e:
+            return e
+    
+    with buffered_output():
+        results = {i: await run(test_func) for i, test_func in enumerate(test_funcs)
+                   if not inspect.iscoroutinefunction(test_func)}
+        pending = [(i, test_func) for i, test_func in enumerate(test_funcs) if i not in results]
+        
+        if not hasattr(asyncio, "TaskGroup"):
+            outcomes = await asyncio.gather(*(run(test_func) for _, test_func in pending))
+        else:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(run(test_func)) for _, test_func in pending]
+            outcomes = [task.result() for task in tasks]
+        
+        results.update(zip((i for i, _ in pending), outcomes))
+        return [results[i] for i in range(len(test_funcs))]
+
+async def check_config():
+    """Test configuration loading and validation"""
+    print("🔧 Testing configuration...")
+    
+    try:
+        backend = Config.get_llm_backend()
+        print(f"✅ LLM Backend: {backend.value}")
+        
+        if backend == LLMBackend.OPENROUTER:
+            print(f"   OpenRouter API Key: {'Set' if Config.OPENROUTER_API_KEY else 'Missing'}")
+        elif backend == LLMBackend.OLLAMA:
+            print(f"   Ollama URL: {Config.OLLAMA_BASE_URL}")
+        elif backend == LLMBackend.LM_STUDIO:
+            print(f"   LM Studio URL: {Config.LM_STUDIO_BASE_URL}")
+        
+        # Test config validation
+        errors = Config.validate_config()
+        if errors:
+            print("❌ Configuration errors found:")
+            for error in errors:
+                print(f"   - {error}")
+            return False
+        else:
+            print("✅ Configuration validation passed")
+            return True
+    
+    except Exception as e:
+        print(f"❌ Configuration test failed: {e}")
+        return False
+
+async def check_search_engine():
+    """Test search engine initialization"""
+    print("\n🔍 Testing search engine...")
+    
+    try:
+        from online_search import OnlineSearchEngine
+        
+        # Create search engine instance
+        search_engine = OnlineSearchEngine()
+        
+        # Test initialization
+        success = await search_engine.initialize()
+        if success:
+            print("✅ Search engine initialized successfully")
+            
+            # Test basic search functionality
+            try:
+                results = await search_engine.search("test")
+                print(f"✅ Search test completed, found {len(results) if results else 0} results")
+            except Exception as e:
+                print(f"⚠️ Search test failed (this is normal if no internet): {e}")
+            
+            # Cleanup
+            await search_engine.close()
+            return True
+        else:
+            print("❌ Search engine initialization failed")
+            return False
+    
+    except Exception as e:
+        print(f"❌ Search engine test failed: {e}")
+        return False
+
+async def check_llm_client(client_factory=None):
+    """Test LLM client creation, using client_factory to get the client when given"""
+    print("\n🤖 Testing LLM client...")
+    
+    try:
+        from llm_client import LLMClientFactory
+        
+        # Test client creation
+        client = client_factory() if client_factory else LLMClientFactory.create_client()
+        print(f"✅ LLM client created: {type(client).__name__}")
+        
+        # Test basic functionality (without actual API call)
+        print("✅ LLM client test completed")
+        return True
+    
+    except Exception as e:
+        print(f"❌ LLM client test failed: {e}")
+        return False
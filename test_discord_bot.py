@@ -8,8 +8,16 @@ import asyncio
 import logging
 import os
 import sys
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+from test_common import (
+    run_concurrently,
+    check_config as test_config,
+    check_search_engine as test_search_engine,
+    check_llm_client as test_llm_client
+)
+
 # Configure logging for testing
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -17,84 +25,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def test_config():
-    """Test configuration loading"""
-    print("🔧 Testing configuration...")
-    
-    try:
-        from config import Config
-        
-        # Test basic config loading
-        backend = Config.get_llm_backend()
-        print(f"✅ LLM Backend: {backend.value}")
-        
-        # Test config validation
-        errors = Config.validate_config()
-        if errors:
-            print("❌ Configuration errors found:")
-            for error in errors:
-                print(f"   - {error}")
-            return False
-        else:
-            print("✅ Configuration validation passed")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Configuration test failed: {e}")
-        return False
-
-async def test_search_engine():
-    """Test search engine initialization"""
-    print("\n🔍 Testing search engine...")
-    
-    try:
-        from online_search import OnlineSearchEngine
-        
-        # Create search engine instance
-        search_engine = OnlineSearchEngine()
-        
-        # Test initialization
-        success = await search_engine.initialize()
-        if success:
-            print("✅ Search engine initialized successfully")
-            
-            # Test basic search functionality
-            try:
-                results = await search_engine.search("test")
-                print(f"✅ Search test completed, found {len(results) if results else 0} results")
-            except Exception as e:
-                print(f"⚠️ Search test failed (this is normal if no internet): {e}")
-            
-            # Cleanup
-            await search_engine.close()
-            return True
-        else:
-            print("❌ Search engine initialization failed")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Search engine test failed: {e}")
-        return False
-
-async def test_llm_client():
-    """Test LLM client initialization"""
-    print("\n🤖 Testing LLM client...")
-    
-    try:
-        from llm_client import LLMClientFactory
-        
-        # Test client creation
-        client = LLMClientFactory.create_client()
-        print(f"✅ LLM client created: {type(client).__name__}")
-        
-        # Test basic functionality (without actual API call)
-        print("✅ LLM client test completed")
-        return True
-        
-    except Exception as e:
-        print(f"❌ LLM client test failed: {e}")
-        return False
-
 async def test_bot_initialization():
     """Test bot initialization (mocked)"""
     print("\n🤖 Testing bot initialization...")
@@ -128,22 +58,23 @@ async def test_bot_initialization():
         print(f"❌ Bot initialization test failed: {e}")
         return False
 
-async def test_commands():
+def test_commands():
     """Test command loading"""
     print("\n📝 Testing commands...")
     
     try:
         from commands import ElderScrollsCommands
         
-        # Mock bot for command testing
-        mock_bot = Mock()
-        mock_bot.initialized = True
-        mock_bot.search_engine = Mock()
-        mock_bot.rag_processor = Mock()
-        mock_bot.error_log = []
-        mock_bot.start_time = None
-        mock_bot.guilds = []
-        mock_bot.latency = 0.1
+        # Stand-in bot for command testing
+        mock_bot = SimpleNamespace(
+            initialized=True,
+            search_engine=None,
+            rag_processor=None,
+            error_log=[],
+            start_time=None,
+            guilds=[],
+            latency=0.1
+        )
         
         # Create commands instance
         commands = ElderScrollsCommands(mock_bot)
@@ -162,19 +93,20 @@ async def test_commands():
         print(f"❌ Commands test failed: {e}")
         return False
 
-async def test_events():
+def test_events():
     """Test event handlers"""
     print("\n📡 Testing event handlers...")
     
     try:
         from events import ElderScrollsEvents
         
-        # Mock bot for event testing
-        mock_bot = Mock()
-        mock_bot.initialized = True
-        mock_bot.search_engine = Mock()
-        mock_bot.rag_processor = Mock()
-        mock_bot.error_log = []
+        # Stand-in bot for event testing
+        mock_bot = SimpleNamespace(
+            initialized=True,
+            search_engine=None,
+            rag_processor=None,
+            error_log=[]
+        )
         
         # Create events instance
         events = ElderScrollsEvents(mock_bot)
@@ -186,16 +118,15 @@ async def test_events():
         print(f"❌ Event handlers test failed: {e}")
         return False
 
-async def test_background_tasks():
+def test_background_tasks():
     """Test background task manager"""
     print("\n🔄 Testing background tasks...")
     
     try:
         from background_tasks import BackgroundTaskManager
         
-        # Mock bot for background task testing
-        mock_bot = Mock()
-        mock_bot.error_log = []
+        # Stand-in bot for background task testing
+        mock_bot = SimpleNamespace(error_log=[])
         
         # Create background task manager
         task_manager = BackgroundTaskManager(mock_bot)
@@ -230,13 +161,20 @@ async def main():
     
     results = []
     
-    for test_name, test_func in tests:
-        try:
-            result = await test_func()
+    # Configuration is a quick local check, so it runs on its own first; the other tests are
+    # independent, so they run concurrently and the network-bound ones overlap their waits
+    for batch in (tests[:1], tests[1:]):
+        outcomes = await run_concurrently([test_func for _, test_func in batch])
+        for (test_name, _), result in zip(batch, outcomes):
+            if isinstance(result, Exception):
+                print(f"❌ {test_name} test crashed: {result}")
+                result = False
             results.append((test_name, result))
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
-            results.append((test_name, False))
+        
+        # Every later test needs a valid configuration, so don't sit through their network timeouts
+        if not results[0][1]:
+            print("\n⚠️ Configuration is invalid, skipping the remaining tests")
+            break
     
     # Print summary
     print("\n" + "=" * 50)
@@ -271,6 +209,12 @@ if __name__ == "__main__":
         print("   Copy .env.example to .env and fill in your values.")
         print()
     
+    # libuv-backed event loop where available; the stock loop otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run tests
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
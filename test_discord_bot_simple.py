@@ -8,7 +8,16 @@ import asyncio
 import logging
 import os
 import sys
-from unittest.mock import Mock
+from functools import lru_cache
+from types import SimpleNamespace
+
+from test_common import (
+    buffered_output,
+    run_buffered,
+    check_config as test_config,
+    check_search_engine as test_search_engine,
+    check_llm_client
+)
 
 # Configure logging for testing
 logging.basicConfig(
@@ -17,96 +26,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-async def test_config():
-    """Test configuration loading"""
-    print("🔧 Testing configuration...")
-    
-    try:
-        from config import Config
-        
-        # Test basic config loading
-        backend = Config.get_llm_backend()
-        print(f"✅ LLM Backend: {backend.value}")
-        
-        # Test config validation
-        errors = Config.validate_config()
-        if errors:
-            print("❌ Configuration errors found:")
-            for error in errors:
-                print(f"   - {error}")
-            return False
-        else:
-            print("✅ Configuration validation passed")
-            return True
-            
-    except Exception as e:
-        print(f"❌ Configuration test failed: {e}")
-        return False
-
-async def test_search_engine():
-    """Test search engine initialization"""
-    print("\n🔍 Testing search engine...")
-    
-    try:
-        from online_search import OnlineSearchEngine
-        
-        # Create search engine instance
-        search_engine = OnlineSearchEngine()
-        
-        # Test initialization
-        success = await search_engine.initialize()
-        if success:
-            print("✅ Search engine initialized successfully")
-            
-            # Test basic search functionality
-            try:
-                results = await search_engine.search("test")
-                print(f"✅ Search test completed, found {len(results) if results else 0} results")
-            except Exception as e:
-                print(f"⚠️ Search test failed (this is normal if no internet): {e}")
-            
-            # Cleanup
-            await search_engine.close()
-            return True
-        else:
-            print("❌ Search engine initialization failed")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Search engine test failed: {e}")
-        return False
+@lru_cache(maxsize=None)
+def get_llm_client():
+    """Get one LLM client for the whole run, so its connection pool is shared by every test"""
+    from llm_client import LLMClientFactory
+    return LLMClientFactory.create_client()
 
 async def test_llm_client():
     """Test LLM client initialization"""
-    print("\n🤖 Testing LLM client...")
-    
-    try:
-        from llm_client import LLMClientFactory
-        
-        # Test client creation
-        client = LLMClientFactory.create_client()
-        print(f"✅ LLM client created: {type(client).__name__}")
-        
-        # Test basic functionality (without actual API call)
-        print("✅ LLM client test completed")
-        return True
-        
-    except Exception as e:
-        print(f"❌ LLM client test failed: {e}")
-        return False
+    return await check_llm_client(get_llm_client)
 
-async def test_rag_processor():
+def test_rag_processor():
     """Test RAG processor initialization"""
     print("\n🧠 Testing RAG processor...")
     
     try:
-        from llm_client import LLMClientFactory, RAGProcessor
-        
-        # Create LLM client
-        llm_client = LLMClientFactory.create_client()
+        from llm_client import RAGProcessor
         
         # Create RAG processor
-        rag_processor = RAGProcessor(llm_client)
+        rag_processor = RAGProcessor(get_llm_client())
         print("✅ RAG processor created successfully")
         
         return True
@@ -115,16 +53,15 @@ async def test_rag_processor():
         print(f"❌ RAG processor test failed: {e}")
         return False
 
-async def test_background_tasks():
+def test_background_tasks():
     """Test background task manager"""
     print("\n🔄 Testing background tasks...")
     
     try:
         from background_tasks import BackgroundTaskManager
         
-        # Mock bot for background task testing
-        mock_bot = Mock()
-        mock_bot.error_log = []
+        # Stand-in bot for background task testing
+        mock_bot = SimpleNamespace(error_log=[])
         
         # Create background task manager
         task_manager = BackgroundTaskManager(mock_bot)
@@ -142,7 +79,7 @@ async def test_background_tasks():
         print(f"❌ Background tasks test failed: {e}")
         return False
 
-async def test_command_structure():
+def test_command_structure():
     """Test command structure without importing discord.py"""
     print("\n📝 Testing command structure...")
     
@@ -160,7 +97,7 @@ async def test_command_structure():
         print(f"❌ Command structure test failed: {e}")
         return False
 
-async def test_event_structure():
+def test_event_structure():
     """Test event structure without importing discord.py"""
     print("\n📡 Testing event structure...")
     
@@ -178,7 +115,7 @@ async def test_event_structure():
         print(f"❌ Event structure test failed: {e}")
         return False
 
-async def test_bot_structure():
+def test_bot_structure():
     """Test bot structure without importing discord.py"""
     print("\n🤖 Testing bot structure...")
     
@@ -216,11 +153,17 @@ async def main():
     
     for test_name, test_func in tests:
         try:
-            result = await test_func()
+            with buffered_output():
+                result = await run_buffered(test_func)
             results.append((test_name, result))
         except Exception as e:
             print(f"❌ {test_name} test crashed: {e}")
             results.append((test_name, False))
+        
+        # Every later test needs a valid configuration, so don't sit through their network timeouts
+        if not results[0][1]:
+            print("\n⚠️ Configuration is invalid, skipping the remaining tests")
+            break
     
     # Print summary
     print("\n" + "=" * 60)
@@ -257,6 +200,12 @@ if __name__ == "__main__":
         print("   Copy .env.example to .env and fill in your values.")
         print()
     
+    # libuv-backed event loop where available; the stock loop otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     # Run tests
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
@@ -7,7 +7,10 @@ the full Telegram bot dependencies.
 
 import asyncio
 import logging
-from functools import wraps
+import time
+import traceback
+
+from retry import retry_with_backoff
 
 # Configure logging for testing
 logging.basicConfig(
@@ -16,155 +19,107 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=10.0):
-    """Decorator to retry async functions with exponential backoff"""
-    def decorator(func):
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt == max_retries:
-                        logger.error(f"Final attempt failed for {func.__name__}: {e}")
-                        raise
-                    
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (2 ** attempt), max_delay)
-                    logger.warning(f"Attempt {attempt + 1} failed for {func.__name__}: {e}. Retrying in {delay:.1f}s...")
-                    await asyncio.sleep(delay)
-            
-            raise last_exception
-        return wrapper
-    return decorator
+# Retry scenarios: (description, decorator settings, failures before success (None: always fails),
+# expected calls, most seconds allowed). Full jitter can make any delay near zero, so only the upper
+# bound on time is checked: the sum of the backoff caps plus some slack
+RETRY_CASES = [
+    ("succeeded after retries", dict(max_retries=2, base_delay=0.1, max_delay=1.0), 2, 3, 0.4),
+    ("max retries exceeded", dict(max_retries=1, base_delay=0.1), None, 2, 0.2),
+    ("immediate success", dict(max_retries=2, base_delay=0.1), 0, 1, 0.1),
+    ("delays capped at max_delay", dict(max_retries=3, base_delay=1.0, max_delay=2.0), 3, 4, 6.0),
+]
+
+async def collect_failures(*tests):
+    """Run test coroutines concurrently, logging every failure rather than stopping at the first"""
+    results = await asyncio.gather(*tests, return_exceptions=True)
+    failures = [(test, result) for test, result in zip(tests, results) if isinstance(result, Exception)]
+    for test, error in failures:
+        logger.error("❌ %s failed: %s", test.__name__, error)
+    return failures
 
 class TestRetryLogic:
     """Test class for retry logic improvements"""
     
-    async def test_retry_decorator_success(self):
-        """Test the retry decorator with successful retry"""
-        logger.info("Testing retry decorator with successful retry...")
-        
+    async def test_retry_case(self, description, settings, failures, expected_calls, max_time):
+        """Test one RETRY_CASES scenario: the outcome, the number of calls and the time spent backing off"""
         call_count = 0
         
-        @retry_with_backoff(max_retries=2, base_delay=0.1, max_delay=1.0)
-        async def failing_function():
+        @retry_with_backoff(**settings)
+        async def flaky_function():
             nonlocal call_count
             call_count += 1
-            if call_count < 3:  # Fail first 2 times, succeed on 3rd
-                raise Exception(f"Simulated failure {call_count}")
+            if failures is None or call_count <= failures:
+                raise ConnectionError(f"Simulated failure {call_count}")
             return "Success!"
         
-        # Test successful retry
-        result = await failing_function()
-        assert result == "Success!"
-        assert call_count == 3
-        logger.info("✅ Retry decorator test passed - function succeeded after retries")
-    
-    async def test_retry_decorator_max_retries(self):
-        """Test the retry decorator with max retries exceeded"""
-        logger.info("Testing retry decorator with max retries exceeded...")
-        
-        call_count = 0
-        
-        @retry_with_backoff(max_retries=1, base_delay=0.1)
-        async def always_failing_function():
-            nonlocal call_count
-            call_count += 1
-            raise Exception("Always fails")
-        
+        start_time = time.perf_counter()
         try:
-            await always_failing_function()
-            assert False, "Should have raised an exception"
-        except Exception as e:
-            assert call_count == 2  # Initial attempt + 1 retry
-            logger.info("✅ Retry decorator test passed - max retries exceeded correctly")
+            result = await flaky_function()
+            assert failures is not None, f"{description}: should have raised an exception"
+            assert result == "Success!"
+        except ConnectionError:
+            assert failures is None, f"{description}: should have succeeded after retrying"
+        total_time = time.perf_counter() - start_time
+        
+        assert call_count == expected_calls, f"{description}: expected {expected_calls} calls, got {call_count}"
+        assert total_time <= max_time, f"{description}: expected at most {max_time}s, got {total_time:.3f}s"
+        logger.info("✅ Retry decorator test passed - %s (%s calls in %.3fs)", description, call_count, total_time)
     
-    async def test_retry_decorator_immediate_success(self):
-        """Test the retry decorator with immediate success"""
-        logger.info("Testing retry decorator with immediate success...")
-        
+    async def test_retry_decorator_non_retryable(self):
+        """Test that errors outside retry_on are raised without retrying"""
         call_count = 0
         
         @retry_with_backoff(max_retries=2, base_delay=0.1)
-        async def successful_function():
-            nonlocal call_count
-            call_count += 1
-            return "Immediate success!"
-        
-        result = await successful_function()
-        assert result == "Immediate success!"
-        assert call_count == 1  # Only one call, no retries needed
-        logger.info("✅ Retry decorator test passed - immediate success")
-    
-    async def test_exponential_backoff_timing(self):
-        """Test that exponential backoff timing is correct"""
-        logger.info("Testing exponential backoff timing...")
-        
-        call_count = 0
-        delays = []
-        
-        @retry_with_backoff(max_retries=2, base_delay=0.1, max_delay=1.0)
-        async def timing_test_function():
+        async def buggy_function():
             nonlocal call_count
             call_count += 1
-            if call_count < 3:
-                raise Exception(f"Failure {call_count}")
-            return "Success!"
-        
-        start_time = asyncio.get_event_loop().time()
-        await timing_test_function()
-        end_time = asyncio.get_event_loop().time()
+            raise TypeError("Programming error")
         
-        # Should have taken at least 0.1 + 0.2 = 0.3 seconds for delays
-        total_time = end_time - start_time
-        assert total_time >= 0.3, f"Expected at least 0.3s delay, got {total_time:.3f}s"
-        logger.info(f"✅ Exponential backoff timing test passed - total time: {total_time:.3f}s")
+        try:
+            await buggy_function()
+            assert False, "Should have raised an exception"
+        except TypeError:
+            assert call_count == 1  # No retries
+            logger.info("✅ Retry decorator test passed - non-retryable error not retried")
     
-    async def test_max_delay_cap(self):
-        """Test that the maximum delay is properly capped"""
-        logger.info("Testing maximum delay cap...")
-        
+    async def test_total_timeout(self):
+        """Test that total_timeout bounds the time spent retrying"""
         call_count = 0
         
-        @retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=2.0)
-        async def max_delay_test_function():
+        @retry_with_backoff(max_retries=10, base_delay=1.0, max_delay=2.0, total_timeout=1.0)
+        async def slow_failing_function():
             nonlocal call_count
             call_count += 1
-            if call_count < 4:
-                raise Exception(f"Failure {call_count}")
-            return "Success!"
+            raise ConnectionError(f"Failure {call_count}")
         
-        start_time = asyncio.get_event_loop().time()
-        await max_delay_test_function()
-        end_time = asyncio.get_event_loop().time()
-        
-        total_time = end_time - start_time
-        # Should be capped at max_delay=2.0, so delays should be 1.0, 2.0, 2.0 = 5.0s max
-        assert total_time <= 6.0, f"Expected max 6.0s total time, got {total_time:.3f}s"
-        logger.info(f"✅ Maximum delay cap test passed - total time: {total_time:.3f}s")
+        start_time = time.perf_counter()
+        try:
+            await slow_failing_function()
+            assert False, "Should have raised an exception"
+        except ConnectionError:
+            total_time = time.perf_counter() - start_time
+            # Ten retries could sleep for up to 19s, but every delay is clipped to the remaining budget
+            assert total_time <= 1.1, f"Expected retries to stop after 1.0s, got {total_time:.3f}s"
+            logger.info("✅ Total timeout test passed - gave up after %s calls in %.3fs", call_count, total_time)
     
     async def run_all_tests(self):
         """Run all tests"""
         logger.info("🚀 Starting retry logic tests...")
         
-        try:
-            await self.test_retry_decorator_success()
-            await self.test_retry_decorator_max_retries()
-            await self.test_retry_decorator_immediate_success()
-            await self.test_exponential_backoff_timing()
-            await self.test_max_delay_cap()
-            
-            logger.info("🎉 All retry logic tests passed successfully!")
-            return True
-            
-        except Exception as e:
-            logger.error(f"❌ Test failed: {e}")
-            import traceback
-            traceback.print_exc()
+        # Each test keeps its own state and mostly waits in backoff sleeps, so they run concurrently;
+        # every failure is reported, so one run shows all regressions
+        failures = await collect_failures(
+            *(self.test_retry_case(*case) for case in RETRY_CASES),
+            self.test_retry_decorator_non_retryable(),
+            self.test_total_timeout()
+        )
+        for _, error in failures:
+            traceback.print_exception(type(error), error, error.__traceback__)
+        
+        if failures:
             return False
+        logger.info("🎉 All retry logic tests passed successfully!")
+        return True
 
 async def main():
     """Main test function"""
@@ -192,5 +147,12 @@ async def main():
         return 1
 
 if __name__ == "__main__":
+    # libuv-backed event loop where available; the stock loop otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     exit_code = asyncio.run(main())
     exit(exit_code)
\ No newline at end of file
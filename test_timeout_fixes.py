@@ -7,13 +7,17 @@ connecting to Telegram API.
 
 import asyncio
 import logging
-from unittest.mock import AsyncMock, patch
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 import sys
 import os
 
 # Add the current directory to the path so we can import our modules
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from telegram.error import BadRequest, NetworkError
+
 from telegram_bot import ElderScrollsLoreBot, retry_with_backoff
 from config import Config
 
@@ -24,6 +28,28 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+async def collect_failures(*tests):
+    """Run test coroutines concurrently, logging every failure rather than stopping at the first"""
+    results = await asyncio.gather(*tests, return_exceptions=True)
+    failures = [(test, result) for test, result in zip(tests, results) if isinstance(result, Exception)]
+    for test, error in failures:
+        logger.error("❌ %s failed: %s", test.__name__, error)
+    return failures
+
+class AsyncStub:
+    """Minimal async callable that records its calls and returns (or raises) the given results in turn"""
+    
+    def __init__(self, side_effects):
+        self.side_effects = list(side_effects)
+        self.calls = []
+    
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        result = self.side_effects.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
 class TestTimeoutFixes:
     """Test class for timeout and retry improvements"""
     
@@ -41,8 +67,6 @@ class TestTimeoutFixes:
     
     async def test_retry_decorator(self):
         """Test the retry decorator with exponential backoff"""
-        logger.info("Testing retry decorator...")
-        
         call_count = 0
         
         @retry_with_backoff(max_retries=2, base_delay=0.1, max_delay=1.0)
@@ -50,7 +74,7 @@ class TestTimeoutFixes:
             nonlocal call_count
             call_count += 1
             if call_count < 3:  # Fail first 2 times, succeed on 3rd
-                raise Exception(f"Simulated failure {call_count}")
+                raise NetworkError(f"Simulated failure {call_count}")
             return "Success!"
         
         # Test successful retry
@@ -66,7 +90,7 @@ class TestTimeoutFixes:
         async def always_failing_function():
             nonlocal call_count
             call_count += 1
-            raise Exception("Always fails")
+            raise NetworkError("Always fails")
         
         try:
             await always_failing_function()
@@ -74,74 +98,113 @@ class TestTimeoutFixes:
         except Exception as e:
             assert call_count == 2  # Initial attempt + 1 retry
             logger.info("✅ Retry decorator test passed - max retries exceeded correctly")
+        
+        # Test non-retryable errors are raised immediately
+        call_count = 0
+        
+        @retry_with_backoff(max_retries=2, base_delay=0.1)
+        async def rejected_function():
+            nonlocal call_count
+            call_count += 1
+            raise BadRequest("Message is too long")
+        
+        try:
+            await rejected_function()
+            assert False, "Should have raised an exception"
+        except BadRequest:
+            assert call_count == 1  # No retries
+            logger.info("✅ Retry decorator test passed - non-retryable error not retried")
+    
+    async def test_no_blocking_sleep_in_retry(self):
+        """Test that retries back off without blocking the event loop"""
+        @retry_with_backoff(max_retries=2, base_delay=0.1, max_delay=0.2)
+        async def flaky_function(calls):
+            calls.append(1)
+            if len(calls) < 2:
+                raise NetworkError("Simulated failure")
+            return "Success!"
+        
+        blocking_sleep = MagicMock(side_effect=AssertionError("time.sleep called inside async retry"))
+        with patch.object(time, 'sleep', blocking_sleep):
+            start_time = time.perf_counter()
+            results = await asyncio.gather(*(flaky_function([]) for _ in range(50)))
+            total_time = time.perf_counter() - start_time
+        
+        assert results == ["Success!"] * 50
+        blocking_sleep.assert_not_called()
+        # Each call backs off at most 0.2s once; a blocking sleep would serialize them into 50 times that
+        assert total_time < 1.0, f"Expected concurrent backoffs to overlap, got {total_time:.3f}s"
+        logger.info("✅ Retry backoff test passed - 50 concurrent retries in %.3fs", total_time)
     
     async def test_safe_reply_method(self):
         """Test the safe_reply method with retry logic"""
-        logger.info("Testing safe_reply method...")
-        
-        # Create a mock message
-        mock_message = AsyncMock()
-        mock_message.reply_text = AsyncMock()
+        # Stand-in private-chat message
+        mock_message = SimpleNamespace(chat_id=12345, chat=SimpleNamespace(type='private'))
         
         # Test successful reply
+        mock_message.reply_text = AsyncStub([None])
         await self.bot.safe_reply(mock_message, "Test message")
-        mock_message.reply_text.assert_called_once_with("Test message")
+        assert mock_message.reply_text.calls == [(("Test message",), {})]
         logger.info("✅ Safe reply test passed - successful reply")
         
         # Test retry on failure
-        mock_message.reply_text.reset_mock()
-        mock_message.reply_text.side_effect = [
-            Exception("Network error"),  # First call fails
+        mock_message.reply_text = AsyncStub([
+            NetworkError("Network error"),  # First call fails
             "Success"  # Second call succeeds
-        ]
+        ])
         
         await self.bot.safe_reply(mock_message, "Test message with retry")
-        assert mock_message.reply_text.call_count == 2
+        assert len(mock_message.reply_text.calls) == 2
         logger.info("✅ Safe reply test passed - retry on failure")
     
     async def test_safe_send_chat_action(self):
         """Test the safe_send_chat_action method with retry logic"""
-        logger.info("Testing safe_send_chat_action method...")
-        
-        # Create mock bot and parameters
-        mock_bot = AsyncMock()
-        mock_bot.send_chat_action = AsyncMock()
+        # Stand-in bot for sending chat actions
+        mock_bot = SimpleNamespace(send_chat_action=AsyncStub([None]))
         
         # Test successful chat action
         await self.bot.safe_send_chat_action(mock_bot, 12345, "typing")
-        mock_bot.send_chat_action.assert_called_once_with(chat_id=12345, action="typing")
+        assert mock_bot.send_chat_action.calls == [((), {'chat_id': 12345, 'action': "typing"})]
         logger.info("✅ Safe send chat action test passed - successful action")
         
         # Test retry on failure
-        mock_bot.send_chat_action.reset_mock()
-        mock_bot.send_chat_action.side_effect = [
-            Exception("Network error"),  # First call fails
+        mock_bot.send_chat_action = AsyncStub([
+            NetworkError("Network error"),  # First call fails
             "Success"  # Second call succeeds
-        ]
+        ])
         
         await self.bot.safe_send_chat_action(mock_bot, 12345, "typing")
-        assert mock_bot.send_chat_action.call_count == 2
+        assert len(mock_bot.send_chat_action.calls) == 2
         logger.info("✅ Safe send chat action test passed - retry on failure")
     
+    async def test_typing_indicator_coalesced(self):
+        """Test that a burst of typing indicators for one chat makes a single API call"""
+        mock_bot = SimpleNamespace(send_chat_action=AsyncStub([None, None]))
+        for _ in range(100):
+            self.bot.start_typing(mock_bot, 67890)
+        
+        # The indicator is sent from a background task
+        await asyncio.sleep(0.01)
+        assert mock_bot.send_chat_action.calls == [((), {'chat_id': 67890, 'action': "typing"})]
+        logger.info("✅ Typing indicator test passed - 100 requests sent as one chat action")
+    
     async def test_error_handler_resilience(self):
         """Test that the error handler doesn't cause cascading failures"""
-        logger.info("Testing error handler resilience...")
-        
-        # Create mock update and context
-        mock_update = AsyncMock()
-        mock_context = AsyncMock()
-        mock_context.error = Exception("Test error")
+        # Stand-in update and context
+        mock_update = SimpleNamespace(effective_message=SimpleNamespace(chat_id=12345))
+        mock_context = SimpleNamespace(error=Exception("Test error"))
         
-        # Mock the safe_reply method to fail
-        with patch.object(self.bot, 'safe_reply', side_effect=Exception("Error handler failed")):
+        # Make the error reply itself fail
+        failing_reply = AsyncStub([Exception("Error handler failed")])
+        with patch.object(self.bot, 'safe_reply', failing_reply):
             # This should not raise an exception
             await self.bot.error_handler(mock_update, mock_context)
-            logger.info("✅ Error handler resilience test passed - no cascading failure")
+        
+        assert len(failing_reply.calls) == 1  # The reply was attempted once
+        logger.info("✅ Error handler resilience test passed - no cascading failure")
     
-    async def test_configuration_values(self):
+    def test_configuration_values(self):
         """Test that configuration values are properly set"""
-        logger.info("Testing configuration values...")
-        
         # Test timeout configurations
         assert Config.TELEGRAM_READ_TIMEOUT >= 30
         assert Config.TELEGRAM_WRITE_TIMEOUT >= 30
@@ -154,13 +217,13 @@ class TestTimeoutFixes:
         assert Config.RETRY_MAX_DELAY > Config.RETRY_BASE_DELAY
         
         logger.info("✅ Configuration values test passed")
-        logger.info(f"  - Read timeout: {Config.TELEGRAM_READ_TIMEOUT}s")
-        logger.info(f"  - Write timeout: {Config.TELEGRAM_WRITE_TIMEOUT}s")
-        logger.info(f"  - Connect timeout: {Config.TELEGRAM_CONNECT_TIMEOUT}s")
-        logger.info(f"  - Pool timeout: {Config.TELEGRAM_POOL_TIMEOUT}s")
-        logger.info(f"  - Max retry attempts: {Config.MAX_RETRY_ATTEMPTS}")
-        logger.info(f"  - Retry base delay: {Config.RETRY_BASE_DELAY}s")
-        logger.info(f"  - Retry max delay: {Config.RETRY_MAX_DELAY}s")
+        logger.info("  - Read timeout: %ss", Config.TELEGRAM_READ_TIMEOUT)
+        logger.info("  - Write timeout: %ss", Config.TELEGRAM_WRITE_TIMEOUT)
+        logger.info("  - Connect timeout: %ss", Config.TELEGRAM_CONNECT_TIMEOUT)
+        logger.info("  - Pool timeout: %ss", Config.TELEGRAM_POOL_TIMEOUT)
+        logger.info("  - Max retry attempts: %s", Config.MAX_RETRY_ATTEMPTS)
+        logger.info("  - Retry base delay: %ss", Config.RETRY_BASE_DELAY)
+        logger.info("  - Retry max delay: %ss", Config.RETRY_MAX_DELAY)
     
     async def run_all_tests(self):
         """Run all tests"""
@@ -168,18 +231,35 @@ class TestTimeoutFixes:
         
         try:
             await self.setup()
-            await self.test_retry_decorator()
-            await self.test_safe_reply_method()
-            await self.test_safe_send_chat_action()
-            await self.test_error_handler_resilience()
-            await self.test_configuration_values()
-            
-            logger.info("🎉 All tests passed successfully!")
-            return True
-            
         except Exception as e:
-            logger.error(f"❌ Test failed: {e}")
+            logger.error("❌ Test setup failed: %s", e)
             return False
+        
+        # Plain assertions on Config, so they run directly rather than as a task
+        failures = []
+        try:
+            self.test_configuration_values()
+        except Exception as e:
+            logger.error("❌ test_configuration_values failed: %s", e)
+            failures.append((self.test_configuration_values, e))
+        
+        # These tests mostly wait in retry backoff sleeps, so they run concurrently; every failure
+        # is reported, so one run shows all regressions
+        failures += await collect_failures(
+            self.test_retry_decorator(),
+            self.test_no_blocking_sleep_in_retry(),
+            self.test_safe_reply_method(),
+            self.test_safe_send_chat_action(),
+            self.test_typing_indicator_coalesced()
+        )
+        
+        # Patches the shared bot's safe_reply, so it must not overlap the safe_reply test
+        failures += await collect_failures(self.test_error_handler_resilience())
+        
+        if failures:
+            return False
+        logger.info("🎉 All tests passed successfully!")
+        return True
 
 async def main():
     """Main test function"""
@@ -200,4 +280,11 @@ async def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # libuv-backed event loop where available; the stock loop otherwise
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(main())
\ No newline at end of file